@@ -1,15 +1,429 @@
+import os
 import sqlite3
 import json
-from application.tools.path import get_persistent_db_path
+import re
+import threading
+from application.PriceCatalog import PriceCatalog
+from application.tools.path import get_package_resource_path, get_persistent_db_path
+
+
+# Litery, których tokenizer unicode61 nie sprowadza do liter bez znaków diakrytycznych
+# (remove_diacritics obsługuje tylko znaki łączone, a "ł" jest osobną literą)
+SEARCH_FOLDED_LETTERS = {"ł": "l", "Ł": "L"}
+
+# Kolumny tabel bram indeksowane w ProjektSzukaj (kolumna opcje). Lista jest zapisana tutaj
+# na stałe, aby migracje indeksu nie zmieniały się razem ze schematem.
+SEARCH_OPTION_COLUMNS = {
+    "BramaSegmentowa": [
+        "rodzaj_przetloczenia", "struktura_powierzchni", "sposob_otwierania_drzwi", "opcje_dodatkowe",
+        "kratka_wentylacyjna", "przeszklenia", "klamka_do_bramy",
+    ],
+    "BramaRoletowa": ["wysokosc_profili", "sposob_otwierania_bramy", "przeszklenia"],
+    "BramaRozwierana": [
+        "ilosc_skrzydel", "ocieplenie", "uklad_wypelnienia", "przeszklenia", "opcje_dodatkowe",
+        "kratka_wentylacyjna", "klamka_do_bramy",
+    ],
+    "BramaUchylna": [
+        "uklad_wypelnienia", "sposob_otwierania_drzwi", "przeszklenia", "opcje_dodatkowe",
+        "kratka_wentylacyjna", "klamka_do_bramy",
+    ],
+}
+
+
+def fold_search_text(text):
+    """
+    Zastępuje litery z SEARCH_FOLDED_LETTERS, tak jak w tekście indeksowanym w ProjektSzukaj.
+
+    :param text: Tekst zapytania.
+    :return: Tekst po zamianie liter.
+    """
+    for letter, replacement in SEARCH_FOLDED_LETTERS.items():
+        text = text.replace(letter, replacement)
+    return text
+
+
+def _fts5_available(conn):
+    """
+    Sprawdza, czy biblioteka SQLite obsługuje FTS5.
+
+    :param conn: Połączenie z bazą danych.
+    :return: True, jeśli można utworzyć tabelę FTS5.
+    """
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+    except sqlite3.OperationalError:
+        print("SQLite nie obsługuje FTS5 - wyszukiwanie projektów będzie korzystać z LIKE.")
+        return False
+    return True
+
+
+def _search_trigger_prefix(table):
+    """Zwraca przedrostek nazw wyzwalaczy indeksu dla tabeli (np. BramaUchylna -> brama_uchylna)."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", table).lower()
+
+
+def _search_index_script(fold=False):
+    """
+    Zwraca skrypt SQL tworzący tabelę ProjektSzukaj, wypełniający ją i tworzący wyzwalacze.
+
+    :param fold: Czy zamieniać litery z SEARCH_FOLDED_LETTERS w indeksowanym tekście.
+    :return: Skrypt SQL.
+    """
+    def text(expression):
+        if fold:
+            for letter, replacement in SEARCH_FOLDED_LETTERS.items():
+                expression = f"replace({expression}, '{letter}', '{replacement}')"
+        return expression
+
+    def search_values(row, columns):
+        colors = f"coalesce({row}.kolor_standardowy, '') || ' ' || coalesce({row}.kolor_ral, '')"
+        options = " || ' ' || ".join(f"coalesce({row}.{column}, '')" for column in columns)
+        return f"kolor = {text(colors)}, opcje = {text(options)}"
+
+    script = [
+        f"""
+        CREATE VIRTUAL TABLE ProjektSzukaj USING fts5(
+            nazwa, typ_bramy, kolor, opcje,
+            tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+        );
+        INSERT INTO ProjektSzukaj(rowid, nazwa, typ_bramy, kolor, opcje)
+            SELECT id, {text("nazwa")}, typ_bramy, '', '' FROM Projekt;
+        CREATE TRIGGER projekt_szukaj_ai AFTER INSERT ON Projekt BEGIN
+            INSERT INTO ProjektSzukaj(rowid, nazwa, typ_bramy, kolor, opcje)
+                VALUES (NEW.id, {text("NEW.nazwa")}, NEW.typ_bramy, '', '');
+        END;
+        CREATE TRIGGER projekt_szukaj_au AFTER UPDATE OF nazwa, typ_bramy ON Projekt BEGIN
+            UPDATE ProjektSzukaj SET nazwa = {text("NEW.nazwa")}, typ_bramy = NEW.typ_bramy WHERE rowid = NEW.id;
+        END;
+        CREATE TRIGGER projekt_szukaj_ad AFTER DELETE ON Projekt BEGIN
+            DELETE FROM ProjektSzukaj WHERE rowid = OLD.id;
+        END;
+        """
+    ]
+    for table, columns in SEARCH_OPTION_COLUMNS.items():
+        prefix = _search_trigger_prefix(table)
+        script.append(f"""
+        UPDATE ProjektSzukaj SET {search_values("g", columns)}
+            FROM {table} g WHERE g.projekt_id = ProjektSzukaj.rowid;
+        CREATE TRIGGER {prefix}_szukaj_ai AFTER INSERT ON {table} BEGIN
+            UPDATE ProjektSzukaj SET {search_values("NEW", columns)} WHERE rowid = NEW.projekt_id;
+        END;
+        CREATE TRIGGER {prefix}_szukaj_au AFTER UPDATE ON {table} BEGIN
+            UPDATE ProjektSzukaj SET kolor = '', opcje = '' WHERE rowid = OLD.projekt_id;
+            UPDATE ProjektSzukaj SET {search_values("NEW", columns)} WHERE rowid = NEW.projekt_id;
+        END;
+        CREATE TRIGGER {prefix}_szukaj_ad AFTER DELETE ON {table} BEGIN
+            UPDATE ProjektSzukaj SET kolor = '', opcje = '' WHERE rowid = OLD.projekt_id;
+        END;
+        """)
+    return "\n".join(script)
+
+
+def _search_index_migration(conn):
+    """
+    Migracja 3: indeks pełnotekstowy FTS5 (tabela ProjektSzukaj) z nazwą, typem, kolorami
+    i opcjami projektu, aktualizowany wyzwalaczami na tabelach Projekt i Brama*.
+
+    Jeśli biblioteka SQLite nie obsługuje FTS5, migracja podnosi tylko wersję schematu,
+    a wyszukiwanie korzysta z dopasowania LIKE po nazwie.
+
+    :param conn: Połączenie z bazą danych.
+    :return: Skrypt SQL migracji lub None.
+    """
+    if not _fts5_available(conn):
+        return None
+    return _search_index_script()
+
+
+def _search_fold_migration(conn):
+    """
+    Migracja 5: przebudowa indeksu ProjektSzukaj z zamianą "ł" na "l" w indeksowanym tekście,
+    aby zapytanie "bialy" znajdowało "Biały" (zapytanie jest zamieniane tak samo, fold_search_text).
+
+    :param conn: Połączenie z bazą danych.
+    :return: Skrypt SQL migracji lub None, jeśli SQLite nie obsługuje FTS5.
+    """
+    if not _fts5_available(conn):
+        return None
+    triggers = ["projekt_szukaj"] + [_search_trigger_prefix(table) + "_szukaj" for table in SEARCH_OPTION_COLUMNS]
+    drops = [f"DROP TRIGGER IF EXISTS {name}_{event};" for name in triggers for event in ("ai", "au", "ad")]
+    drops.append("DROP TABLE IF EXISTS ProjektSzukaj;")
+    return "\n".join(drops) + "\n" + _search_index_script(fold=True)
+
 
 class DatabaseManager:
 
     DB_PATH = get_persistent_db_path()
+    SCHEMA_PATH = get_package_resource_path(os.path.join("models", "db-model.sql"))
+    BUSY_TIMEOUT_MS = 5000  # Czas oczekiwania na zwolnienie blokady przez inny proces
+    CACHED_STATEMENTS = 256  # Liczba przygotowanych zapytań trzymanych w pamięci połączenia
+
+    _local = threading.local()  # Połączenia przypisane do bieżącego wątku
+
+    # Dopasowanie typu bramy z JSON do wartości w bazie danych
+    TYP_BRAMY_MAP = {
+        "Brama Segmentowa": "segmentowa",
+        "Brama Roletowa": "roletowa",
+        "Brama Rozwierana": "rozwierana",
+        "Brama Uchylna": "uchylna",
+    }
+
+    # Tabele przechowujące dane bramy dla każdego typu
+    GATE_TABLES = {
+        "segmentowa": "BramaSegmentowa",
+        "roletowa": "BramaRoletowa",
+        "rozwierana": "BramaRozwierana",
+        "uchylna": "BramaUchylna",
+    }
+
+    # Kolumny tabel bram w kolejności zapisu (bez id i projekt_id)
+    GATE_COLUMNS = {
+        "segmentowa": [
+            "rodzaj_przetloczenia", "struktura_powierzchni", "kolor_standardowy", "kolor_ral",
+            "sposob_otwierania_drzwi", "opcje_dodatkowe", "kratka_wentylacyjna", "przeszklenia",
+            "klamka_do_bramy", "szerokosc", "wysokosc",
+        ],
+        "roletowa": [
+            "wysokosc_profili", "kolor_standardowy", "kolor_ral", "sposob_otwierania_bramy", "przeszklenia",
+            "szerokosc", "wysokosc",
+        ],
+        "rozwierana": [
+            "ilosc_skrzydel", "ocieplenie", "uklad_wypelnienia", "kolor_standardowy", "kolor_ral", "przeszklenia",
+            "opcje_dodatkowe", "kratka_wentylacyjna", "klamka_do_bramy", "szerokosc", "wysokosc",
+        ],
+        "uchylna": [
+            "uklad_wypelnienia", "kolor_standardowy", "kolor_ral", "sposob_otwierania_drzwi", "przeszklenia",
+            "opcje_dodatkowe", "kratka_wentylacyjna", "klamka_do_bramy", "szerokosc", "wysokosc",
+        ],
+    }
+
+    # Kolumny wpływające na geometrię modelu bramy (te same opcje co klucz pamięci podręcznej modeli,
+    # model_cache.geometry_key); kolory, struktura powierzchni i sposób otwierania nie zmieniają modelu
+    GEOMETRY_COLUMNS = (
+        "rodzaj_przetloczenia", "wysokosc_profili", "ilosc_skrzydel", "uklad_wypelnienia", "przeszklenia",
+        "klamka_do_bramy", "kratka_wentylacyjna", "szerokosc", "wysokosc",
+    )
+    DOOR_OPTION = "Drzwi w bramie"  # Jedyna opcja dodatkowa zmieniająca geometrię modelu
+
+    # Mapowanie kolumn bazy danych na klucze JSON
+    JSON_KEY_MAP = {
+        "ilosc_skrzydel": "Ilość skrzydeł",
+        "ocieplenie": "Ocieplenie",
+        "uklad_wypelnienia": "Układ wypełnienia",
+        "kolor_standardowy": "Kolor standardowy",
+        "kolor_ral": "Kolor RAL",
+        "wysokosc_profili": "Wysokość profili",
+        "sposob_otwierania_drzwi": "Sposób otwierania drzwi",
+        "sposob_otwierania_bramy": "Sposób otwierania bramy",
+        "przeszklenia": "Przeszklenia",
+        "drzwi_przejsciowe": "Drzwi przejściowe",
+        "opcje_dodatkowe": "Opcje dodatkowe",
+        "rodzaj_przetloczenia": "Rodzaj przetłoczenia",
+        "struktura_powierzchni": "Struktura powierzchni",
+        "kratka_wentylacyjna": "Kratka wentylacyjna",
+        "klamka_do_bramy": "Klamka do bramy",
+    }
+
+    IMPORT_BATCH_SIZE = 1000  # Liczba projektów zapisywanych w jednej transakcji podczas importu
+    EXPORT_FETCH_SIZE = 1000  # Liczba wierszy pobieranych naraz podczas eksportu
+    SQL_VARIABLE_LIMIT = 500  # Maksymalna liczba parametrów w jednym zapytaniu IN (...)
+
+    # Kolejne migracje schematu; migracja o indeksie i podnosi PRAGMA user_version do i + 1.
+    # Migracja może być skryptem SQL albo funkcją, która na podstawie połączenia zwraca skrypt.
+    # Unikalność Projekt.nazwa zapewnia już ograniczenie UNIQUE z models/db-model.sql.
+    MIGRATIONS = [
+        # 1: indeksy na kolumnach używanych w wyszukiwaniu
+        """
+        CREATE INDEX IF NOT EXISTS idx_brama_segmentowa_projekt ON BramaSegmentowa(projekt_id);
+        CREATE INDEX IF NOT EXISTS idx_brama_roletowa_projekt ON BramaRoletowa(projekt_id);
+        CREATE INDEX IF NOT EXISTS idx_brama_rozwierana_projekt ON BramaRozwierana(projekt_id);
+        CREATE INDEX IF NOT EXISTS idx_brama_uchylna_projekt ON BramaUchylna(projekt_id);
+        CREATE INDEX IF NOT EXISTS idx_cennik_lookup ON Cennik(typ_bramy, parametr, opcja);
+        """,
+        # 2: indeksy dla stronicowania listy projektów (sortowanie po dacie i typie)
+        """
+        CREATE INDEX IF NOT EXISTS idx_projekt_data_zapisu ON Projekt(data_zapisu, id);
+        CREATE INDEX IF NOT EXISTS idx_projekt_typ_bramy ON Projekt(typ_bramy, id);
+        """,
+        # 3: wyszukiwanie pełnotekstowe po nazwie, kolorach i opcjach projektów
+        _search_index_migration,
+        # 4: opcje dodatkowe projektów jako osobne wiersze (podział istniejących list "a, b, c")
+        """
+        CREATE TABLE ProjektOpcja (
+            projekt_id INTEGER NOT NULL,
+            opcja TEXT NOT NULL,
+            PRIMARY KEY (projekt_id, opcja),
+            FOREIGN KEY (projekt_id) REFERENCES Projekt(id) ON DELETE CASCADE
+        ) WITHOUT ROWID;
+        CREATE INDEX idx_projekt_opcja_opcja ON ProjektOpcja(opcja, projekt_id);
+        INSERT OR IGNORE INTO ProjektOpcja (projekt_id, opcja)
+            WITH RECURSIVE podzial(projekt_id, opcja, reszta) AS (
+                SELECT projekt_id, NULL, opcje_dodatkowe || ',' FROM BramaSegmentowa
+                    WHERE projekt_id IS NOT NULL AND opcje_dodatkowe IS NOT NULL
+                UNION ALL
+                SELECT projekt_id, NULL, opcje_dodatkowe || ',' FROM BramaRozwierana
+                    WHERE projekt_id IS NOT NULL AND opcje_dodatkowe IS NOT NULL
+                UNION ALL
+                SELECT projekt_id, NULL, opcje_dodatkowe || ',' FROM BramaUchylna
+                    WHERE projekt_id IS NOT NULL AND opcje_dodatkowe IS NOT NULL
+                UNION ALL
+                SELECT projekt_id, trim(substr(reszta, 1, instr(reszta, ',') - 1)), substr(reszta, instr(reszta, ',') + 1)
+                    FROM podzial WHERE reszta <> ''
+            )
+            SELECT projekt_id, opcja FROM podzial WHERE opcja <> '';
+        """,
+        # 5: wyszukiwanie bez rozróżniania "ł" i "l"
+        _search_fold_migration,
+        # 6: pozycje cennika dla wszystkich opcji z resources/options_data.txt (nazwa opcji zgodna
+        # z interfejsem, zerowe dopłaty dla opcji bez pozycji), sprawdzane przez pricing.missing_prices
+        """
+        UPDATE Cennik SET opcja = 'Automatycznie (kluczyk)'
+            WHERE typ_bramy = 'Brama Roletowa' AND parametr = 'Sposób otwierania bramy'
+                AND opcja = 'Automatyczne (kluczyk)';
+        INSERT INTO Cennik (typ_bramy, parametr, opcja, doplata)
+            SELECT v.column1, v.column2, v.column3, 0
+            FROM (VALUES
+                ('Brama Rozwierana', 'Ilość skrzydeł', 'Jednoskrzydłowe prawe'),
+                ('Brama Rozwierana', 'Ilość skrzydeł', 'Jednoskrzydłowe lewe'),
+                ('Brama Rozwierana', 'Ocieplenie', 'Brama nieocieplana')
+            ) v
+            WHERE NOT EXISTS (
+                SELECT 1 FROM Cennik c
+                WHERE c.typ_bramy = v.column1 AND c.parametr = v.column2 AND c.opcja = v.column3
+            );
+        """,
+    ]
+
+    # Wagi kolumn ProjektSzukaj (nazwa, typ_bramy, kolor, opcje) w rankingu bm25
+    SEARCH_WEIGHTS = (10.0, 1.0, 4.0, 2.0)
+
+    # Kolumny, po których można sortować stronicowaną listę projektów
+    PAGE_SORT_COLUMNS = {"id": 0, "nazwa": 1, "data_zapisu": 2, "typ_bramy": 3}
 
     def connect(self):
-        """Nawiązuje połączenie z bazą danych."""
-        return sqlite3.connect(self.DB_PATH)
+        """
+        Zwraca długo żyjące połączenie z bazą danych dla bieżącego wątku.
+
+        Połączenie jest tworzone przy pierwszym wywołaniu w danym wątku i ponownie
+        używane przy kolejnych, dzięki czemu przygotowane zapytania pozostają w pamięci
+        podręcznej, a ustawienia PRAGMA są stosowane tylko raz.
+
+        :return: Obiekt sqlite3.Connection.
+        """
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get(self.DB_PATH)
+        if conn is None:
+            conn = sqlite3.connect(self.DB_PATH, cached_statements=self.CACHED_STATEMENTS)
+            self._configure_connection(conn)
+            connections[self.DB_PATH] = conn
+        return conn
+
+    def _configure_connection(self, conn):
+        """
+        Ustawia parametry połączenia: tryb WAL, synchronizację, czas oczekiwania
+        na blokadę oraz sprawdzanie kluczy obcych.
+
+        :param conn: Nowo utworzone połączenie.
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.BUSY_TIMEOUT_MS)}")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+    def close(self):
+        """Zamyka połączenie z bazą danych należące do bieżącego wątku."""
+        connections = getattr(self._local, "connections", None)
+        if connections:
+            conn = connections.pop(self.DB_PATH, None)
+            if conn is not None:
+                conn.close()
+
+
+    def initialize_database(self, schema_path=None):
+        """
+        Tworzy schemat bazy danych z pliku models/db-model.sql, jeśli baza go jeszcze nie zawiera,
+        a następnie wykonuje brakujące migracje (również dla istniejących baz użytkownika).
+
+        O utworzeniu schematu decyduje obecność tabeli Projekt, a nie samego pliku, więc pusty
+        lub niedokończony plik bazy danych (np. po przerwanym pierwszym uruchomieniu) jest naprawiany.
+
+        :param schema_path: Ścieżka do pliku schematu (domyślnie SCHEMA_PATH).
+        """
+        try:
+            has_schema = self.has_schema()
+        except sqlite3.Error as e:
+            print(f"Błąd podczas otwierania bazy danych: {e}")
+            return
+
+        if not has_schema:
+            print("Baza danych nie istnieje. Tworzenie bazy...")
+            conn = self.connect()
+            try:
+                path = schema_path or self.SCHEMA_PATH
+                with open(path, 'r', encoding='utf-8') as file:
+                    sql_commands = file.read()
+                conn.executescript(f"BEGIN;\n{sql_commands}\nCOMMIT;")
+                print("Baza danych została utworzona pomyślnie.")
+            except (sqlite3.Error, IOError) as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                print(f"Błąd podczas tworzenia bazy danych: {e}")
+                return
+        else:
+            print("Baza danych już istnieje.")
+
+        self.migrate()
+
+    def has_schema(self):
+        """
+        Sprawdza, czy baza danych zawiera schemat aplikacji (tabelę Projekt).
+
+        :return: True, jeśli schemat został utworzony.
+        """
+        row = self.connect().execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Projekt'"
+        ).fetchone()
+        return row is not None
 
+    def schema_version(self):
+        """
+        Zwraca wersję schematu bazy danych zapisaną w PRAGMA user_version.
+
+        :return: Numer wersji schematu.
+        """
+        return self.connect().execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self):
+        """
+        Aktualizuje schemat bazy danych do najnowszej wersji.
+
+        Każda brakująca migracja z listy MIGRATIONS jest wykonywana w osobnej transakcji
+        razem z podniesieniem PRAGMA user_version, więc przerwana aktualizacja nie zostawia
+        bazy w stanie pośrednim.
+
+        :return: Wersja schematu po aktualizacji.
+        """
+        conn = self.connect()
+        current = self.schema_version()
+
+        for version, script in enumerate(self.MIGRATIONS[current:], start=current + 1):
+            try:
+                if callable(script):
+                    script = script(conn) or ""
+                conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;")
+                print(f"Zaktualizowano schemat bazy danych do wersji {version}.")
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                print(f"Błąd podczas migracji bazy danych do wersji {version}: {e}")
+                break
+            current = version
+
+        return current
 
     def list_projects(self):
         """Wyświetla wszystkie rekordy z tabeli Projekt."""
@@ -18,94 +432,388 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM Projekt")
             projects = cursor.fetchall()
-            conn.close()
             return projects
         except sqlite3.Error as e:
             print(f"Błąd podczas listowania danych: {e}")
             return []
 
-    def add_project_from_json(self, project_json):
+    def list_projects_page(self, after=None, limit=100, sort="id", filter=None):
         """
-        Dodaje projekt i powiązaną bramę na podstawie danych z JSON.
-        Jeśli projekt o tej samej nazwie już istnieje, usuwa go przed dodaniem nowego.
+        Zwraca jedną stronę listy projektów, stronicowaną metodą keyset.
 
-        :param project_json: Słownik reprezentujący dane projektu i bramy.
-        :return: None
+        Zamiast OFFSET zapytanie zaczyna od klucza ostatniego wiersza poprzedniej strony,
+        więc koszt pobrania strony nie rośnie wraz z jej numerem.
+
+        :param after: Klucz ostatniego wiersza poprzedniej strony (wynik page_key) lub None dla pierwszej strony.
+        :param limit: Maksymalna liczba zwracanych wierszy.
+        :param sort: Kolumna sortowania z PAGE_SORT_COLUMNS; prefiks "-" oznacza kolejność malejącą.
+        :param filter: Fragment nazwy projektu (bez rozróżniania wielkości liter) lub None.
+        :return: Lista krotek (id, nazwa, data_zapisu, typ_bramy).
         """
+        descending = sort.startswith("-")
+        column = sort.lstrip("-")
+        if column not in self.PAGE_SORT_COLUMNS:
+            raise ValueError(f"Nieobsługiwana kolumna sortowania: {sort}")
+
+        conditions = []
+        params = []
+        if filter:
+            escaped = filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("nazwa LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
+
+        operator = "<" if descending else ">"
+        if after is not None:
+            if column == "id":
+                conditions.append(f"id {operator} ?")
+                params.append(after[-1])
+            else:
+                conditions.append(f"({column}, id) {operator} (?, ?)")
+                params.extend(after)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "DESC" if descending else "ASC"
+        order_by = f"id {order}" if column == "id" else f"{column} {order}, id {order}"
+        query = f"SELECT id, nazwa, data_zapisu, typ_bramy FROM Projekt {where} ORDER BY {order_by} LIMIT ?"
+        params.append(limit)
+
         try:
-            # Pobranie nazwy projektu
-            project_name = project_json.get("Nazwa projektu")
-            if not project_name:
-                raise ValueError("JSON musi zawierać klucz 'Nazwa projektu'.")
-
-            # Sprawdzenie, czy projekt o tej nazwie już istnieje
-            if self.check_project_existence(project_name):
-                conn = self.connect()
-                cursor = conn.cursor()
-
-                # Pobranie ID projektu
-                cursor.execute("SELECT id FROM Projekt WHERE nazwa = ?", (project_name,))
-                projekt_id = cursor.fetchone()[0]  # Pobranie ID projektu
-
-                # Usuwanie powiązanych rekordów z tabel bram
-                cursor.execute("DELETE FROM BramaSegmentowa WHERE projekt_id = ?", (projekt_id,))
-                cursor.execute("DELETE FROM BramaRoletowa WHERE projekt_id = ?", (projekt_id,))
-                cursor.execute("DELETE FROM BramaRozwierana WHERE projekt_id = ?", (projekt_id,))
-                cursor.execute("DELETE FROM BramaUchylna WHERE projekt_id = ?", (projekt_id,))
-
-                # Usuwanie rekordu z tabeli Projekt
-                cursor.execute("DELETE FROM Projekt WHERE id = ?", (projekt_id,))
-
-                conn.commit()
-                print(f"Usunięto istniejący projekt o nazwie '{project_name}' oraz powiązane rekordy.")
-                conn.close()
+            return self.connect().execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Błąd podczas listowania danych: {e}")
+            return []
 
-            # Pobranie typu bramy
-            gate_type = project_json.get("Typ bramy")
-            if not gate_type:
-                raise ValueError("JSON musi zawierać klucz 'Typ bramy' określający typ bramy.")
-
-            # Dopasowanie typu bramy do bazy danych
-            typ_bramy_map = {
-                "Brama Segmentowa": "segmentowa",
-                "Brama Roletowa": "roletowa",
-                "Brama Rozwierana": "rozwierana",
-                "Brama Uchylna": "uchylna",
-            }
+    def search_projects(self, query, limit=50):
+        """
+        Wyszukuje projekty po fragmentach nazwy, typu, kolorów i opcji.
 
-            if gate_type not in typ_bramy_map:
-                raise ValueError(f"Nieznany typ bramy: {gate_type}")
+        Każde słowo zapytania jest traktowane jako prefiks, a projekt musi pasować do wszystkich
+        słów. Wyniki są uporządkowane według trafności (bm25), przy czym dopasowanie w nazwie
+        waży najwięcej. Bez indeksu FTS5 wyszukiwanie ogranicza się do fragmentu nazwy.
 
-            typ_bramy = typ_bramy_map[gate_type]
+        :param query: Tekst wpisany przez użytkownika (np. "mahon kasetony").
+        :param limit: Maksymalna liczba zwracanych wierszy.
+        :return: Lista krotek (id, nazwa, data_zapisu, typ_bramy).
+        """
+        words = re.findall(r"\w+", fold_search_text(query or ""))
+        if not words:
+            return []
 
-            # Pobranie wymiarów
-            dimensions = project_json.get("Wymiary", {})
-            width = dimensions.get("Szerokość")
-            height = dimensions.get("Wysokość")
+        match = " ".join(f'"{word}"*' for word in words)
+        weights = ", ".join(str(weight) for weight in self.SEARCH_WEIGHTS)
+        try:
+            return self.connect().execute(f"""
+                SELECT p.id, p.nazwa, p.data_zapisu, p.typ_bramy
+                FROM ProjektSzukaj s JOIN Projekt p ON p.id = s.rowid
+                WHERE ProjektSzukaj MATCH ?
+                ORDER BY bm25(ProjektSzukaj, {weights})
+                LIMIT ?
+            """, (match, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            if "ProjektSzukaj" not in str(e):
+                print(f"Błąd podczas wyszukiwania projektów: {e}")
+                return []
+            return self.list_projects_page(limit=limit, filter=query.strip())
+        except sqlite3.Error as e:
+            print(f"Błąd podczas wyszukiwania projektów: {e}")
+            return []
 
-            conn = self.connect()
-            cursor = conn.cursor()
+    def page_key(self, row, sort="id"):
+        """
+        Zwraca klucz wiersza do przekazania jako parametr after w list_projects_page.
 
-            # Dodanie projektu do tabeli Projekt
-            cursor.execute(
-                "INSERT INTO Projekt (nazwa, data_zapisu, typ_bramy) VALUES (?, CURRENT_TIMESTAMP, ?)",
-                (project_name, typ_bramy)
-            )
-            projekt_id = cursor.lastrowid  # Pobierz ID dodanego projektu
+        :param row: Wiersz zwrócony przez list_projects_page.
+        :param sort: Ta sama wartość sort, która została użyta do pobrania wiersza.
+        :return: Krotka (wartość kolumny sortowania, id).
+        """
+        return row[self.PAGE_SORT_COLUMNS[sort.lstrip("-")]], row[0]
 
-            # Dodanie danych bramy do odpowiedniej tabeli
-            gate_data = self._map_gate_data(typ_bramy, project_json)
-            self._add_gate(cursor, projekt_id, typ_bramy, gate_data, width, height)
+    def add_project_from_json(self, project_json):
+        """
+        Dodaje projekt i powiązaną bramę na podstawie danych z JSON.
+        Jeśli projekt o tej samej nazwie już istnieje, zostaje nadpisany.
 
-            conn.commit()
-            print(f"Projekt '{project_name}' został dodany do bazy danych.")
+        Cały zapis odbywa się w jednej transakcji, więc w razie błędu baza pozostaje
+        w stanie sprzed wywołania.
 
+        :param project_json: Słownik reprezentujący dane projektu i bramy.
+        :return: True, jeśli projekt został zapisany, False w przypadku błędu.
+        """
+        conn = self.connect()
+        try:
+            with conn:
+                self._save_project(conn.cursor(), project_json)
+            print(f"Projekt '{project_json.get('Nazwa projektu')}' został dodany do bazy danych.")
+            return True
         except sqlite3.Error as e:
             print(f"Błąd SQL podczas dodawania projektu: {e}")
         except Exception as e:
             print(f"Błąd: {e}")
-        finally:
-            conn.close()
+        return False
+
+    def add_projects_from_json(self, projects_json):
+        """
+        Zapisuje wiele projektów w jednej transakcji (jeden commit dla całej partii).
+
+        Projekty z niepoprawnymi danymi są pomijane; błąd SQL wycofuje całą partię.
+
+        :param projects_json: Iterowalna kolekcja słowników w formacie add_project_from_json.
+        :return: Liczba zapisanych projektów.
+        """
+        prepared = []
+        for project_json in projects_json:
+            try:
+                prepared.append(self._prepare_project(project_json))
+            except ValueError as e:
+                print(f"Pominięto projekt: {e}")
+
+        conn = self.connect()
+        try:
+            with conn:
+                saved = len(self._write_projects(conn.cursor(), prepared))
+            print(f"Zapisano {saved} projektów do bazy danych.")
+            return saved
+        except sqlite3.Error as e:
+            print(f"Błąd SQL podczas zapisywania projektów: {e}")
+            return 0
+
+    def export_projects(self, stream, names=None):
+        """
+        Zapisuje projekty do strumienia tekstowego w formacie JSONL
+        (jeden projekt w formacie add_project_from_json na wiersz).
+
+        Wiersze są pobierane porcjami po EXPORT_FETCH_SIZE, więc zużycie pamięci nie zależy
+        od liczby projektów w bazie.
+
+        :param stream: Strumień tekstowy otwarty do zapisu.
+        :param names: Lista nazw projektów do eksportu lub None, aby wyeksportować wszystkie.
+        :return: Liczba wyeksportowanych projektów.
+        """
+        if names is not None:
+            return self._export_named_projects(stream, names)
+
+        exported = 0
+        conn = self.connect()
+        for typ_bramy, table in self.GATE_TABLES.items():
+            columns = self.GATE_COLUMNS[typ_bramy]
+            cursor = conn.execute(f"""
+                SELECT p.nazwa, p.data_zapisu, {", ".join("b." + column for column in columns)}
+                FROM Projekt p LEFT JOIN {table} b ON b.projekt_id = p.id
+                WHERE p.typ_bramy = ?
+                ORDER BY p.id
+            """, (typ_bramy,))
+
+            while True:
+                rows = cursor.fetchmany(self.EXPORT_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    project_json = self._project_to_json(row[0], typ_bramy, dict(zip(columns, row[2:])))
+                    project_json["Data zapisu"] = row[1]
+                    stream.write(json.dumps(project_json, ensure_ascii=False) + "\n")
+                exported += len(rows)
+
+        return exported
+
+    def _export_named_projects(self, stream, names):
+        """
+        Zapisuje do strumienia JSONL wybrane projekty, w kolejności podanych nazw.
+
+        :param stream: Strumień tekstowy otwarty do zapisu.
+        :param names: Lista nazw projektów.
+        :return: Liczba wyeksportowanych projektów.
+        """
+        exported = 0
+        for start in range(0, len(names), self.EXPORT_FETCH_SIZE):
+            chunk = names[start:start + self.EXPORT_FETCH_SIZE]
+            projects = self.get_projects_by_names(chunk)
+            for name in chunk:
+                project_data = projects.pop(name, None)
+                if project_data is None:
+                    continue
+                project = project_data["projekt"]
+                project_json = self._project_to_json(project["nazwa"], project["typ_bramy"], project_data["brama"])
+                project_json["Data zapisu"] = project["data_zapisu"]
+                stream.write(json.dumps(project_json, ensure_ascii=False) + "\n")
+                exported += 1
+        return exported
+
+    def import_projects(self, stream, batch_size=None):
+        """
+        Wczytuje projekty ze strumienia JSONL i zapisuje je partiami, każda partia w jednej transakcji.
+
+        W pamięci przechowywana jest co najwyżej jedna partia. Niepoprawne wiersze są pomijane,
+        a błąd SQL przerywa import (wcześniej zapisane partie pozostają w bazie).
+
+        :param stream: Strumień tekstowy z jednym projektem JSON na wiersz.
+        :param batch_size: Liczba projektów w jednej transakcji (domyślnie IMPORT_BATCH_SIZE).
+        :return: Liczba zaimportowanych projektów.
+        """
+        batch_size = batch_size or self.IMPORT_BATCH_SIZE
+        conn = self.connect()
+        imported = 0
+        batch = []
+
+        try:
+            for line_number, line in enumerate(stream, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    batch.append(self._prepare_project(json.loads(line)))
+                except ValueError as e:
+                    print(f"Pominięto wiersz {line_number}: {e}")
+                    continue
+
+                if len(batch) >= batch_size:
+                    with conn:
+                        imported += len(self._write_projects(conn.cursor(), batch))
+                    batch = []
+
+            if batch:
+                with conn:
+                    imported += len(self._write_projects(conn.cursor(), batch))
+        except sqlite3.Error as e:
+            print(f"Błąd SQL podczas importu projektów: {e}")
+
+        return imported
+
+    def _save_project(self, cursor, project_json):
+        """
+        Zapisuje projekt w ramach bieżącej transakcji.
+
+        :param cursor: Kursor połączenia z otwartą transakcją.
+        :param project_json: Słownik reprezentujący dane projektu i bramy.
+        :return: ID zapisanego projektu.
+        """
+        prepared = self._prepare_project(project_json)
+        return self._write_projects(cursor, [prepared])[prepared[0]]
+
+    def _prepare_project(self, project_json):
+        """
+        Sprawdza dane projektu z JSON i przygotowuje wartości do zapisu w bazie.
+
+        :param project_json: Słownik reprezentujący dane projektu i bramy.
+        :return: Krotka (nazwa, data_zapisu, typ_bramy, wartości kolumn bramy w kolejności GATE_COLUMNS).
+        :raises ValueError: Jeśli brakuje nazwy projektu lub typ bramy jest nieznany.
+        """
+        if not isinstance(project_json, dict):
+            raise ValueError("Projekt musi być obiektem JSON.")
+
+        # Pobranie nazwy projektu
+        project_name = project_json.get("Nazwa projektu")
+        if not project_name:
+            raise ValueError("JSON musi zawierać klucz 'Nazwa projektu'.")
+
+        # Pobranie typu bramy
+        gate_type = project_json.get("Typ bramy")
+        if not gate_type:
+            raise ValueError("JSON musi zawierać klucz 'Typ bramy' określający typ bramy.")
+
+        if gate_type not in self.TYP_BRAMY_MAP:
+            raise ValueError(f"Nieznany typ bramy: {gate_type}")
+
+        typ_bramy = self.TYP_BRAMY_MAP[gate_type]
+
+        # Pobranie wymiarów
+        dimensions = project_json.get("Wymiary") or {}
+        gate_data = self._map_gate_data(typ_bramy, project_json)
+        gate_data["szerokosc"] = dimensions.get("Szerokość")
+        gate_data["wysokosc"] = dimensions.get("Wysokość")
+
+        values = tuple(gate_data.get(column) for column in self.GATE_COLUMNS[typ_bramy])
+        return project_name, project_json.get("Data zapisu"), typ_bramy, values
+
+    def _write_projects(self, cursor, prepared):
+        """
+        Zapisuje przygotowane projekty w ramach bieżącej transakcji, używając executemany.
+
+        Rekordy w tabeli Projekt są wstawiane lub aktualizowane (INSERT ... ON CONFLICT),
+        dzięki czemu nadpisany projekt zachowuje swoje ID. Poprzednie rekordy bram są usuwane
+        tylko z tabel odpowiadających dotychczasowym typom projektów.
+
+        :param cursor: Kursor połączenia z otwartą transakcją.
+        :param prepared: Lista krotek zwróconych przez _prepare_project.
+        :return: Słownik {nazwa projektu: ID}.
+        """
+        # Przy powtórzonej nazwie obowiązuje ostatnie wystąpienie
+        prepared = list({project[0]: project for project in prepared}.values())
+        if not prepared:
+            return {}
+
+        names = [project[0] for project in prepared]
+        existing = self._find_projects(cursor, names)
+
+        cursor.executemany("""
+            INSERT INTO Projekt (nazwa, data_zapisu, typ_bramy) VALUES (?, COALESCE(?, CURRENT_TIMESTAMP), ?)
+            ON CONFLICT(nazwa) DO UPDATE SET data_zapisu = excluded.data_zapisu, typ_bramy = excluded.typ_bramy
+        """, [(name, saved_at, typ_bramy) for name, saved_at, typ_bramy, _ in prepared])
+
+        # Usunięcie poprzednich danych bram nadpisywanych projektów
+        stale_rows = {}
+        for projekt_id, old_typ_bramy in existing.values():
+            stale_rows.setdefault(old_typ_bramy, []).append((projekt_id,))
+        for old_typ_bramy, rows in stale_rows.items():
+            old_table = self.GATE_TABLES.get(old_typ_bramy)
+            if old_table:
+                cursor.executemany(f"DELETE FROM {old_table} WHERE projekt_id = ?", rows)
+
+        ids = {name: projekt_id for name, (projekt_id, _) in self._find_projects(cursor, names).items()}
+
+        # Dodanie danych bram do odpowiednich tabel
+        gate_rows = {}
+        for name, _, typ_bramy, values in prepared:
+            gate_rows.setdefault(typ_bramy, []).append((ids[name], *values))
+        for typ_bramy, rows in gate_rows.items():
+            columns = self.GATE_COLUMNS[typ_bramy]
+            cursor.executemany(f"""
+                INSERT INTO {self.GATE_TABLES[typ_bramy]} (projekt_id, {", ".join(columns)})
+                VALUES ({", ".join("?" * (len(columns) + 1))})
+            """, rows)
+
+        # Opcje dodatkowe zapisywane również jako osobne wiersze tabeli ProjektOpcja
+        cursor.executemany("DELETE FROM ProjektOpcja WHERE projekt_id = ?",
+                           [(projekt_id,) for projekt_id, _ in existing.values()])
+        cursor.executemany("INSERT OR IGNORE INTO ProjektOpcja (projekt_id, opcja) VALUES (?, ?)", [
+            (ids[name], option)
+            for name, _, typ_bramy, values in prepared
+            for option in self._additional_options(typ_bramy, values)
+        ])
+
+        return ids
+
+    def _additional_options(self, typ_bramy, values):
+        """
+        Zwraca listę opcji dodatkowych z wartości kolumn bramy przygotowanych przez _prepare_project.
+
+        :param typ_bramy: Typ bramy zapisany w bazie (np. "uchylna").
+        :param values: Wartości kolumn bramy w kolejności GATE_COLUMNS.
+        :return: Lista nazw opcji (może być pusta).
+        """
+        columns = self.GATE_COLUMNS[typ_bramy]
+        if "opcje_dodatkowe" not in columns:
+            return []
+        joined = values[columns.index("opcje_dodatkowe")]
+        return [option.strip() for option in (joined or "").split(",") if option.strip()]
+
+    def _find_projects(self, cursor, names):
+        """
+        Wyszukuje projekty o podanych nazwach.
+
+        :param cursor: Kursor połączenia z bazą.
+        :param names: Lista nazw projektów.
+        :return: Słownik {nazwa projektu: (ID, typ_bramy)} dla istniejących projektów.
+        """
+        found = {}
+        for start in range(0, len(names), self.SQL_VARIABLE_LIMIT):
+            chunk = names[start:start + self.SQL_VARIABLE_LIMIT]
+            cursor.execute(
+                f"SELECT id, nazwa, typ_bramy FROM Projekt WHERE nazwa IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for projekt_id, name, typ_bramy in cursor.fetchall():
+                found[name] = (projekt_id, typ_bramy)
+        return found
 
     def _map_gate_data(self, typ_bramy, gate_data):
         """
@@ -170,87 +878,6 @@ class DatabaseManager:
             print(f"Błąd podczas mapowania danych dla typu '{typ_bramy}': {e}")
             return {}
 
-    def _add_gate(self, cursor, projekt_id, typ_bramy, gate_data, width, height):
-        """
-        Dodaje dane bramy do odpowiedniej tabeli.
-        """
-        if typ_bramy == "segmentowa":
-            cursor.execute("""
-                        INSERT INTO BramaSegmentowa 
-                        (projekt_id, rodzaj_przetloczenia, struktura_powierzchni, kolor_standardowy, kolor_ral, 
-                         sposob_otwierania_drzwi, opcje_dodatkowe, kratka_wentylacyjna, przeszklenia, klamka_do_bramy, szerokosc, wysokosc)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                projekt_id,
-                gate_data.get("rodzaj_przetloczenia"),
-                gate_data.get("struktura_powierzchni"),
-                gate_data.get("kolor_standardowy"),
-                gate_data.get("kolor_ral"),
-                gate_data.get("sposob_otwierania_drzwi"),
-                gate_data.get("opcje_dodatkowe"),
-                gate_data.get("kratka_wentylacyjna"),
-                gate_data.get("przeszklenia"),
-                gate_data.get("klamka_do_bramy"),
-                width,
-                height
-            ))
-
-        elif typ_bramy == "roletowa":
-            cursor.execute("""
-                INSERT INTO BramaRoletowa 
-                (projekt_id, wysokosc_profili, kolor_standardowy, kolor_ral, sposob_otwierania_bramy, przeszklenia, szerokosc, wysokosc)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                projekt_id,
-                gate_data.get("wysokosc_profili"),
-                gate_data.get("kolor_standardowy"),
-                gate_data.get("kolor_ral"),
-                gate_data.get("sposob_otwierania_bramy"),
-                gate_data.get("przeszklenia"),
-                width,
-                height
-            ))
-
-        elif typ_bramy == "rozwierana":
-            cursor.execute("""
-                INSERT INTO BramaRozwierana 
-                (projekt_id, ilosc_skrzydel, ocieplenie, uklad_wypelnienia, kolor_standardowy, kolor_ral, przeszklenia, opcje_dodatkowe, kratka_wentylacyjna, klamka_do_bramy, szerokosc, wysokosc)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                projekt_id,
-                gate_data.get("ilosc_skrzydel"),
-                gate_data.get("ocieplenie"),
-                gate_data.get("uklad_wypelnienia"),
-                gate_data.get("kolor_standardowy"),
-                gate_data.get("kolor_ral"),
-                gate_data.get("przeszklenia"),
-                gate_data.get("opcje_dodatkowe"),
-                gate_data.get("kratka_wentylacyjna"),
-                gate_data.get("klamka_do_bramy"),
-                width,
-                height
-            ))
-
-
-        elif typ_bramy == "uchylna":
-            cursor.execute("""
-                INSERT INTO BramaUchylna 
-                (projekt_id, uklad_wypelnienia, kolor_standardowy, kolor_ral, sposob_otwierania_drzwi, przeszklenia, opcje_dodatkowe, kratka_wentylacyjna, klamka_do_bramy, szerokosc, wysokosc)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                projekt_id,
-                gate_data.get("uklad_wypelnienia"),
-                gate_data.get("kolor_standardowy"),
-                gate_data.get("kolor_ral"),
-                gate_data.get("sposob_otwierania_drzwi"),
-                gate_data.get("przeszklenia"),
-                gate_data.get("opcje_dodatkowe"),
-                gate_data.get("kratka_wentylacyjna"),
-                gate_data.get("klamka_do_bramy"),
-                width,
-                height
-            ))
-
     def get_project_by_name(self, project_name):
         """
         Pobiera szczegóły projektu oraz powiązaną bramę na podstawie nazwy projektu.
@@ -258,100 +885,73 @@ class DatabaseManager:
         :param project_name: Nazwa projektu.
         :return: Słownik zawierający dane projektu oraz powiązanej bramy.
         """
-        conn = self.connect()
-        cursor = conn.cursor()
+        cursor = self.connect().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(self._project_query("p.nazwa = ?"), (project_name,))
+        row = cursor.fetchone()
 
-        # Pobierz szczegóły projektu na podstawie nazwy
-        cursor.execute("SELECT * FROM Projekt WHERE nazwa = ?", (project_name,))
-        project = cursor.fetchone()
-
-        if not project:
-            conn.close()
+        if not row:
             raise ValueError(f"Projekt o nazwie '{project_name}' nie istnieje.")
+        return self._project_from_row(row)
 
-        # Słownik na dane wyjściowe
-        project_data = {
-            "projekt": {
-                "id": project[0],
-                "nazwa": project[1],
-                "data_zapisu": project[2],
-                "typ_bramy": project[3]
-            },
-            "brama": None
-        }
+    def get_projects_by_names(self, names):
+        """
+        Pobiera wiele projektów wraz z bramami, jednym zapytaniem na każde SQL_VARIABLE_LIMIT nazw.
 
-        # Pobierz dane o bramie na podstawie typu bramy
-        typ_bramy = project[3]
-
-        if typ_bramy == "segmentowa":
-            cursor.execute("SELECT * FROM BramaSegmentowa WHERE projekt_id = ?", (project[0],))
-            brama = cursor.fetchone()
-            if brama:
-                project_data["brama"] = {
-                    "rodzaj_przetloczenia": brama[2],
-                    "struktura_powierzchni": brama[3],
-                    "kolor_standardowy": brama[4],
-                    "kolor_ral": brama[5],
-                    "sposob_otwierania_drzwi": brama[6],
-                    "opcje_dodatkowe": brama[7],
-                    "kratka_wentylacyjna": brama[8],
-                    "przeszklenia": brama[9],
-                    "klamka_do_bramy": brama[10],
-                    "szerokosc": brama[11],
-                    "wysokosc": brama[12]
-                }
+        :param names: Lista nazw projektów.
+        :return: Słownik {nazwa projektu: dane jak w get_project_by_name}; nieistniejące projekty są pomijane.
+        """
+        names = list(dict.fromkeys(names))
+        cursor = self.connect().cursor()
+        cursor.row_factory = sqlite3.Row
+        projects = {}
+        for start in range(0, len(names), self.SQL_VARIABLE_LIMIT):
+            chunk = names[start:start + self.SQL_VARIABLE_LIMIT]
+            cursor.execute(self._project_query(f"p.nazwa IN ({', '.join('?' * len(chunk))})"), chunk)
+            for row in cursor.fetchall():
+                projects[row["nazwa"]] = self._project_from_row(row)
+        return projects
 
-        elif typ_bramy == "roletowa":
-            cursor.execute("SELECT * FROM BramaRoletowa WHERE projekt_id = ?", (project[0],))
-            brama = cursor.fetchone()
-            if brama:
-                project_data["brama"] = {
-                    "wysokosc_profili": brama[2],
-                    "kolor_standardowy": brama[3],
-                    "kolor_ral": brama[4],
-                    "sposob_otwierania_bramy": brama[5],
-                    "przeszklenia": brama[6],
-                    "szerokosc": brama[7],
-                    "wysokosc": brama[8]
-                }
+    def _project_query(self, where):
+        """
+        Buduje zapytanie łączące projekt z tabelami wszystkich typów bram (LEFT JOIN),
+        dzięki czemu projekt i jego brama są pobierane w jednym zapytaniu.
+        Kolumny bram mają aliasy w postaci "typ.kolumna" (np. "roletowa.kolor_ral").
 
-        elif typ_bramy == "rozwierana":
-            cursor.execute("SELECT * FROM BramaRozwierana WHERE projekt_id = ?", (project[0],))
-            brama = cursor.fetchone()
-            if brama:
-                project_data["brama"] = {
-                    "ilosc_skrzydel": brama[2],
-                    "ocieplenie": brama[3],
-                    "uklad_wypelnienia": brama[4],
-                    "kolor_standardowy": brama[5],
-                    "kolor_ral": brama[6],
-                    "przeszklenia": brama[7],
-                    "opcje_dodatkowe": brama[8],
-                    "kratka_wentylacyjna": brama[9],
-                    "klamka_do_bramy": brama[10],
-                    "szerokosc": brama[11],
-                    "wysokosc": brama[12]
-                }
+        :param where: Warunek WHERE dla tabeli Projekt (alias p).
+        :return: Treść zapytania SQL.
+        """
+        columns = ["p.id", "p.nazwa", "p.data_zapisu", "p.typ_bramy"]
+        joins = []
+        for typ_bramy, table in self.GATE_TABLES.items():
+            columns.append(f'{typ_bramy}.id AS "{typ_bramy}.id"')
+            columns.extend(f'{typ_bramy}.{column} AS "{typ_bramy}.{column}"'
+                           for column in self.GATE_COLUMNS[typ_bramy])
+            joins.append(f"LEFT JOIN {table} {typ_bramy} "
+                         f"ON {typ_bramy}.projekt_id = p.id AND p.typ_bramy = '{typ_bramy}'")
+        return f"SELECT {', '.join(columns)} FROM Projekt p {' '.join(joins)} WHERE {where}"
 
-        elif typ_bramy == "uchylna":
-            cursor.execute("SELECT * FROM BramaUchylna WHERE projekt_id = ?", (project[0],))
-            brama = cursor.fetchone()
-            if brama:
-                project_data["brama"] = {
-                    "uklad_wypelnienia": brama[2],
-                    "kolor_standardowy": brama[3],
-                    "kolor_ral": brama[4],
-                    "sposob_otwierania_drzwi": brama[5],
-                    "przeszklenia": brama[6],
-                    "opcje_dodatkowe": brama[7],
-                    "kratka_wentylacyjna": brama[8],
-                    "klamka_do_bramy": brama[9],
-                    "szerokosc": brama[10],
-                    "wysokosc": brama[11]
-                }
+    def _project_from_row(self, row):
+        """
+        Zamienia wiersz zapytania z _project_query na słownik projektu.
 
-        conn.close()
-        return project_data
+        :param row: Wiersz sqlite3.Row.
+        :return: Słownik {"projekt": {...}, "brama": {...} lub None}.
+        """
+        typ_bramy = row["typ_bramy"]
+        gate = None
+        if typ_bramy in self.GATE_TABLES and row[f"{typ_bramy}.id"] is not None:
+            gate = {column: row[f"{typ_bramy}.{column}"] for column in self.GATE_COLUMNS[typ_bramy]}
+
+        return {
+            "projekt": {
+                "id": row["id"],
+                "nazwa": row["nazwa"],
+                "data_zapisu": row["data_zapisu"],
+                "typ_bramy": typ_bramy
+            },
+            "brama": gate
+        }
 
     def load_project_to_json(self, project_name, output_file):
         """
@@ -359,69 +959,163 @@ class DatabaseManager:
 
         :param project_name: Nazwa projektu, który ma być zapisany do JSON.
         :param output_file: Ścieżka do pliku, w którym dane zostaną zapisane.
+        :return: True, jeśli projekt został zapisany do pliku, w przeciwnym razie False.
         """
         try:
             # Pobierz dane projektu
             project_data = self.get_project_by_name(project_name)
             if not project_data:
                 print(f"Nie znaleziono projektu o nazwie {project_name}")
-                return
-            # Mapowanie typu bramy na pełną nazwę
-            full_gate_type_map = {
-                "segmentowa": "Brama Segmentowa",
-                "roletowa": "Brama Roletowa",
-                "uchylna": "Brama Uchylna",
-                "rozwierana": "Brama Rozwierana"
-            }
-            # Pobranie pełnej nazwy bramy
-            gate_type_full = full_gate_type_map.get(project_data["projekt"]["typ_bramy"], "Nieznany typ bramy")
-
-            # Mapowanie kluczy na polskie nazwy
-            key_map = {
-                "ilosc_skrzydel": "Ilość skrzydeł",
-                "ocieplenie": "Ocieplenie",
-                "uklad_wypelnienia": "Układ wypełnienia",
-                "kolor_standardowy": "Kolor standardowy",
-                "kolor_ral": "Kolor RAL",
-                "wysokosc_profili": "Wysokość profili",
-                "sposob_otwierania_drzwi": "Sposób otwierania drzwi",
-                "sposob_otwierania_bramy": "Sposób otwierania bramy",
-                "przeszklenia": "Przeszklenia",
-                "drzwi_przejsciowe": "Drzwi przejściowe",
-                "opcje_dodatkowe": "Opcje dodatkowe",
-                "rodzaj_przetloczenia": "Rodzaj przetłoczenia",
-                "struktura_powierzchni": "Struktura powierzchni",
-                "kratka_wentylacyjna": "Kratka wentylacyjna",
-                "przeszklenia": "Przeszklenia",
-                "klamka_do_bramy": "Klamka do bramy"
-            }
+                return False
 
-            # Przygotowanie struktury JSON
-            project_json = {
-                "Nazwa Projektu": project_data["projekt"]["nazwa"],
-                "Typ bramy": gate_type_full,
-                "Wymiary": {
-                    "Szerokość": project_data["brama"]["szerokosc"],
-                    "Wysokość": project_data["brama"]["wysokosc"]
-                }
-            }
-            # Przetwarzanie danych bramy
-            for key, value in project_data["brama"].items():
-                if key in ["szerokosc", "wysokosc"]:
-                    continue  # Pomijamy szerokość i wysokość, bo są już w "Wymiary"
-                mapped_key = key_map.get(key, key)  # Mapowanie kluczy na polskie nazwy
-                if key == "opcje_dodatkowe" and value:  # Opcje dodatkowe jako lista
-                    project_json[mapped_key] = [opt.strip() for opt in value.split(",")]
-                else:
-                    project_json[mapped_key] = value
+            project_json = self._project_to_json(
+                project_data["projekt"]["nazwa"], project_data["projekt"]["typ_bramy"], project_data["brama"]
+            )
 
             # Zapis do pliku JSON
             with open(output_file, "w", encoding="utf-8") as json_file:
                 json.dump(project_json, json_file, ensure_ascii=False, indent=4)
 
             print(f"Projekt zapisano do pliku JSON: {output_file}")
+            return True
         except Exception as e:
            print(f"Błąd podczas zapisywania projektu do JSON: {e}")
+           return False
+
+    def _project_to_json(self, project_name, typ_bramy, gate):
+        """
+        Buduje słownik projektu w formacie JSON używanym przez aplikację (i przez add_project_from_json).
+
+        :param project_name: Nazwa projektu.
+        :param typ_bramy: Typ bramy zapisany w bazie (np. "segmentowa").
+        :param gate: Słownik z danymi bramy (kolumny tabeli bramy) lub None.
+        :return: Słownik z danymi projektu.
+        """
+        # Mapowanie typu bramy na pełną nazwę
+        full_gate_type_map = {value: key for key, value in self.TYP_BRAMY_MAP.items()}
+        gate = gate or {}
+
+        # Przygotowanie struktury JSON
+        project_json = {
+            "Nazwa projektu": project_name,
+            "Typ bramy": full_gate_type_map.get(typ_bramy, "Nieznany typ bramy"),
+            "Wymiary": {
+                "Szerokość": gate.get("szerokosc"),
+                "Wysokość": gate.get("wysokosc")
+            }
+        }
+        # Przetwarzanie danych bramy
+        for key, value in gate.items():
+            if key in ["szerokosc", "wysokosc"]:
+                continue  # Pomijamy szerokość i wysokość, bo są już w "Wymiary"
+            mapped_key = self.JSON_KEY_MAP.get(key, key)  # Mapowanie kluczy na polskie nazwy
+            if key == "opcje_dodatkowe" and value:  # Opcje dodatkowe jako lista
+                project_json[mapped_key] = [opt.strip() for opt in value.split(",")]
+            else:
+                project_json[mapped_key] = value
+        return project_json
+
+    def count_projects_with_option(self, option, gate_type=None, since=None, until=None):
+        """
+        Zlicza projekty z daną opcją dodatkową, np. bramy uchylne z "Drzwi w bramie" w danym miesiącu.
+
+        :param option: Nazwa opcji dodatkowej (np. "Drzwi w bramie").
+        :param gate_type: Typ bramy ("Brama Uchylna" lub "uchylna") albo None dla wszystkich typów.
+        :param since: Początek okresu (data_zapisu >= since, np. "2025-01-01") lub None.
+        :param until: Koniec okresu (data_zapisu < until) lub None.
+        :return: Liczba projektów.
+        """
+        conditions, params = self._option_filters(gate_type, since, until)
+        conditions.insert(0, "o.opcja = ?")
+        params.insert(0, option)
+        try:
+            return self.connect().execute(f"""
+                SELECT COUNT(*) FROM ProjektOpcja o JOIN Projekt p ON p.id = o.projekt_id
+                WHERE {" AND ".join(conditions)}
+            """, params).fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Błąd podczas zliczania projektów z opcją: {e}")
+            return 0
+
+    def option_usage(self, gate_type=None, since=None, until=None):
+        """
+        Zwraca liczbę projektów dla każdej opcji dodatkowej, od najczęściej wybieranej.
+
+        :param gate_type: Typ bramy ("Brama Uchylna" lub "uchylna") albo None dla wszystkich typów.
+        :param since: Początek okresu (data_zapisu >= since) lub None.
+        :param until: Koniec okresu (data_zapisu < until) lub None.
+        :return: Lista krotek (opcja, liczba projektów).
+        """
+        conditions, params = self._option_filters(gate_type, since, until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        try:
+            return self.connect().execute(f"""
+                SELECT o.opcja, COUNT(*) AS liczba
+                FROM ProjektOpcja o JOIN Projekt p ON p.id = o.projekt_id
+                {where}
+                GROUP BY o.opcja
+                ORDER BY liczba DESC, o.opcja
+            """, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Błąd podczas zliczania opcji dodatkowych: {e}")
+            return []
+
+    def popular_configurations(self, limit=10):
+        """
+        Zwraca najczęściej zapisywane geometrie bram (wymiary i opcje z GEOMETRY_COLUMNS oraz obecność
+        drzwi w bramie), od najpopularniejszej. Projekty różniące się tylko kolorem, strukturą powierzchni
+        czy sposobem otwierania są liczone razem, bo dają ten sam model.
+
+        :param limit: Maksymalna liczba zwracanych konfiguracji.
+        :return: Lista krotek (liczba projektów, konfiguracja w formacie selected_options.json).
+        """
+        full_gate_type_map = {value: key for key, value in self.TYP_BRAMY_MAP.items()}
+        counted = []
+        try:
+            for typ_bramy, table in self.GATE_TABLES.items():
+                columns = [column for column in self.GATE_COLUMNS[typ_bramy] if column in self.GEOMETRY_COLUMNS]
+                door = "opcje_dodatkowe" in self.GATE_COLUMNS[typ_bramy]
+                selected = columns + (["COALESCE(opcje_dodatkowe, '') LIKE ? AS drzwi"] if door else [])
+                grouped = columns + (["drzwi"] if door else [])
+                rows = self.connect().execute(f"""
+                    SELECT {', '.join(selected)}, COUNT(*) AS liczba
+                    FROM {table}
+                    GROUP BY {', '.join(grouped)}
+                    ORDER BY liczba DESC
+                    LIMIT ?
+                """, ((f"%{self.DOOR_OPTION}%",) if door else ()) + (limit,)).fetchall()
+                for row in rows:
+                    gate = dict(zip(columns, row))
+                    if door and row[len(columns)]:
+                        gate["opcje_dodatkowe"] = self.DOOR_OPTION
+                    config = self._project_to_json(None, typ_bramy, gate)
+                    del config["Nazwa projektu"]
+                    config["Typ bramy"] = full_gate_type_map[typ_bramy]
+                    counted.append((row[-1], config))
+        except sqlite3.Error as e:
+            print(f"Błąd podczas wyszukiwania popularnych konfiguracji: {e}")
+            return []
+
+        counted.sort(key=lambda item: item[0], reverse=True)
+        return counted[:limit]
+
+    def _option_filters(self, gate_type, since, until):
+        """
+        Buduje warunki WHERE (na tabeli Projekt, alias p) dla zapytań o opcje dodatkowe.
+
+        :return: Krotka (lista warunków, lista parametrów).
+        """
+        conditions, params = [], []
+        if gate_type:
+            conditions.append("p.typ_bramy = ?")
+            params.append(self.TYP_BRAMY_MAP.get(gate_type, gate_type))
+        if since:
+            conditions.append("p.data_zapisu >= ?")
+            params.append(since)
+        if until:
+            conditions.append("p.data_zapisu < ?")
+            params.append(until)
+        return conditions, params
 
     def check_project_existence(self, project_name):
         """
@@ -429,72 +1123,52 @@ class DatabaseManager:
         Zwraca True, jeśli projekt istnieje, w przeciwnym razie False.
         """
         try:
-            conn = self.connect()  # Nawiązanie połączenia z bazą
+            conn = self.connect()  # Połączenie bieżącego wątku
             cursor = conn.cursor()
             query = "SELECT COUNT(*) FROM Projekt WHERE nazwa = ?"
             cursor.execute(query, (project_name,))
             result = cursor.fetchone()
-            conn.close()
             return result[0] > 0  # Zwraca True, jeśli istnieje przynajmniej 1 rekord z tą nazwą projektu
         except sqlite3.Error as e:
             print(f"Błąd podczas sprawdzania istnienia projektu: {e}")
             return False
 
+    def price_catalog(self):
+        """
+        Zwraca przechowywany w pamięci cennik powiązany z bazą danych.
+
+        :return: Instancja PriceCatalog.
+        """
+        return PriceCatalog.for_database(self.DB_PATH)
+
     def get_price(self, gate_type, parameter, option):
         """
         Pobiera cenę z tabeli CENNIK na podstawie typu bramy, parametru i opcji.
+        Cena jest odczytywana z cennika w pamięci, który odświeża się po zmianie bazy danych.
 
         :param gate_type: Typ bramy (np. "Brama Segmentowa")
         :param parameter: Nazwa parametru (np. "Rodzaj przetłoczenia")
         :param option: Opcja dla danego parametru (np. "Bez przetłoczenia")
         :return: Cena jako liczba całkowita lub 0, jeśli cena nie została znaleziona.
         """
-        try:
-            conn = self.connect()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT doplata FROM CENNIK 
-                WHERE typ_bramy = ? AND parametr = ? AND opcja = ?
-            """, (gate_type, parameter, option))
-            result = cursor.fetchone()
-            conn.close()
-            return result[0] if result else 0
-        except sqlite3.Error as e:
-            print(f"Błąd podczas pobierania ceny: {e}")
-            return 0
+        return self.price_catalog().get_price(gate_type, parameter, option)
 
     def delete_project_by_name(self, project_name):
         """
         Usuwa projekt oraz powiązane dane bramy z bazy danych na podstawie nazwy projektu.
+        Rekordy bram są usuwane kaskadowo (ON DELETE CASCADE).
 
         :param project_name: Nazwa projektu do usunięcia.
         """
+        conn = self.connect()
         try:
-            conn = self.connect()
-            cursor = conn.cursor()
+            with conn:
+                cursor = conn.execute("DELETE FROM Projekt WHERE nazwa = ?", (project_name,))
 
-            # Sprawdzenie, czy projekt istnieje
-            cursor.execute("SELECT id FROM Projekt WHERE nazwa = ?", (project_name,))
-            project = cursor.fetchone()
-
-            if not project:
+            if cursor.rowcount == 0:
                 print(f"Projekt o nazwie '{project_name}' nie istnieje.")
                 return
 
-            projekt_id = project[0]
-
-            # Usuwanie danych z powiązanych tabel
-            cursor.execute("DELETE FROM BramaSegmentowa WHERE projekt_id = ?", (projekt_id,))
-            cursor.execute("DELETE FROM BramaRoletowa WHERE projekt_id = ?", (projekt_id,))
-            cursor.execute("DELETE FROM BramaRozwierana WHERE projekt_id = ?", (projekt_id,))
-            cursor.execute("DELETE FROM BramaUchylna WHERE projekt_id = ?", (projekt_id,))
-
-            # Usuwanie projektu
-            cursor.execute("DELETE FROM Projekt WHERE id = ?", (projekt_id,))
-            conn.commit()
-
             print(f"Projekt '{project_name}' został pomyślnie usunięty.")
         except sqlite3.Error as e:
             print(f"Błąd podczas usuwania projektu: {e}")
-        finally:
-            conn.close()
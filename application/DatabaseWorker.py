@@ -0,0 +1,116 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+import shiboken6
+from PySide6.QtCore import QObject, Signal, Slot
+
+from application.DatabaseManager import DatabaseManager
+
+
+class DatabaseWorker(QObject):
+    """
+    Wykonuje operacje na bazie danych w osobnym wątku, poza wątkiem interfejsu graficznego.
+
+    Zlecenia trafiają do kolejki i są wykonywane po kolei przez jeden wątek roboczy
+    z własnym obiektem DatabaseManager (a więc i własnym połączeniem SQLite). Wynik jest
+    dostępny jako concurrent.futures.Future, a funkcje zwrotne on_result/on_error są
+    wywoływane w wątku interfejsu za pośrednictwem sygnału Qt.
+    """
+    _completed = Signal(object, object)  # (funkcja zwrotna, wynik lub wyjątek)
+
+    _instance = None
+
+    def __init__(self, db_manager=None, parent=None):
+        """
+        Inicjalizuje obiekt i uruchamia wątek roboczy.
+
+        Args:
+            db_manager (DatabaseManager, optional): Obiekt dostępu do bazy danych używany przez wątek.
+            parent (QObject, optional): Rodzic obiektu. Domyślnie None.
+        """
+        super().__init__(parent)
+        self.db_manager = db_manager or DatabaseManager()
+        self._queue = queue.Queue()
+        self._completed.connect(self._deliver)
+        self._thread = threading.Thread(target=self._run, name="DatabaseWorker", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def instance(cls):
+        """
+        Zwraca wspólny dla całej aplikacji wątek bazy danych, tworząc go przy pierwszym użyciu.
+
+        Returns:
+            DatabaseWorker: Współdzielona instancja.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def submit(self, function, on_result=None, on_error=None):
+        """
+        Zleca wykonanie operacji na bazie danych w wątku roboczym.
+
+        Args:
+            function (callable): Funkcja przyjmująca DatabaseManager, np. lambda db: db.list_projects().
+            on_result (callable, optional): Wywoływana w wątku interfejsu z wynikiem operacji.
+            on_error (callable, optional): Wywoływana w wątku interfejsu z wyjątkiem;
+                domyślnie błąd jest wypisywany na konsolę.
+
+        Returns:
+            Future: Obiekt z wynikiem operacji.
+        """
+        future = Future()
+        self._queue.put((future, function, on_result, on_error))
+        return future
+
+    def stop(self, wait=True):
+        """
+        Kończy pracę wątku po wykonaniu zleceń oczekujących w kolejce.
+
+        Args:
+            wait (bool): Czy czekać na zakończenie wątku.
+        """
+        self._queue.put(None)
+        if wait and self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join()
+        if DatabaseWorker._instance is self:
+            DatabaseWorker._instance = None
+
+    def _run(self):
+        """Pętla wątku roboczego: pobiera zlecenia z kolejki i wykonuje je po kolei."""
+        while True:
+            task = self._queue.get()
+            if task is None:
+                break
+
+            future, function, on_result, on_error = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = function(self.db_manager)
+            except Exception as e:
+                future.set_exception(e)
+                self._completed.emit(on_error or self._print_error, e)
+            else:
+                future.set_result(result)
+                if on_result is not None:
+                    self._completed.emit(on_result, result)
+
+        self.db_manager.close()
+
+    @Slot(object, object)
+    def _deliver(self, callback, value):
+        """
+        Wywołuje funkcję zwrotną w wątku interfejsu, o ile jej właściciel (widżet) nadal istnieje.
+        """
+        owner = getattr(getattr(callback, "func", callback), "__self__", None)
+        if isinstance(owner, QObject) and not shiboken6.isValid(owner):
+            return
+        callback(value)
+
+    @staticmethod
+    def _print_error(error):
+        """Domyślna obsługa błędu zlecenia."""
+        print(f"Błąd podczas operacji na bazie danych: {error}")
@@ -0,0 +1,112 @@
+import threading
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+from application.DatabaseManager import DatabaseManager
+from application.generator.generator_gateV2 import BlenderScriptRunner
+
+
+class ModelPrewarmer(QObject):
+    """
+    Wstępne generowanie modeli najpopularniejszych konfiguracji bram w czasie bezczynności aplikacji.
+
+    Konfiguracje są odczytywane z zapisanych projektów (DatabaseManager.popular_configurations).
+    Dla każdej z nich generowany jest także model z samymi wymiarami - taki, jaki Kreator
+    renderuje przy otwarciu (domyślne opcje). Modele trafiają do pamięci podręcznej modeli
+    (BlenderScriptRunner.prewarm), więc pierwsze renderowanie w sesji jest zwykle natychmiastowe.
+
+    Kolejny model jest generowany dopiero, gdy użytkownik nie korzysta z aplikacji przez
+    IDLE_SECONDS i nie trwa żadne renderowanie zlecone przez użytkownika.
+    """
+    IDLE_SECONDS = 20  # Czas (s) bez aktywności użytkownika, po którym aplikacja jest uznawana za bezczynną
+    CHECK_INTERVAL_MS = 5000  # Odstęp (ms) między sprawdzeniami bezczynności
+    LIMIT = 10  # Liczba najpopularniejszych konfiguracji generowanych wstępnie
+    INPUT_EVENTS = (
+        QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.KeyPress, QEvent.Wheel, QEvent.TouchBegin,
+    )
+
+    def __init__(self, parent=None):
+        """
+        Inicjalizuje obiekt. Wstępne generowanie rozpoczyna się po wywołaniu start().
+
+        Args:
+            parent (QObject, optional): Rodzic obiektu. Domyślnie None.
+        """
+        super().__init__(parent)
+        self._configs = None  # Kolejka konfiguracji, wczytywana z bazy danych przy pierwszej bezczynności
+        self._thread = None
+        self._last_input = time.monotonic()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_timer)
+
+    def start(self, app):
+        """
+        Rozpoczyna śledzenie aktywności użytkownika i wstępne generowanie w czasie bezczynności.
+
+        Args:
+            app (QApplication): Aplikacja, której zdarzenia wejścia są śledzone.
+        """
+        app.installEventFilter(self)
+        self._timer.start()
+
+    def stop(self):
+        """Zatrzymuje wstępne generowanie (bieżący model jest kończony w tle)."""
+        self._timer.stop()
+        self._configs = []
+
+    def eventFilter(self, watched, event):
+        """Zapamiętuje czas ostatniej aktywności użytkownika; zdarzenia nie są przechwytywane."""
+        if event.type() in self.INPUT_EVENTS:
+            self._last_input = time.monotonic()
+        return False
+
+    def _on_timer(self):
+        """Uruchamia generowanie kolejnego modelu, jeśli aplikacja jest bezczynna."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._configs is not None and not self._configs:
+            self._timer.stop()
+            return
+        if time.monotonic() - self._last_input < self.IDLE_SECONDS or BlenderScriptRunner.active_renders():
+            return
+        self._thread = threading.Thread(target=self._prewarm_next, name="ModelPrewarmer", daemon=True)
+        self._thread.start()
+
+    def _prewarm_next(self):
+        """Generuje model następnej konfiguracji z kolejki (w wątku roboczym)."""
+        if self._configs is None:
+            self._configs = self.load_configurations(self.LIMIT)
+        if not self._configs:
+            return
+        config = self._configs.pop(0)
+        try:
+            if BlenderScriptRunner(config["Typ bramy"]).prewarm(config):
+                print(f"Wstępnie wygenerowano model: {config['Typ bramy']} {config.get('Wymiary')}")
+        except Exception as e:
+            print(f"Błąd podczas wstępnego generowania modelu: {e}")
+
+    @staticmethod
+    def load_configurations(limit):
+        """
+        Zwraca konfiguracje do wstępnego generowania: dla każdej z najpopularniejszych konfiguracji
+        najpierw wariant z domyślnymi opcjami Kreatora (typ bramy i wymiary), potem pełną konfigurację.
+
+        Args:
+            limit (int): Liczba najpopularniejszych konfiguracji.
+
+        Returns:
+            list: Konfiguracje w formacie selected_options.json.
+        """
+        db_manager = DatabaseManager()
+        try:
+            popular = db_manager.popular_configurations(limit)
+        finally:
+            db_manager.close()
+
+        configs = []
+        for _, config in popular:
+            configs.append({"Typ bramy": config["Typ bramy"], "Wymiary": config["Wymiary"]})
+            configs.append(config)
+        return configs
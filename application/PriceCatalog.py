@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import threading
+import time
+
+
+class PriceCatalog:
+    """
+    Przechowywany w pamięci cennik (tabela Cennik) z automatycznym unieważnianiem.
+
+    Cały cennik jest wczytywany jednym zapytaniem do słownika z kluczem
+    (typ_bramy, parametr, opcja). Ponowne wczytanie następuje tylko wtedy, gdy zmieni się
+    PRAGMA data_version lub czas modyfikacji pliku bazy danych, a sprawdzenie odbywa się
+    nie częściej niż co CHECK_INTERVAL sekund.
+    """
+    CHECK_INTERVAL = 1.0  # Minimalny odstęp (s) między sprawdzeniami aktualności cennika
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path):
+        """
+        Inicjalizuje cennik dla wskazanej bazy danych. Dane są wczytywane przy pierwszym użyciu.
+
+        :param db_path: Ścieżka do pliku bazy danych.
+        """
+        self.db_path = db_path
+        self._prices = {}
+        self._version = 0
+        self._state = None
+        self._checked_at = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_database(cls, db_path):
+        """
+        Zwraca współdzielony cennik dla danej bazy danych.
+
+        :param db_path: Ścieżka do pliku bazy danych.
+        :return: Instancja PriceCatalog.
+        """
+        with cls._instances_lock:
+            catalog = cls._instances.get(db_path)
+            if catalog is None:
+                catalog = cls._instances[db_path] = cls(db_path)
+            return catalog
+
+    @property
+    def version(self):
+        """Numer wersji cennika, zwiększany przy każdym ponownym wczytaniu danych."""
+        self._ensure_fresh()
+        return self._version
+
+    def get_price(self, gate_type, parameter, option):
+        """
+        Zwraca dopłatę dla opcji bez odwoływania się do bazy danych.
+
+        :param gate_type: Typ bramy (np. "Brama Segmentowa")
+        :param parameter: Nazwa parametru (np. "Rodzaj przetłoczenia")
+        :param option: Opcja dla danego parametru (np. "Bez przetłoczenia")
+        :return: Cena jako liczba całkowita lub 0, jeśli cena nie została znaleziona.
+        """
+        self._ensure_fresh()
+        return self._prices.get((gate_type, parameter, option), 0)
+
+    def prices_for(self, gate_type):
+        """
+        Zwraca wszystkie pozycje cennika dla danego typu bramy.
+
+        :param gate_type: Typ bramy (np. "Brama Uchylna").
+        :return: Słownik {(parametr, opcja): dopłata}.
+        """
+        self._ensure_fresh()
+        return {
+            (parameter, option): price
+            for (typ, parameter, option), price in self._prices.items()
+            if typ == gate_type
+        }
+
+    def invalidate(self):
+        """Wymusza ponowne wczytanie cennika przy następnym odczycie."""
+        with self._lock:
+            self._state = None
+            self._checked_at = None
+
+    def close(self):
+        """Zamyka połączenie używane do wczytywania cennika."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self):
+        """Zwraca połączenie cennika, tworząc je przy pierwszym użyciu."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._conn
+
+    def _read_state(self):
+        """
+        Odczytuje znacznik stanu bazy danych: PRAGMA data_version oraz czasy modyfikacji
+        pliku bazy i pliku WAL.
+
+        :return: Krotka opisująca aktualny stan bazy danych.
+        """
+        mtimes = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        data_version = self._connection().execute("PRAGMA data_version").fetchone()[0]
+        return data_version, tuple(mtimes)
+
+    def _ensure_fresh(self):
+        """Wczytuje cennik ponownie, jeśli baza danych zmieniła się od ostatniego odczytu."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.CHECK_INTERVAL:
+            return
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.CHECK_INTERVAL:
+                return
+            try:
+                state = self._read_state()
+                if state != self._state:
+                    self._load()
+                    self._state = state
+            except sqlite3.Error as e:
+                print(f"Błąd podczas wczytywania cennika: {e}")
+            self._checked_at = now
+
+    def _load(self):
+        """Wczytuje całą tabelę Cennik jednym zapytaniem."""
+        rows = self._connection().execute("SELECT typ_bramy, parametr, opcja, doplata FROM Cennik").fetchall()
+        self._prices = {(typ, parameter, option): price for typ, parameter, option, price in rows}
+        self._version += 1
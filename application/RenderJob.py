@@ -0,0 +1,68 @@
+import threading
+
+import shiboken6
+from PySide6.QtCore import QObject, Signal
+
+from application.generator.generator_gateV2 import BlenderScriptRunner
+
+
+class RenderJob(QObject):
+    """
+    Renderowanie bramy w wątku roboczym, poza wątkiem interfejsu graficznego.
+
+    BlenderScriptRunner.run blokuje do zakończenia pracy Blendera, dlatego jest wykonywany
+    w osobnym wątku. Postęp i wynik trafiają do interfejsu przez sygnały Qt, które dla
+    odbiorców z wątku interfejsu są dostarczane w tym wątku.
+    """
+    progress = Signal(int, str)  # (procent, opis bieżącego etapu)
+    finished = Signal(bool)  # True, jeśli pliki modelu są gotowe do wczytania
+
+    def __init__(self, gate_type, parent=None):
+        """
+        Inicjalizuje zadanie renderowania.
+
+        Args:
+            gate_type (str): Typ bramy, np. "Brama Segmentowa".
+            parent (QObject, optional): Rodzic obiektu. Domyślnie None.
+        """
+        super().__init__(parent)
+        self.runner = BlenderScriptRunner(gate_type)
+        self._thread = None
+
+    def start(self):
+        """Uruchamia renderowanie w wątku roboczym."""
+        self._thread = threading.Thread(target=self._run, name="RenderJob", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Anuluje renderowanie; sygnał finished zostanie wysłany z wartością False."""
+        self.runner.cancel()
+
+    def is_running(self):
+        """Sprawdza, czy renderowanie trwa."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        """Wykonuje renderowanie i wysyła sygnał finished z wynikiem."""
+        try:
+            success = self.runner.run(progress=self._on_progress)
+        except Exception as e:
+            print(f"Wystąpił błąd podczas renderowania: {e}")
+            success = False
+        self._emit(self.finished, success)
+
+    def _on_progress(self, percent, text):
+        """Przekazuje postęp renderowania (wywoływana w wątku roboczym)."""
+        self._emit(self.progress, percent, text)
+
+    def _emit(self, signal, *args):
+        """
+        Wysyła sygnał z wątku roboczego, o ile obiekt zadania nadal istnieje - widok (rodzic zadania)
+        może zostać zamknięty w trakcie renderowania.
+        """
+        if not shiboken6.isValid(self):
+            return
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            pass  # Obiekt usunięty między sprawdzeniem a wysłaniem sygnału
@@ -0,0 +1,106 @@
+from PySide6.QtCore import QObject, Signal
+
+from application.RenderJob import RenderJob
+
+
+class RenderScheduler(QObject):
+    """
+    Kolejkowanie renderowań tak, aby wygenerowany został tylko najnowszy stan opcji.
+
+    W danej chwili trwa co najwyżej jedno renderowanie i czeka co najwyżej jedno kolejne.
+    Nowe zlecenie zastępuje oczekujące, a trwające renderowanie innej (nieaktualnej już)
+    konfiguracji jest anulowane. Sygnał finished jest wysyłany tylko dla najnowszego zlecenia,
+    więc widok wczytuje wyłącznie model odpowiadający ostatnio wybranym opcjom.
+    """
+    progress = Signal(int, str)  # Postęp bieżącego (aktualnego) renderowania: (procent, opis)
+    finished = Signal(bool)  # Zakończono najnowsze zlecenie; True, jeśli pliki modelu są gotowe
+    busy_changed = Signal(bool)  # True po rozpoczęciu renderowania, False po zakończeniu ostatniego
+
+    def __init__(self, gate_type, prepare, parent=None):
+        """
+        Inicjalizuje obiekt.
+
+        Args:
+            gate_type (str): Typ bramy, np. "Brama Segmentowa".
+            prepare (callable): Wywoływana z opcjami w wątku interfejsu tuż przed uruchomieniem
+                renderowania (np. zapis opcji do resources/selected_options.json).
+            parent (QObject, optional): Rodzic obiektu. Domyślnie None.
+        """
+        super().__init__(parent)
+        self.gate_type = gate_type
+        self.prepare = prepare
+        self._running = None  # Trwające renderowanie (RenderJob)
+        self._running_options = None
+        self._running_cancelled = False  # Czy trwające renderowanie zostało już anulowane
+        self._pending = None  # Opcje oczekujące na renderowanie
+
+    def request(self, options):
+        """
+        Zleca renderowanie bramy z podanymi opcjami.
+
+        Args:
+            options (dict): Wybrane opcje bramy.
+        """
+        if self._running is None:
+            self._start(options)
+            self.busy_changed.emit(True)
+            return
+
+        if options == self._running_options and not self._running_cancelled:
+            self._pending = None  # Trwające renderowanie jest znów aktualne
+            return
+
+        # Anulowane renderowanie zakończy się niepowodzeniem, więc nawet te same opcje
+        # muszą zostać wyrenderowane ponownie
+        self._pending = options
+        self._cancel_running()
+
+    def cancel(self):
+        """Anuluje trwające renderowanie i porzuca oczekujące zlecenie."""
+        self._pending = None
+        if self._running is not None:
+            self._cancel_running()
+
+    def is_busy(self):
+        """Sprawdza, czy trwa renderowanie."""
+        return self._running is not None
+
+    def _cancel_running(self):
+        """Anuluje trwające renderowanie (jednokrotnie)."""
+        if not self._running_cancelled:
+            self._running_cancelled = True
+            self._running.cancel()
+
+    def _start(self, options):
+        """Zapisuje opcje i uruchamia renderowanie."""
+        self.prepare(options)
+        self._running_options = options
+        self._running_cancelled = False
+        self._running = RenderJob(self.gate_type, self)
+        self._running.progress.connect(self._on_job_progress)
+        self._running.finished.connect(self._on_job_finished)
+        self._running.start()
+
+    def _on_job_progress(self, percent, text):
+        """Przekazuje postęp renderowania, pomijając renderowania nieaktualne."""
+        if self.sender() is self._running and self._pending is None:
+            self.progress.emit(percent, text)
+
+    def _on_job_finished(self, success):
+        """Uruchamia oczekujące zlecenie albo zgłasza wynik najnowszego renderowania."""
+        job = self.sender()
+        if job is not self._running:
+            return
+        self._running = None
+        self._running_options = None
+        self._running_cancelled = False
+        job.deleteLater()
+
+        if self._pending is not None:
+            options, self._pending = self._pending, None
+            self.progress.emit(0, "Zmieniono opcje - ponowne renderowanie")
+            self._start(options)
+            return
+
+        self.busy_changed.emit(False)
+        self.finished.emit(success)
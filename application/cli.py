@@ -0,0 +1,410 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from application.DatabaseManager import DatabaseManager
+
+COMMANDS = ("db", "pricing", "render")  # Podkomendy obsługiwane w trybie wiersza poleceń
+
+
+def _open_stream(path, mode):
+    """
+    Otwiera plik tekstowy w kodowaniu UTF-8 lub zwraca stdin/stdout dla ścieżki "-".
+
+    Args:
+        path (str): Ścieżka do pliku lub "-".
+        mode (str): Tryb otwarcia ("r" lub "w").
+
+    Returns:
+        TextIO: Strumień tekstowy.
+    """
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+
+def _report(action, count, elapsed):
+    """
+    Wypisuje podsumowanie operacji wraz z przepustowością (na stderr, aby nie mieszać go z danymi).
+    """
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{action}: {count} projektów w {elapsed:.2f} s ({rate:.0f} wierszy/s)", file=sys.stderr)
+
+
+def _open_database():
+    """
+    Zwraca DatabaseManager istniejącej bazy danych ze schematem aplikacji. Polecenia tylko do odczytu
+    nie mogą tworzyć pliku bazy danych, bo pusty plik nie zostałby później zainicjalizowany schematem.
+
+    Returns:
+        DatabaseManager: Menedżer bazy danych lub None (z komunikatem na stderr), jeśli bazy nie ma.
+    """
+    if not os.path.exists(DatabaseManager.DB_PATH):
+        print(f"Baza danych nie istnieje: {DatabaseManager.DB_PATH}", file=sys.stderr)
+        return None
+
+    db_manager = DatabaseManager()
+    try:
+        if db_manager.has_schema():
+            return db_manager
+        print(f"Baza danych nie zawiera schematu: {DatabaseManager.DB_PATH}", file=sys.stderr)
+    except sqlite3.Error as e:
+        print(f"Błąd podczas otwierania bazy danych: {e}", file=sys.stderr)
+    db_manager.close()
+    return None
+
+
+def db_export(args):
+    """
+    Eksportuje projekty z bazy danych do pliku JSONL (wszystkie lub wskazane opcją --name).
+    """
+    db_manager = _open_database()
+    if db_manager is None:
+        return 1
+    start = time.perf_counter()
+    stream = _open_stream(args.file, "w")
+    try:
+        count = db_manager.export_projects(stream, names=args.names)
+    except sqlite3.Error as e:
+        print(f"Błąd podczas eksportu projektów: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    _report("Eksport", count, time.perf_counter() - start)
+    return 0
+
+
+def db_import(args):
+    """
+    Importuje projekty z pliku JSONL do bazy danych, tworząc ją w razie potrzeby.
+    """
+    db_manager = DatabaseManager()
+    db_manager.initialize_database()
+    start = time.perf_counter()
+    stream = _open_stream(args.file, "r")
+    try:
+        count = db_manager.import_projects(stream, batch_size=args.batch_size)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    _report("Import", count, time.perf_counter() - start)
+    return 0
+
+
+def _build_price_matrix(db_manager):
+    """
+    Buduje macierz cen z cennika bazy danych po sprawdzeniu, że każda opcja z options_data.txt
+    ma pozycję w cenniku.
+
+    Returns:
+        PriceMatrix: Zbudowana macierz cen lub None (z komunikatem na stderr), jeśli cennik jest
+            pusty albo niekompletny.
+    """
+    from application.pricing import PriceMatrix, missing_prices
+    from application.pricing.matrix import load_option_space
+
+    catalog = db_manager.price_catalog()
+    option_space = load_option_space()
+    try:
+        matrix = PriceMatrix.build(catalog, option_space)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return None
+
+    missing = missing_prices(catalog, option_space)
+    if missing:
+        for gate_type, parameter, option in missing:
+            print(f"Brak pozycji cennika: {gate_type} / {parameter}: {option}", file=sys.stderr)
+        print("Cennik nie obejmuje wszystkich opcji - macierz cen nie została zapisana.", file=sys.stderr)
+        return None
+    return matrix
+
+
+def pricing_build(args):
+    """
+    Buduje macierz cen wszystkich konfiguracji i zapisuje ją do pliku .npz.
+    """
+    db_manager = _open_database()
+    if db_manager is None:
+        return 1
+    start = time.perf_counter()
+    matrix = _build_price_matrix(db_manager)
+    if matrix is None:
+        return 1
+    path = matrix.save(args.output or args.matrix)
+    cells = sum(prices.size for prices in matrix.matrices.values())
+    print(f"Macierz cen: {cells} konfiguracji w {time.perf_counter() - start:.2f} s -> {path}", file=sys.stderr)
+    return 0
+
+
+def _load_price_matrix(path):
+    """
+    Wczytuje macierz cen, budując ją od nowa, jeśli plik nie istnieje lub cennik się zmienił.
+
+    Returns:
+        PriceMatrix: Macierz cen lub None, jeśli baza danych lub cennik są niedostępne.
+    """
+    from application.pricing import PriceMatrix
+
+    db_manager = _open_database()
+    if db_manager is None:
+        return None
+    try:
+        matrix = PriceMatrix.load(path)
+        if matrix.is_current(db_manager.price_catalog()):
+            return matrix
+        print("Cennik zmienił się od zbudowania macierzy cen - przebudowa.", file=sys.stderr)
+    except (OSError, ValueError, KeyError):
+        print("Brak aktualnej macierzy cen - budowanie.", file=sys.stderr)
+    matrix = _build_price_matrix(db_manager)
+    if matrix is not None:
+        matrix.save(path)
+    return matrix
+
+
+def pricing_list(args):
+    """
+    Wypisuje cennik do wydruku: cenę bazową i dopłaty za opcje każdego typu bramy.
+    """
+    matrix = _load_price_matrix(args.matrix)
+    if matrix is None:
+        return 1
+    stream = _open_stream(args.output, "w")
+    try:
+        current_gate = None
+        for gate_type, parameter, option, amount in matrix.price_list(args.type):
+            if gate_type != current_gate:
+                if current_gate is not None:
+                    stream.write("\n")
+                stream.write(f"{gate_type}\n")
+                current_gate = gate_type
+            if parameter == "Cena bazowa":
+                stream.write(f"  {'Cena bazowa':<60}{amount:>8} zł\n")
+            else:
+                stream.write(f"  {parameter + ': ' + option:<60}{'+' + str(amount):>8} zł\n")
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 0
+
+
+def pricing_cheapest(args):
+    """
+    Wypisuje najtańszą konfigurację typu bramy zawierającą wskazane opcje.
+    """
+    from application.pricing.matrix import MULTI_SELECT_PARAMETERS
+
+    matrix = _load_price_matrix(args.matrix)
+    if matrix is None:
+        return 1
+    required = {}
+    for item in args.option or []:
+        parameter, _, option = item.partition("=")
+        if parameter in MULTI_SELECT_PARAMETERS:
+            required.setdefault(parameter, []).append(option)
+        else:
+            required[parameter] = option
+
+    try:
+        price, config = matrix.cheapest(args.type, required)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(json.dumps({"Cena": price, "Konfiguracja": config}, ensure_ascii=False, indent=4))
+    return 0
+
+
+def _init_render_worker():
+    """
+    Inicjalizuje proces roboczy renderowania: procesy Blendera (BlenderWorker) są współdzielone
+    przez wszystkie konfiguracje renderowane w tym procesie i zamykane przy jego zakończeniu.
+    """
+    from multiprocessing.util import Finalize
+    from application.generator.blender_worker import BlenderWorker
+
+    Finalize(None, BlenderWorker.stop_all, exitpriority=10)
+
+
+def _render_config(line_number, config, output_dir, blender_path):
+    """
+    Renderuje jedną konfigurację w procesie roboczym.
+
+    Returns:
+        tuple: (numer wiersza, status "ok" / "cache" / "error", opis błędu lub None, czas w sekundach).
+    """
+    from application.generator.blender_worker import BlenderWorkerError
+    from application.generator.generator_gateV2 import BlenderScriptRunner
+
+    start = time.perf_counter()
+    try:
+        runner = BlenderScriptRunner(config["Typ bramy"])
+        if blender_path:
+            runner.blender_path = blender_path
+        status = "cache" if runner.render_to(config, output_dir) else "ok"
+        return line_number, status, None, time.perf_counter() - start
+    except (BlenderWorkerError, OSError, ValueError, KeyError) as e:
+        return line_number, "error", f"{type(e).__name__}: {e}", time.perf_counter() - start
+
+
+def _read_render_configs(stream):
+    """
+    Odczytuje konfiguracje z pliku JSONL, pomijając puste wiersze.
+
+    Returns:
+        tuple: (lista (numer wiersza, konfiguracja), lista (numer wiersza, opis błędu)).
+    """
+    configs, errors = [], []
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            config = json.loads(line)
+        except ValueError as e:
+            errors.append((line_number, f"Niepoprawny JSON: {e}"))
+            continue
+        if not isinstance(config, dict) or config.get("Typ bramy") not in DatabaseManager.TYP_BRAMY_MAP:
+            errors.append((line_number, "Brak lub nieznany 'Typ bramy'"))
+            continue
+        configs.append((line_number, config))
+    return configs, errors
+
+
+def _render_dir(output, line_number, config):
+    """
+    Zwraca katalog wynikowy konfiguracji: numer wiersza i (jeśli jest) nazwa projektu.
+    """
+    name = re.sub(r"[^\w.-]+", "_", str(config.get("Nazwa projektu") or "")).strip("._")
+    return os.path.join(output, f"{line_number:05d}-{name}" if name else f"{line_number:05d}")
+
+
+def render(args):
+    """
+    Renderuje konfiguracje z pliku JSONL (jedna na wiersz) do osobnych katalogów w --jobs procesach.
+
+    Każdy proces roboczy renderuje wiele konfiguracji w tych samych, długo działających procesach
+    Blendera, więc koszt uruchomienia Blendera ponoszony jest raz na proces, a nie na konfigurację.
+    """
+    stream = _open_stream(args.file, "r")
+    try:
+        configs, failures = _read_render_configs(stream)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    total = len(configs) + len(failures)  # Wiersze odrzucone przy odczycie liczą się jako błędy
+    counts = {"ok": 0, "cache": 0, "error": 0}
+    render_time = 0.0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_render_worker) as pool:
+        futures = [
+            pool.submit(_render_config, line_number, config, _render_dir(args.output, line_number, config), args.blender)
+            for line_number, config in configs
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            line_number, status, error, elapsed = future.result()
+            counts[status] += 1
+            render_time += elapsed
+            if error is not None:
+                failures.append((line_number, error))
+            print(f"[{done}/{len(futures)}] wiersz {line_number}: {status} ({elapsed:.2f} s)", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    rendered = counts["ok"] + counts["cache"]
+    rate = rendered / elapsed if elapsed > 0 else float("inf")
+    print(f"Renderowanie: {rendered}/{total} konfiguracji "
+          f"w {elapsed:.2f} s ({rate:.2f} konfiguracji/s, {args.jobs} procesów), "
+          f"z pamięci podręcznej: {counts['cache']}, błędy: {len(failures)}", file=sys.stderr)
+    if configs:
+        print(f"Średni czas konfiguracji: {render_time / len(configs):.2f} s", file=sys.stderr)
+    for line_number, error in sorted(failures):
+        print(f"  wiersz {line_number}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def build_parser():
+    """
+    Tworzy parser argumentów wiersza poleceń.
+
+    Returns:
+        argparse.ArgumentParser: Parser z podkomendami.
+    """
+    parser = argparse.ArgumentParser(prog="kreator-bram", description="Kreator bram garażowych.")
+    parser.add_argument("--db", help="Ścieżka do pliku bazy danych (domyślnie baza w katalogu użytkownika).")
+    commands = parser.add_subparsers(dest="command")
+
+    db_parser = commands.add_parser("db", help="Operacje na bazie projektów.")
+    db_commands = db_parser.add_subparsers(dest="db_command", required=True)
+
+    export_parser = db_commands.add_parser("export", help="Eksport projektów do pliku JSONL.")
+    export_parser.add_argument("file", help="Plik wyjściowy JSONL lub '-' dla stdout.")
+    export_parser.add_argument("--name", dest="names", action="append",
+                               help="Nazwa projektu do eksportu (można podać wielokrotnie).")
+    export_parser.set_defaults(handler=db_export)
+
+    import_parser = db_commands.add_parser("import", help="Import projektów z pliku JSONL.")
+    import_parser.add_argument("file", help="Plik wejściowy JSONL lub '-' dla stdin.")
+    import_parser.add_argument("--batch-size", type=int, default=DatabaseManager.IMPORT_BATCH_SIZE,
+                               help="Liczba projektów zapisywanych w jednej transakcji.")
+    import_parser.set_defaults(handler=db_import)
+
+    pricing_parser = commands.add_parser("pricing", help="Macierz cen i cennik.")
+    pricing_parser.add_argument("--matrix", help="Plik macierzy cen (domyślnie obok bazy danych).")
+    pricing_commands = pricing_parser.add_subparsers(dest="pricing_command", required=True)
+
+    build_matrix_parser = pricing_commands.add_parser("build", help="Zbudowanie macierzy cen wszystkich konfiguracji.")
+    build_matrix_parser.add_argument("--output", help="Plik wyjściowy .npz (domyślnie plik z --matrix lub obok bazy danych).")
+    build_matrix_parser.set_defaults(handler=pricing_build)
+
+    list_parser = pricing_commands.add_parser("list", help="Cennik do wydruku.")
+    list_parser.add_argument("--type", help="Typ bramy, np. 'Brama Uchylna' (domyślnie wszystkie).")
+    list_parser.add_argument("--output", default="-", help="Plik wyjściowy lub '-' dla stdout.")
+    list_parser.set_defaults(handler=pricing_list)
+
+    cheapest_parser = pricing_commands.add_parser("cheapest", help="Najtańsza konfiguracja z wybranymi opcjami.")
+    cheapest_parser.add_argument("--type", required=True, help="Typ bramy, np. 'Brama Uchylna'.")
+    cheapest_parser.add_argument("--option", action="append",
+                                 help="Wymagana opcja w postaci 'Parametr=Opcja' (można podać wielokrotnie).")
+    cheapest_parser.set_defaults(handler=pricing_cheapest)
+
+    render_parser = commands.add_parser("render", help="Renderowanie modeli bram z pliku JSONL.")
+    render_parser.add_argument("file", help="Plik JSONL z konfiguracjami (jedna na wiersz) lub '-' dla stdin.")
+    render_parser.add_argument("--output", default="render", help="Katalog, w którym powstają katalogi modeli.")
+    render_parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                               help="Liczba procesów roboczych (każdy używa własnych procesów Blendera).")
+    render_parser.add_argument("--blender", help="Ścieżka do Blendera (domyślnie ścieżka systemowa).")
+    render_parser.set_defaults(handler=render)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Punkt wejścia polecenia kreator-bram.
+
+    Bez podkomendy uruchamia interfejs graficzny; w przeciwnym razie wykonuje
+    wskazaną operację w trybie wiersza poleceń.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    # Argumenty nierozpoznane jako podkomendy (np. opcje Qt) trafiają do interfejsu graficznego
+    if not argv or argv[0] not in COMMANDS + ("--db", "-h", "--help"):
+        from application.main import main as run_gui
+        return run_gui()
+
+    args = build_parser().parse_args(argv)
+    if args.db:
+        DatabaseManager.DB_PATH = args.db
+    if args.command is None:
+        from application.main import main as run_gui
+        return run_gui()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
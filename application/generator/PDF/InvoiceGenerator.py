@@ -5,7 +5,7 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from application.DatabaseManager import DatabaseManager
+from application.pricing import quote
 from application.tools.path import get_resource_path
 
 
@@ -33,71 +33,6 @@ def load_json_data(file_path):
         return {}
 
 
-def calculate_price(data, db_manager):
-    """
-    Oblicza cenę na podstawie danych o produkcie i bazy danych.
-
-    Args:
-        data (dict): Dane o produkcie.
-        db_manager (DatabaseManager): Instancja klasy DatabaseManager do pobierania cen.
-
-    Returns:
-        tuple: Całkowita cena i szczegóły cenowe jako lista.
-    """
-    gate_type = data.get("Typ bramy")
-
-    try:
-        width = int(data.get("Wymiary", {}).get("Szerokość", 2500))
-    except (ValueError, TypeError):
-        width = 2500
-
-    try:
-        height = int(data.get("Wymiary", {}).get("Wysokość", 2125))
-    except (ValueError, TypeError):
-        height = 2125
-
-    price = db_manager.get_price(gate_type, 'Bazowa', 'Cena')
-    price_details = []
-
-    price_details.append(f"Cena bazowa: {gate_type} (+{price} zł)")
-
-    for param, option in data.items():
-        if param in ["Typ bramy", "Wymiary", "Nazwa projektu", "Kolor standardowy", "Kolor RAL"]:
-            continue
-
-        if isinstance(option, list):
-            for single_option in option:
-                if isinstance(single_option, (str, int, float)):
-                    surcharge = db_manager.get_price(gate_type, param, str(single_option))
-                    if surcharge > 0:
-                        price += surcharge
-                        price_details.append(f"{param}: {single_option} (+{surcharge} zł)")
-        elif isinstance(option, (str, int, float)):
-            surcharge = db_manager.get_price(gate_type, param, str(option))
-            if surcharge > 0:
-                price += surcharge
-                price_details.append(f"{param}: {option} (+{surcharge} zł)")
-
-    extra_width = max(0, width - 2200)
-    extra_height = max(0, height - 2000)
-
-    extra_width_rate = 0.5  # Cena za każdy dodatkowy mm szerokości
-    extra_height_rate = 0.5  # Cena za każdy dodatkowy mm wysokości
-
-    extra_width_cost = extra_width * extra_width_rate
-    extra_height_cost = extra_height * extra_height_rate
-
-    if extra_width > 0:
-        price += extra_width_cost
-        price_details.append(f"Nadmiarowa szerokość: +{extra_width} mm (+{extra_width_cost} zł)")
-
-    if extra_height > 0:
-        price += extra_height_cost
-        price_details.append(f"Nadmiarowa wysokość: +{extra_height} mm (+{extra_height_cost} zł)")
-
-    return price, price_details
-
-
 class InvoiceGenerator:
     """
     Klasa do generowania faktur w formacie PDF.
@@ -110,15 +45,18 @@ class InvoiceGenerator:
             output_path (str): Ścieżka do zapisu wygenerowanej faktury.
         """
         self.output_path = output_path
-        self.db_manager = DatabaseManager()
 
-    def generate_invoice(self):
+    def generate_invoice(self, price_quote=None):
         """
         Generuje fakturę VAT w formacie PDF na podstawie danych o produkcie i nabywcy.
+
+        Args:
+            price_quote (Quote, optional): Gotowa wycena produktu; domyślnie wycena
+                konfiguracji z resources/selected_options.json.
         """
-        product_parameters = load_json_data(get_resource_path("resources/selected_options.json"))
         customer_data = load_json_data(get_resource_path("resources/invoice_data.json"))  # Wczytanie danych nabywcy
-        total_price, price_details = calculate_price(product_parameters, self.db_manager)
+        if price_quote is None:
+            price_quote = quote(load_json_data(get_resource_path("resources/selected_options.json")))
 
         pdf = SimpleDocTemplate(self.output_path, pagesize=A4, leftMargin=20, rightMargin=20, topMargin=20,
                                 bottomMargin=20)
@@ -155,11 +93,7 @@ class InvoiceGenerator:
         VAT_RATE = 23  # VAT w Polsce (23%)
 
         row_index = 1
-        for detail in price_details:
-            param_name, param_value = detail.split(": ", 1)
-            price_text = param_value.split(" (+")[0]
-            surcharge = float(param_value.split("(+")[1].split(" zł")[0])
-
+        for param_name, price_text, surcharge in price_quote.lines:
             quantity = 1
             total_netto_value = surcharge * quantity
             vat_value = total_netto_value * (VAT_RATE / 100)
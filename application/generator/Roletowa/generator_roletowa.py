@@ -10,6 +10,11 @@ argv = argv[argv.index("--") + 1:]  # Wszystkie argumenty po "--"
 
 # Pierwszy argument to ścieżka do zasobów
 resources_path = argv[0]
+# Opcjonalne argumenty: plik konfiguracji i katalog plików wynikowych (zakończony "/").
+# Domyślnie używane są pliki współdzielone aplikacji.
+options_path = argv[1] if len(argv) > 1 else resources_path + "resources/selected_options.json"
+output_dir = argv[2] if len(argv) > 2 else resources_path + "application/generator/"
+gate_data_path = output_dir + "gate_data.json" if len(argv) > 2 else resources_path + "application/generator/dodatki/gate_data.json"
 # Lista nazw obiektów do sprawdzenia i ewentualnego usunięcia
 object_names = ["brama-segmentowa", "szyny-na-brame.001", "brama-segmentowa-z-szynami", "brama-uchylna-z-szynami", "brama-roletowa","szyny", "brama-koniec"]
 
@@ -143,7 +148,7 @@ def tilt_gate(width, height, wysokosc_profilu):
                 "dimensions": [gate.dimensions.x, gate.dimensions.y, gate.dimensions.z]
             }
             # Zapisz dane bramy do pliku JSON
-            with open(resources_path + "application/generator/dodatki/gate_data.json", "w") as json_file:
+            with open(gate_data_path, "w") as json_file:
                 json.dump(gate_data, json_file)
         else:
             print("Nie znaleziono obiektu bramy.")
@@ -219,8 +224,8 @@ def custom_export_to_obj_with_texture(texture_path, object_name="brama-koniec",
         print(f"Obiekt '{object_name}' nie został znaleziony w scenie.")
         return
 
-    output_obj_path = resources_path +"application/generator/" + output_obj_path
-    output_mtl_path = resources_path +"application/generator/" + output_mtl_path1
+    output_obj_path = output_dir + output_obj_path
+    output_mtl_path = output_dir + output_mtl_path1
 
     rotation_matrix = mathutils.Matrix.Rotation(-math.radians(90), 4, 'X')
     transformed_matrix = rotation_matrix @ obj.matrix_world
@@ -278,7 +283,7 @@ def custom_export_to_obj_without_mtl(object_name="szyny", output_obj_path="szyny
         print(f"Obiekt '{object_name}' nie został znaleziony w scenie.")
         return
 
-    output_obj_path = resources_path +"application/generator/" + output_obj_path
+    output_obj_path = output_dir + output_obj_path
 
     # Obrót obiektu o -90 stopni w osi X
     rotation_matrix = mathutils.Matrix.Rotation(-math.radians(90), 4, 'X')
@@ -352,7 +357,7 @@ def read_json(json_path):
         return [wymiary, przetloczenie, kolor]
 
 # Uruchom funkcję
-dimensions, wysokosc_profilu, kolor = read_json(resources_path+"/resources/selected_options.json")
+dimensions, wysokosc_profilu, kolor = read_json(options_path)
 width = dimensions.get("Szerokość")
 height = dimensions.get("Wysokość")
 
@@ -13,6 +13,11 @@ argv = argv[argv.index("--") + 1:]  # Wszystkie argumenty po "--"
 
 # Pierwszy argument to ścieżka do zasobów
 resources_path = argv[0]
+# Opcjonalne argumenty: plik konfiguracji i katalog plików wynikowych (zakończony "/").
+# Domyślnie używane są pliki współdzielone aplikacji.
+options_path = argv[1] if len(argv) > 1 else resources_path + "resources/selected_options.json"
+output_dir = argv[2] if len(argv) > 2 else resources_path + "application/generator/"
+gate_data_path = output_dir + "gate_data.json" if len(argv) > 2 else resources_path + "application/generator/dodatki/gate_data.json"
 
 # Lista nazw obiektów do sprawdzenia i ewentualnego usunięcia
 object_names = ["szyny", "szyny-na-brame.001", "brama-uchylna-z-szynami", "Right_Door", "Left_Door", "brama-uchylna", "brama-koniec"]
@@ -202,7 +207,7 @@ def tilt_gate_rozwierana(width, height, ilosc_skrzydel, wypelnienie=None):
             "dimensions": [joined_gate.dimensions.x, joined_gate.dimensions.y, joined_gate.dimensions.z]
         }
 
-        with open(resources_path +"application/generator/dodatki/gate_data.json", "w") as json_file:
+        with open(gate_data_path, "w") as json_file:
             json.dump(gate_data, json_file)
 
 
@@ -396,7 +401,7 @@ def custom_export_to_obj_without_mtl(object_name="szyny", output_obj_path="szyny
         print(f"Obiekt '{object_name}' nie został znaleziony w scenie.")
         return
 
-    output_obj_path = resources_path +"application/generator/" + output_obj_path
+    output_obj_path = output_dir + output_obj_path
 
     # Obrót obiektu o -90 stopni w osi X
     rotation_matrix = mathutils.Matrix.Rotation(-math.radians(90), 4, 'X')
@@ -488,8 +493,8 @@ def export_doors_to_obj_with_mtl(texture_path, left_door_name="Left_Door", right
         combined_doors.name = "Single_Door"
 
     # Przygotowanie ścieżek do zapisu
-    output_obj_path = resources_path + "application/generator/" + output_obj_path
-    output_mtl_path = resources_path + "application/generator/" + output_mtl_path1
+    output_obj_path = output_dir + output_obj_path
+    output_mtl_path = output_dir + output_mtl_path1
 
     # Obrót obiektu o -90 stopni w osi X
     rotation_matrix = mathutils.Matrix.Rotation(-math.radians(90), 4, 'X')
@@ -589,7 +594,7 @@ def read_json(json_path):
 
 
 # Uruchom funkcję
-dimensions, ilosc_skrzydel, kolor, uklad_wypelnienia = read_json(resources_path+"/resources/selected_options.json")
+dimensions, ilosc_skrzydel, kolor, uklad_wypelnienia = read_json(options_path)
 width = dimensions.get("Szerokość")
 height = dimensions.get("Wysokość")
 tilt_gate_rozwierana(width, height, ilosc_skrzydel, uklad_wypelnienia)
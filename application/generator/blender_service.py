@@ -0,0 +1,75 @@
+"""
+Skrypt uruchamiany wewnątrz Blendera przez BlenderWorker (blender --background --python blender_service.py).
+
+Proces Blendera pozostaje uruchomiony i wykonuje kolejne zlecenia odczytywane ze standardowego
+wejścia - po jednym obiekcie JSON w wierszu:
+
+    {"id": 1, "blend": "...", "script": "...", "args": ["..."], "outputs": ["..."]}
+
+Przed każdym zleceniem scena jest przywracana do stanu z pliku .blend, a skrypt generatora
+otrzymuje argumenty po "--" tak samo jak przy samodzielnym uruchomieniu Blendera.
+Postęp (etapy "load" i "script") oraz wynik każdego zlecenia są wypisywane jako wiersze
+z prefiksem RESULT_PREFIX.
+"""
+import json
+import os
+import runpy
+import sys
+import traceback
+
+import bpy
+
+RESULT_PREFIX = "@@kreator-bram "  # Musi być zgodny z BlenderWorker.RESULT_PREFIX
+
+
+def send(message):
+    """Wypisuje komunikat dla procesu aplikacji."""
+    sys.stdout.write(RESULT_PREFIX + json.dumps(message, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def run_job(job, loaded):
+    """
+    Wykonuje jedno zlecenie: przywraca scenę z pliku .blend i uruchamia skrypt generatora.
+
+    Args:
+        job (dict): Zlecenie (blend, script, args, outputs).
+        loaded (str): Plik .blend otwarty przy poprzednim zleceniu.
+
+    Returns:
+        list: Ścieżki plików wynikowych, które istnieją po wykonaniu zlecenia.
+    """
+    send({"id": job.get("id"), "progress": "load"})
+    if job["blend"] == loaded:
+        bpy.ops.wm.revert_mainfile(load_ui=False)
+    else:
+        bpy.ops.wm.open_mainfile(filepath=job["blend"], load_ui=False)
+
+    send({"id": job.get("id"), "progress": "script"})
+    sys.argv = [sys.argv[0], "--", *job.get("args", [])]
+    runpy.run_path(job["script"], run_name="__main__")
+    return [path for path in job.get("outputs", []) if os.path.exists(path)]
+
+
+def main():
+    loaded = None
+    send({"ready": True, "pid": os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+        try:
+            outputs = run_job(job, loaded)
+            loaded = job["blend"]
+            send({"id": job.get("id"), "ok": True, "outputs": outputs})
+        except BaseException as e:
+            loaded = None  # Scena mogła zostać uszkodzona, następne zlecenie otworzy plik od nowa
+            traceback.print_exc()
+            send({"id": job.get("id"), "ok": False, "error": f"{type(e).__name__}: {e}"})
+            if isinstance(e, KeyboardInterrupt):
+                raise
+
+
+main()
@@ -0,0 +1,277 @@
+import itertools
+import json
+import os
+import queue
+import subprocess
+import threading
+
+
+class BlenderWorkerError(RuntimeError):
+    """Błąd wykonania zlecenia przez proces Blendera."""
+
+
+class BlenderJobCancelled(BlenderWorkerError):
+    """Zlecenie zostało anulowane (proces Blendera został zatrzymany)."""
+
+
+class BlenderWorker:
+    """
+    Długo działający proces Blendera wykonujący kolejne zlecenia generowania modeli.
+
+    Zamiast uruchamiać Blendera od nowa przy każdym renderowaniu, proces jest startowany raz
+    ze skryptem blender_service.py i otrzymuje zlecenia (plik .blend, skrypt, argumenty)
+    przez standardowe wejście. Przed każdym zleceniem scena jest przywracana z pliku .blend.
+    Jeśli proces zakończy działanie, jest uruchamiany ponownie przy następnym zleceniu.
+
+    Bieżące zlecenie można anulować metodą cancel() - proces jest wtedy zabijany,
+    a kolejne zlecenie uruchomi nowy.
+    """
+    LOW_PRIORITY_NICE = 10  # Obniżenie priorytetu procesów tła (np. wstępnego generowania) w systemach POSIX
+    RESULT_PREFIX = "@@kreator-bram "  # Prefiks wierszy z wynikami wypisywanych przez blender_service.py
+    STARTUP_TIMEOUT = 120  # Maksymalny czas (s) uruchamiania Blendera
+    JOB_TIMEOUT = 600  # Maksymalny czas (s) wykonania jednego zlecenia
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, blender_path, low_priority=False):
+        """
+        Inicjalizuje obiekt. Proces Blendera jest uruchamiany przy pierwszym zleceniu.
+
+        Args:
+            blender_path (str): Ścieżka do pliku wykonywalnego Blendera.
+            low_priority (bool): Czy uruchamiać Blendera z obniżonym priorytetem procesu.
+        """
+        self.blender_path = blender_path
+        self.low_priority = low_priority
+        self.service_script = os.path.join(os.path.abspath(os.path.dirname(__file__)), "blender_service.py")
+        self._process = None
+        self._messages = None
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._owner = None  # Zleceniodawca bieżącego zlecenia (zob. cancel)
+
+    @classmethod
+    def instance(cls, blender_path, name="default", low_priority=False):
+        """
+        Zwraca współdzielony proces Blendera, tworząc go przy pierwszym użyciu.
+        Procesy o różnych nazwach działają niezależnie, więc mogą wykonywać zlecenia równocześnie.
+
+        Args:
+            blender_path (str): Ścieżka do pliku wykonywalnego Blendera.
+            name (str): Nazwa procesu (np. "brama", "dodatki").
+            low_priority (bool): Czy nowo tworzony proces ma działać z obniżonym priorytetem.
+
+        Returns:
+            BlenderWorker: Współdzielona instancja.
+        """
+        with cls._instances_lock:
+            worker = cls._instances.get((blender_path, name))
+            if worker is None:
+                worker = cls._instances[(blender_path, name)] = cls(blender_path, low_priority)
+            return worker
+
+    @classmethod
+    def find(cls, blender_path, name="default"):
+        """
+        Zwraca istniejący współdzielony proces Blendera bez tworzenia nowego.
+
+        Args:
+            blender_path (str): Ścieżka do pliku wykonywalnego Blendera.
+            name (str): Nazwa procesu.
+
+        Returns:
+            BlenderWorker: Instancja lub None, jeśli proces o tej nazwie nie był używany.
+        """
+        with cls._instances_lock:
+            return cls._instances.get((blender_path, name))
+
+    @classmethod
+    def stop_all(cls):
+        """Zamyka wszystkie uruchomione procesy Blendera, przerywając trwające zlecenia."""
+        with cls._instances_lock:
+            workers = list(cls._instances.values())
+            cls._instances.clear()
+        for worker in workers:
+            if worker._lock.locked():
+                worker.cancel()
+            worker.stop()
+
+    def is_running(self):
+        """Sprawdza, czy proces Blendera działa."""
+        return self._process is not None and self._process.poll() is None
+
+    def run_job(self, blend_file, script_file, args=(), outputs=(), on_progress=None, owner=None):
+        """
+        Wykonuje skrypt generatora na pliku .blend w procesie Blendera.
+
+        Zlecenie jest ponawiane jednokrotnie w nowym procesie, jeśli poprzedni proces
+        zakończył działanie przed zwróceniem wyniku.
+
+        Args:
+            blend_file (str): Plik .blend otwierany przed wykonaniem skryptu.
+            script_file (str): Skrypt generatora.
+            args (Iterable[str]): Argumenty przekazywane skryptowi po "--".
+            outputs (Iterable[str]): Pliki, które skrypt powinien utworzyć.
+            on_progress (callable, optional): Wywoływana (w wątku zlecenia) z komunikatami postępu:
+                {"progress": "load" | "script"} oraz {"output": wiersz wypisany przez Blendera}.
+            owner (object, optional): Zleceniodawca; cancel(owner) przerywa tylko jego zlecenia.
+
+        Returns:
+            list: Ścieżki utworzonych plików wynikowych.
+
+        Raises:
+            FileNotFoundError: Jeśli nie znaleziono Blendera.
+            BlenderJobCancelled: Jeśli zlecenie zostało anulowane.
+            BlenderWorkerError: Jeśli skrypt zakończył się błędem lub przekroczono czas.
+        """
+        with self._lock:
+            self._cancelled = False
+            self._owner = owner
+            try:
+                return self._run_job(blend_file, script_file, args, outputs, on_progress)
+            finally:
+                self._owner = None
+
+    def _run_job(self, blend_file, script_file, args, outputs, on_progress):
+        """Wysyła zlecenie do procesu Blendera i czeka na wynik (wywoływana pod blokadą, zob. run_job)."""
+        for attempt in range(2):
+            if not self.is_running():
+                self._start()
+            job = {
+                "id": next(self._job_ids),
+                "blend": blend_file,
+                "script": script_file,
+                "args": list(args),
+                "outputs": list(outputs),
+            }
+            try:
+                self._process.stdin.write(json.dumps(job, ensure_ascii=False) + "\n")
+                self._process.stdin.flush()
+                result = self._wait_for(
+                    lambda message: message.get("id") == job["id"] and "ok" in message,
+                    self.JOB_TIMEOUT,
+                    on_progress,
+                )
+            except (BrokenPipeError, OSError, EOFError):
+                self._kill()
+                if self._cancelled:
+                    raise BlenderJobCancelled("Zlecenie zostało anulowane.")
+                if attempt == 0:
+                    print("Proces Blendera zakończył działanie, uruchamianie ponownie...")
+                    continue
+                raise BlenderWorkerError("Proces Blendera zakończył działanie podczas zlecenia.")
+
+            if not result.get("ok"):
+                raise BlenderWorkerError(result.get("error", "Nieznany błąd skryptu Blendera."))
+            return result.get("outputs", [])
+
+    def cancel(self, owner=None):
+        """
+        Anuluje bieżące zlecenie, zabijając proces Blendera. Metoda może być wywołana z dowolnego wątku.
+
+        Args:
+            owner (object, optional): Jeśli podano, zlecenie jest anulowane tylko wtedy,
+                gdy zostało zlecone przez tego zleceniodawcę (run_job(..., owner=...)).
+        """
+        if owner is not None and self._owner is not owner:
+            return
+        self._cancelled = True
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def stop(self, timeout=10):
+        """
+        Zamyka proces Blendera, czekając na zakończenie bieżącego zlecenia.
+
+        Args:
+            timeout (float): Maksymalny czas (s) oczekiwania na zakończenie procesu.
+        """
+        with self._lock:
+            if self._process is None:
+                return
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self._kill()
+
+    def _start(self):
+        """Uruchamia proces Blendera i czeka, aż będzie gotowy do przyjmowania zleceń."""
+        priority = {}
+        if self.low_priority:
+            if os.name == 'nt':
+                priority["creationflags"] = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+            else:
+                priority["preexec_fn"] = lambda: os.nice(self.LOW_PRIORITY_NICE)
+        self._process = subprocess.Popen(
+            [self.blender_path, "--background", "--python", self.service_script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **priority,
+        )
+        self._messages = queue.Queue()
+        threading.Thread(
+            target=self._read_output, args=(self._process, self._messages), name="BlenderWorker", daemon=True
+        ).start()
+        try:
+            self._wait_for(lambda message: message.get("ready"), self.STARTUP_TIMEOUT)
+        except EOFError:
+            self._kill()
+            if self._cancelled:
+                raise BlenderJobCancelled("Zlecenie zostało anulowane.")
+            raise BlenderWorkerError("Nie udało się uruchomić procesu Blendera.")
+
+    def _read_output(self, process, messages):
+        """
+        Przekazuje wyjście Blendera na konsolę, a wiersze z wynikami i postępem do kolejki
+        (pozostałe wiersze trafiają do niej jako {"output": wiersz}).
+        Koniec strumienia (zakończenie procesu) jest sygnalizowany wartością None.
+        """
+        for line in process.stdout:
+            if line.startswith(self.RESULT_PREFIX):
+                try:
+                    messages.put(json.loads(line[len(self.RESULT_PREFIX):]))
+                    continue
+                except ValueError:
+                    pass
+            print(line, end="")
+            messages.put({"output": line.rstrip("\n")})
+        messages.put(None)
+
+    def _wait_for(self, matches, timeout, on_progress=None):
+        """
+        Czeka na komunikat procesu spełniający warunek. Pozostałe komunikaty są przekazywane
+        do on_progress (jeśli podano) albo pomijane.
+
+        Raises:
+            EOFError: Jeśli proces zakończył działanie.
+            BlenderWorkerError: Jeśli przekroczono czas oczekiwania (proces jest wtedy zamykany).
+        """
+        while True:
+            try:
+                message = self._messages.get(timeout=timeout)
+            except queue.Empty:
+                self._kill()
+                raise BlenderWorkerError(f"Przekroczono czas oczekiwania na Blendera ({timeout} s).")
+            if message is None:
+                raise EOFError
+            if matches(message):
+                return message
+            if on_progress is not None and ("progress" in message or "output" in message):
+                on_progress(message)
+
+    def _kill(self):
+        """Kończy proces Blendera, jeśli nadal działa."""
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.kill()
+                self._process.wait()
+            self._process = None
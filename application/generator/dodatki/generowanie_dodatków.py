@@ -9,6 +9,11 @@ argv = argv[argv.index("--") + 1:]  # Wszystkie argumenty po "--"
 
 # Pierwszy argument to ścieżka do zasobów
 resources_path = argv[0]
+# Drugi (opcjonalny) argument to plik z obrysem bramy - domyślnie zapisany przez generator bramy
+gate_data_path = argv[1] if len(argv) > 1 else resources_path + "application/generator/dodatki/gate_data.json"
+# Trzeci i czwarty (opcjonalne) to plik konfiguracji i plik wynikowy dodatków
+options_path = argv[2] if len(argv) > 2 else resources_path + "resources/selected_options.json"
+output_path = argv[3] if len(argv) > 3 else resources_path + "application/generator/dodatki/combined_addons.obj"
 
 object_names = ["klamka-1.001", "klamka-1.002", "drzwi.001"]
 
@@ -47,7 +52,7 @@ def add_window_rolling(window, glass, segment):
     """
     try:
         # --- 1. Wczytaj dane bramy z pliku JSON ---
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie szerokości i wysokości bramy z JSON
@@ -183,7 +188,7 @@ def add_window_segment(glass, pattern, przetloczenie):
     """
     try:
         # --- 1. Wczytaj dane bramy z pliku JSON ---
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie szerokości i wysokości bramy z JSON
@@ -314,7 +319,7 @@ def add_window_rotation(window, glass, option, ilosc_skrzydel):
             return None, None
 
         # Wczytaj dane bramy
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         gate_location = gate_data["location"]
@@ -430,7 +435,7 @@ def add_window(window, glass, option):
             return None, None
 
         # Wczytaj dane bramy z pliku JSON
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie danych bramy
@@ -532,7 +537,7 @@ def position_door_from_file(door):
     """
     try:
         # Odczytaj dane bramy z pliku JSON
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie danych bramy
@@ -601,7 +606,7 @@ def add_handle(handle,typ = "Klamka 1",  door=None):
             return None
 
         # Wczytaj dane bramy z pliku JSON
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie danych bramy
@@ -686,7 +691,7 @@ def add_handle_swing_gate(handle, typ, ilosc_skrzydel):
             return None
 
         # Wczytaj dane bramy
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
         if typ == "Klamka 2":
             handle = bpy.data.objects.get("klamka-2")
@@ -789,7 +794,7 @@ def position_vent_from_file(vent, option):
     """
     try:
         # Odczytaj dane bramy z pliku JSON
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         # Pobranie danych bramy
@@ -873,7 +878,7 @@ def add_vent_rotation(vent, option, ilosc_skrzydel):
             return None
 
         # Wczytaj dane bramy
-        with open(resources_path + "application/generator/dodatki/gate_data.json", "r") as json_file:
+        with open(gate_data_path, "r") as json_file:
             gate_data = json.load(json_file)
 
         gate_location = gate_data["location"]
@@ -1021,7 +1026,7 @@ def export_multiple_objects_to_obj_custom(objects, output_path):
     except Exception as e:
         print(f"Wystąpił błąd podczas eksportu: {e}")
 
-def export_selected_objects(dodatki, output_path=resources_path + "application/generator/dodatki/combined_addons.obj"):
+def export_selected_objects(dodatki, output_path=output_path):
     """
     Eksportuje wybrane dodatki (np. drzwi, kratki wentylacyjne, klamki, okna) do pliku .obj.
 
@@ -1171,6 +1176,6 @@ def read_json(json_path):
     return result
 
 
-dodatki = read_json(resources_path + "resources/selected_options.json")
+dodatki = read_json(options_path)
 szerokość = dodatki["wymiary"]["Szerokość"]
 export_selected_objects(dodatki)
\ No newline at end of file
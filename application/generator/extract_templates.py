@@ -0,0 +1,124 @@
+"""
+Skrypt Blendera wyodrębniający siatki wszystkich obiektów otwartego pliku .blend do biblioteki
+szablonów (TemplateLibrary), z której generator bram korzysta bez uruchamiania Blendera.
+
+Uruchamiany przez polecenie python -m application.generator.template_library; ręcznie:
+
+    blender --background Segmentowa/segmentowa_kopia3.blend --python extract_templates.py -- \
+        <katalog biblioteki> <ścieżka pliku .blend względem application/generator>
+
+Biblioteka to katalog z nieskompresowanymi tablicami .npy (wspólnymi dla wszystkich obiektów,
+dzięki czemu można je mapować do pamięci) oraz plik manifest.json z zakresami tablic
+każdego obiektu, jego transformacją i sumami kontrolnymi plików.
+"""
+import bpy
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+FORMAT_VERSION = 1  # Musi być zgodna z TemplateLibrary.FORMAT_VERSION
+
+argv = sys.argv
+argv = argv[argv.index("--") + 1:]
+output_dir = argv[0]
+source = argv[1]
+
+
+def file_sha1(path):
+    """Zwraca skrót SHA-1 zawartości pliku."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def mesh_arrays(mesh):
+    """
+    Odczytuje siatkę obiektu: wierzchołki, narożniki wielokątów uporządkowane według wielokątów,
+    początki wielokątów, UV narożników (lub None) i normalne wielokątów.
+    """
+    vertices = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_index)
+    loop_start = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+
+    # Narożniki w kolejności wielokątów (loop_start nie musi być rosnący)
+    face_start = np.concatenate(([0], np.cumsum(loop_total))).astype(np.int32)
+    order = np.arange(face_start[-1]) - np.repeat(face_start[:-1], loop_total) + np.repeat(loop_start, loop_total)
+
+    uvs = None
+    if mesh.uv_layers.active is not None:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uvs)
+        uvs = uvs.reshape(-1, 2)[order]
+    return vertices.reshape(-1, 3), vertex_index[order], face_start, uvs, normals.reshape(-1, 3)
+
+
+def extract():
+    """Zapisuje siatki wszystkich obiektów typu MESH do katalogu biblioteki."""
+    os.makedirs(output_dir, exist_ok=True)
+    arrays = {"vertices": [], "loops": [], "face_start": [], "uvs": [], "normals": []}
+    objects = {}
+    counts = {"vertices": 0, "loops": 0, "faces": 0}
+
+    for obj in sorted(bpy.data.objects, key=lambda item: item.name):
+        if obj.type != 'MESH':
+            continue
+        vertices, loops, face_start, uvs, normals = mesh_arrays(obj.data)
+        location, rotation, scale = obj.matrix_basis.decompose()
+        objects[obj.name] = {
+            "vertices": [counts["vertices"], counts["vertices"] + len(vertices)],
+            "faces": [counts["faces"], counts["faces"] + len(normals)],
+            "uvs": uvs is not None,
+            "location": list(location),
+            "rotation": [list(row) for row in rotation.to_matrix()],
+            "scale": list(scale),
+            "parent": obj.parent.name if obj.parent else None,
+        }
+        arrays["vertices"].append(vertices)
+        arrays["loops"].append(loops)
+        # Wspólna tablica początków wielokątów zawiera pozycje w tablicy narożników całej biblioteki
+        arrays["face_start"].append(face_start[:-1] + counts["loops"])
+        arrays["uvs"].append(uvs if uvs is not None else np.zeros((len(loops), 2), dtype=np.float32))
+        arrays["normals"].append(normals)
+        counts["vertices"] += len(vertices)
+        counts["loops"] += len(loops)
+        counts["faces"] += len(normals)
+        print(f"Obiekt {obj.name}: {len(vertices)} wierzchołków, {len(normals)} wielokątów")
+
+    arrays["face_start"].append(np.array([counts["loops"]], dtype=np.int32))
+    empty = {"vertices": (0, 3), "loops": (0,), "uvs": (0, 2), "normals": (0, 3)}
+    files = {}
+    for name, parts in arrays.items():
+        if parts:
+            data = np.concatenate(parts)
+        else:
+            data = np.zeros(empty[name], dtype=np.int32 if name == "loops" else np.float32)
+        path = os.path.join(output_dir, f"{name}.npy")
+        np.save(path, data)
+        files[f"{name}.npy"] = file_sha1(path)
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "source": source,
+        "source_sha1": file_sha1(bpy.data.filepath),
+        "blender": bpy.app.version_string,
+        "files": files,
+        "objects": objects,
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+    print(f"Zapisano {len(objects)} obiektów do {output_dir}")
+
+
+extract()
@@ -0,0 +1,82 @@
+from application.generator import mesh_generator
+
+# Segmenty bramy rozwieranej dla każdego układu wypełnienia (jak w generator_rozwierana.py)
+ROZWIERANA_PANELS = {
+    "Poziome": "Cube.002",
+    "Pionowe": "Cube.003",
+    "Jodełka w górę": "Cube.005",
+    "START": "Cube.004",
+    "Jodełka w dół": "Cube.006",
+}
+TOLERANCE = 0.0005  # Dopuszczalna różnica (m) między przewidywanym a rzeczywistym obrysem bramy
+
+
+def nominal_size(config):
+    """
+    Zwraca zadane wymiary bramy w metrach (jednostkach sceny Blendera).
+
+    Args:
+        config (dict): Konfiguracja bramy.
+
+    Returns:
+        tuple | None: Szerokość i wysokość w metrach lub None, jeśli wymiary są niepoprawne.
+    """
+    sizes = config.get("Wymiary") or {}
+    try:
+        return float(sizes["Szerokość"]) / 1000, float(sizes["Wysokość"]) / 1000
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def bounds_match(predicted, actual, tolerance=TOLERANCE):
+    """
+    Sprawdza, czy dwa obrysy bramy (format gate_data.json) są zgodne z dokładnością do tolerancji.
+
+    Args:
+        predicted (dict): Przewidywany obrys.
+        actual (dict): Rzeczywisty obrys.
+        tolerance (float): Dopuszczalna różnica w metrach.
+
+    Returns:
+        bool: True, jeśli położenie i wymiary są zgodne.
+    """
+    try:
+        pairs = zip(predicted["location"] + predicted["dimensions"], actual["location"] + actual["dimensions"])
+        return all(abs(a - b) <= tolerance for a, b in pairs)
+    except (KeyError, TypeError):
+        return False
+
+
+def predict_bounds(config, templates):
+    """
+    Wyznacza obrys bramy (położenie i wymiary zapisywane przez generator w gate_data.json)
+    bez uruchamiania Blendera, aby generowanie dodatków mogło zacząć się równocześnie z bramą.
+
+    Stałe zależne od pliku .blend (głębokość segmentów, szyny) pochodzą z biblioteki szablonów
+    wyodrębnionej raz narzędziem template_library. Bramy obsługiwane przez mesh_generator są
+    budowane z szablonów. Skrypt bramy rozwieranej dopasowuje segmenty dokładnie do zadanych
+    wymiarów i stawia bramę na Z = 0, więc jej obrys wynika z wymiarów i głębokości segmentu.
+
+    Args:
+        config (dict): Konfiguracja bramy (z kluczem "Typ bramy").
+        templates (TemplateLibrary): Szablony z pliku .blend typu bramy lub None.
+
+    Returns:
+        dict | None: Obrys w formacie gate_data.json lub None, jeśli nie da się go wyznaczyć.
+    """
+    size = nominal_size(config)
+    if templates is None or size is None:
+        return None
+
+    gate_type = config.get("Typ bramy")
+    try:
+        if mesh_generator.supports(gate_type, config):
+            gate, _ = mesh_generator.build(gate_type, config, templates)
+            return {"location": gate.location.tolist(), "dimensions": gate.dimensions.tolist()}
+        if gate_type == "Brama Rozwierana":
+            panel = templates[ROZWIERANA_PANELS[config.get("Układ wypełnienia") or "START"]]
+            width, height = size
+            return {"location": [0.0, 0.0, height / 2], "dimensions": [width, float(panel.dimensions[1]), height]}
+    except Exception as e:
+        print(f"Nie można wyznaczyć obrysu bramy z szablonów: {e}")
+    return None
@@ -1,15 +1,92 @@
 import os
-import subprocess
 import json
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
+from application.generator import mesh_generator
+from application.generator.blender_worker import BlenderJobCancelled, BlenderWorker, BlenderWorkerError
+from application.generator.gate_bounds import bounds_match, predict_bounds
+from application.generator.model_cache import ModelCache, file_fingerprint, geometry_key, texture_path
+from application.generator.template_library import TemplateLibrary, library_path
 from application.tools.path import get_resource_path
 
 
+class _RenderProgress:
+    """
+    Łączy postęp zleceń Blendera (etapy i wiersze wypisywane przez Blendera) w jedną wartość
+    procentową przekazywaną do funkcji zwrotnej progress(procent, opis).
+    """
+    STAGES = {"load": (0.1, "wczytywanie szablonu"), "script": (0.3, "generowanie modelu")}
+    OUTPUT_STEP = 0.05  # Przyrost postępu zlecenia za każdy wiersz wypisany przez skrypt
+    OUTPUT_LIMIT = 0.9  # Postęp zlecenia przed otrzymaniem wyniku nie przekracza tej wartości
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def job(self, name, label):
+        """
+        Rozpoczyna śledzenie zlecenia i zwraca funkcję on_progress dla BlenderWorker.run_job.
+        """
+        with self._lock:
+            self._jobs[name] = 0.0
+        return partial(self._on_message, name, label)
+
+    def finish(self, name, label):
+        """Oznacza zlecenie jako zakończone."""
+        with self._lock:
+            self._jobs[name] = 1.0
+        self._report(f"{label}: zakończono")
+
+    def report(self, percent, text):
+        """Przekazuje postęp bezpośrednio do funkcji zwrotnej."""
+        if self.callback is not None:
+            self.callback(percent, text)
+
+    def _on_message(self, name, label, message):
+        """Aktualizuje postęp zlecenia na podstawie komunikatu z procesu Blendera."""
+        with self._lock:
+            fraction = self._jobs.get(name, 0.0)
+            if "progress" in message:
+                stage, text = self.STAGES.get(message["progress"], (fraction, message["progress"]))
+                fraction = max(fraction, stage)
+                text = f"{label}: {text}"
+            else:
+                fraction = min(self.OUTPUT_LIMIT, fraction + self.OUTPUT_STEP)
+                text = message.get("output", "")
+            self._jobs[name] = max(self._jobs.get(name, 0.0), fraction)
+        self._report(text)
+
+    def _report(self, text):
+        with self._lock:
+            percent = int(100 * sum(self._jobs.values()) / len(self._jobs)) if self._jobs else 0
+        self.report(percent, text)
+
+
 class BlenderScriptRunner:
     """
     Klasa obsługująca uruchamianie Blendera w tle z plikami .blend i skryptami Python.
     Pozwala na generowanie obiektów 3D w zależności od typu bramy oraz obsługę dodatków.
     """
+    _bounds_lock = threading.Lock()
+    _cache = None  # Wspólna pamięć podręczna modeli (ModelCache)
+    _promote_lock = threading.Lock()  # Podmiana plików wyświetlanego modelu przez jedno renderowanie naraz
+    _active = 0  # Liczba trwających renderowań zleconych przez użytkownika (run)
+    _templates = {}  # Otwarte biblioteki szablonów siatek: {katalog biblioteki: TemplateLibrary lub None}
+    PREWARM_WORKER = "tło"  # Nazwa procesu Blendera używanego do wstępnego generowania modeli
+
+    # Pliki wynikowe generatora przechowywane w pamięci podręcznej modeli: {nazwa we wpisie: ścieżka}
+    MODEL_FILES = {
+        "model.obj": "application/generator/model.obj",
+        "model.mtl": "application/generator/model.mtl",
+        "szyny.obj": "application/generator/szyny.obj",
+        "combined_addons.obj": "application/generator/dodatki/combined_addons.obj",
+        "gate_data.json": "application/generator/dodatki/gate_data.json",
+    }
 
     def __init__(self, gate_type="Segmentowa"):
         """
@@ -30,6 +107,10 @@ class BlenderScriptRunner:
         elif gate_type == "Brama Rozwierana":
             blend_file = "Rozwierana/rozwierana3.blend"
             script_file = "Rozwierana/generator_rozwierana.py"
+        self.gate_type = gate_type
+        self._cancel = threading.Event()
+        self._workers = set()  # Procesy Blendera (ścieżka, nazwa) używane przez ten obiekt (zob. cancel)
+        self._workers_lock = threading.Lock()
         dodatki_script = "dodatki/generowanie_dodatków.py"
         dodatki_blend = "dodatki/uchylna11.blend"
 
@@ -39,6 +120,8 @@ class BlenderScriptRunner:
         # Ścieżki do pliku .blend i skryptu
         self.project_root = os.path.abspath(os.path.dirname(__file__))  # Główny folder projektu
         self.blend_file = os.path.join(self.project_root, blend_file)
+        # Szablony siatek wyodrębnione z pliku .blend - pozwalają generować bramę bez Blendera
+        self.templates_dir = library_path(self.blend_file)
         self.script_file = os.path.join(self.project_root, script_file)
         self.blend_file_d = os.path.join(self.project_root, dodatki_blend)
         self.script_file_d = os.path.join(self.project_root, dodatki_script)
@@ -70,46 +153,407 @@ class BlenderScriptRunner:
         if not os.path.exists(self.script_file):
             raise FileNotFoundError(f"Błąd: Skrypt Blenderowy nie istnieje: {self.script_file}")
 
-    def run(self):
+    def run(self, progress=None, config=None):
+        """
+        Generuje model bramy i dodatków w długo działających procesach Blendera (BlenderWorker).
+
+        Dodatki potrzebują jedynie obrysu bramy. Jeśli da się go wyznaczyć z szablonów siatek
+        (predict_bounds), brama i dodatki są generowane równocześnie w dwóch procesach, a po zakończeniu
+        obrys przewidywany jest porównywany z rzeczywistym - przy niezgodności dodatki są generowane
+        ponownie. W przypadku braku wybranych opcji dodatków generuje pusty plik dodatków.
+
+        Każde renderowanie pracuje we własnym katalogu roboczym (kopia konfiguracji i pliki
+        wynikowe Blendera), a gotowy komplet plików jest dopiero na końcu przenoszony
+        w miejsce plików wyświetlanych w aplikacji. Dzięki temu równoczesne renderowania
+        nie nadpisują sobie nawzajem danych wejściowych ani wyników.
+
+        Model o tej samej geometrii, wygenerowany wcześniej, jest odtwarzany z pamięci
+        podręcznej (ModelCache) bez uruchamiania Blendera. Jeśli dla typu bramy przygotowano
+        szablony siatek, brama i szyny są generowane bez Blendera (mesh_generator).
+
+        Metoda blokuje do zakończenia generowania; można ją wywołać w wątku roboczym
+        i przerwać z innego wątku metodą cancel().
+
+        Args:
+            progress (callable, optional): Wywoływana (w wątku generowania) z postępem (procent, opis).
+            config (dict, optional): Konfiguracja bramy; domyślnie odczytywana z resources/selected_options.json.
+
+        Returns:
+            bool: True, jeśli pliki modelu są gotowe, False w przypadku błędu lub anulowania.
+        """
+        with self._bounds_lock:
+            BlenderScriptRunner._active += 1
+        try:
+            return self._render(progress, config)
+        finally:
+            with self._bounds_lock:
+                BlenderScriptRunner._active -= 1
+
+    @classmethod
+    def active_renders(cls):
+        """
+        Zwraca liczbę trwających renderowań zleconych przez użytkownika.
+
+        Returns:
+            int: Liczba wywołań run(), które jeszcze się nie zakończyły.
         """
-        Uruchamia Blendera w tle z plikami .blend i skryptami.
-        W przypadku braku wybranych opcji dodatków generuje pusty plik dodatków.
+        with cls._bounds_lock:
+            return cls._active
+
+    def _render(self, progress, config):
+        """
+        Generuje model bramy i dodatków do plików wyświetlanych w aplikacji (zob. run()).
+
+        Args:
+            progress (callable | None): Funkcja zwrotna postępu (procent, opis).
+            config (dict | None): Konfiguracja bramy lub None (odczyt z selected_options.json).
+
+        Returns:
+            bool: True, jeśli pliki modelu są gotowe.
         """
         # Sprawdzanie ścieżek
         self.validate_paths()
-        opcje = self.read_json(get_resource_path("resources/selected_options.json"))
+        if config is None:
+            with open(get_resource_path("resources/selected_options.json"), 'r', encoding='utf-8') as file:
+                config = json.load(file)
+
         path = get_resource_path("")
+        cache = self._model_cache()
+        model_files = {name: get_resource_path(relative) for name, relative in self.MODEL_FILES.items()}
+        key = geometry_key(self.gate_type, config, self._fingerprint())
+        tracker = _RenderProgress(progress)
+
+        workspace = self._create_workspace()
         try:
-            # Uruchom pierwszy skrypt Blenderowy
-            subprocess.run([
-                self.blender_path,
-                "--background",  # Tryb bez interfejsu graficznego
-                self.blend_file,  # Plik .blend do otwarcia
-                "--python", self.script_file,  # Skrypt do wykonania
-                "--",
-                path
-            ], check=True)
-
-            if opcje:
-                # Uruchom pierwszy skrypt Blenderowy
-                subprocess.run([
-                    self.blender_path,
-                    "--background",  # Tryb bez interfejsu graficznego
-                    self.blend_file_d,  # Plik .blend do otwarcia
-                    "--python", self.script_file_d,  # Skrypt do wykonania
-                    "--",
-                    path
-                ], check=True)
+            # Pliki z pamięci podręcznej też trafiają najpierw do katalogu roboczego, aby podmiana
+            # wyświetlanego modelu odbywała się w całości pod blokadą (_promote)
+            cached = {name: os.path.join(workspace, name) for name in self.MODEL_FILES}
+            if cache.restore(key, cached, texture_path(config, path)):
+                self._promote(cached, model_files)
+                print("Model bramy odczytany z pamięci podręcznej.")
+                tracker.report(100, "Model odczytany z pamięci podręcznej")
+                return True
+
+            files = self._generate(config, workspace, tracker)
+            cache.store(key, files)
+            self._promote(files, model_files)
+        except BlenderJobCancelled:
+            print("Renderowanie zostało anulowane.")
+            return False
+        except BlenderWorkerError as e:
+            if self._cancel.is_set():
+                print("Renderowanie zostało anulowane.")
             else:
-                # Jeśli opcje są puste, nadpisujemy plik combined_addons.obj pustym plikiem
-                with open(get_resource_path("application/generator/dodatki/combined_addons.obj"), 'w') as f:
-                    f.write("# Pusty plik OBJ, ponieważ nie wybrano żadnych dodatków\n")
+                print(f"Błąd podczas działania Blendera: {e}")
+            return False
+        except FileNotFoundError:
+            print(f"Nie znaleziono Blendera w lokalizacji: {self.blender_path}")
+            return False
+        except OSError as e:
+            print(f"Błąd podczas zapisu plików modelu: {e}")
+            return False
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
 
+        tracker.report(100, "Renderowanie zakończone")
+        return True
 
-        except subprocess.CalledProcessError as e:
-            print(f"Błąd podczas działania Blendera: {e}")
+    def prewarm(self, config):
+        """
+        Generuje model podanej konfiguracji wprost do pamięci podręcznej modeli, aby późniejsze
+        renderowanie tej konfiguracji było natychmiastowe.
+
+        Generowanie odbywa się we własnym katalogu roboczym, w osobnym procesie Blendera o obniżonym
+        priorytecie - pliki wyświetlanego modelu ani resources/selected_options.json nie są zmieniane.
+
+        Args:
+            config (dict): Konfiguracja bramy (format selected_options.json).
+
+        Returns:
+            bool: True, jeśli model został wygenerowany i zapisany; False, jeśli był już
+            w pamięci podręcznej lub generowanie się nie powiodło.
+        """
+        self.validate_paths()
+        cache = self._model_cache()
+        key = geometry_key(self.gate_type, config, self._fingerprint())
+        if cache.contains(key):
+            return False
+
+        workspace = self._create_workspace()
+        try:
+            files = self._generate(config, workspace, _RenderProgress(), self.PREWARM_WORKER, self.PREWARM_WORKER, True)
+            return cache.store(key, files)
+        except BlenderWorkerError as e:
+            print(f"Błąd podczas wstępnego generowania modelu: {e}")
+            return False
         except FileNotFoundError:
             print(f"Nie znaleziono Blendera w lokalizacji: {self.blender_path}")
+            return False
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    def render_to(self, config, output_dir):
+        """
+        Generuje model podanej konfiguracji do wskazanego katalogu (tryb wsadowy, kreator-bram render).
+        Pliki wyświetlanego modelu ani resources/selected_options.json nie są zmieniane.
+
+        Args:
+            config (dict): Konfiguracja bramy (format selected_options.json).
+            output_dir (str): Katalog, do którego trafiają pliki z MODEL_FILES.
+
+        Returns:
+            bool: True, jeśli model odtworzono z pamięci podręcznej; False, jeśli został wygenerowany.
+
+        Raises:
+            BlenderWorkerError: Jeśli generowanie się nie powiodło.
+            FileNotFoundError: Jeśli brakuje Blendera, pliku .blend lub skryptu.
+        """
+        self.validate_paths()
+        os.makedirs(output_dir, exist_ok=True)
+        cache = self._model_cache()
+        outputs = {name: os.path.join(output_dir, name) for name in self.MODEL_FILES}
+        key = geometry_key(self.gate_type, config, self._fingerprint())
+        if cache.restore(key, outputs, texture_path(config, get_resource_path(""))):
+            return True
+
+        workspace = self._create_workspace()
+        try:
+            files = self._generate(config, workspace, _RenderProgress())
+            cache.store(key, files)
+            for name, source in files.items():
+                shutil.move(source, outputs[name])
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+        return False
+
+    def cancel(self):
+        """
+        Przerywa trwające generowanie, zatrzymując procesy Blendera wykonujące zlecenia tego obiektu.
+        Metoda może być wywołana z dowolnego wątku.
+        """
+        self._cancel.set()
+        with self._workers_lock:
+            used = list(self._workers)
+        for blender_path, name in used:
+            worker = BlenderWorker.find(blender_path, name)
+            if worker is not None:
+                worker.cancel(owner=self)
+
+    def _generate(self, config, workspace, tracker, gate_worker="brama", addons_worker="dodatki", low_priority=False):
+        """
+        Generuje komplet plików modelu w katalogu roboczym.
+
+        Args:
+            config (dict): Konfiguracja bramy.
+            workspace (str): Katalog roboczy renderowania (_create_workspace).
+            tracker (_RenderProgress): Postęp renderowania.
+            gate_worker (str): Nazwa procesu Blendera generującego bramę.
+            addons_worker (str): Nazwa procesu Blendera generującego dodatki.
+            low_priority (bool): Czy procesy Blendera mają działać z obniżonym priorytetem.
+
+        Returns:
+            dict: {nazwa pliku z MODEL_FILES: ścieżka w katalogu roboczym}.
+
+        Raises:
+            BlenderWorkerError: Jeśli generowanie się nie powiodło lub zostało anulowane.
+        """
+        path = get_resource_path("")
+        options_path = os.path.join(workspace, "selected_options.json")
+        with open(options_path, 'w', encoding='utf-8') as file:
+            json.dump(config, file, ensure_ascii=False)
+        files = {name: os.path.join(workspace, name) for name in self.MODEL_FILES}
+        predicted_path = os.path.join(workspace, "gate_data_predicted.json")
+        with self._workers_lock:
+            self._workers.update({(self.blender_path, gate_worker), (self.blender_path, addons_worker)})
+        gate = BlenderWorker.instance(self.blender_path, gate_worker, low_priority)
+        addons = BlenderWorker.instance(self.blender_path, addons_worker, low_priority)
+
+        opcje = self.read_json(options_path)
+        config = dict(config, **{"Typ bramy": self.gate_type})
+        # Brama z szablonów siatek powstaje od razu, więc dodatki nie potrzebują przewidywanego obrysu
+        generated = self._run_mesh(config, workspace, files, tracker)
+        predicted = predict_bounds(config, self._mesh_templates()) if opcje and not generated else None
+        if predicted is not None:
+            with open(predicted_path, 'w') as file:
+                json.dump(predicted, file)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pending = pool.submit(self._run_addons, addons, path, options_path, predicted_path, files, tracker)
+                self._run_gate(gate, path, options_path, workspace, files, tracker)
+                pending.result()
+        elif not generated:
+            self._run_gate(gate, path, options_path, workspace, files, tracker)
+
+        self._check_cancelled()
+        actual = self._read_gate_data(files["gate_data.json"])
+        if actual is None:
+            raise BlenderWorkerError("Generator bramy nie zapisał obrysu bramy.")
+
+        if opcje:
+            if predicted is None or not bounds_match(predicted, actual):
+                if predicted is not None:
+                    print("Obrys bramy różni się od przewidywanego - ponowne generowanie dodatków.")
+                self._run_addons(addons, path, options_path, files["gate_data.json"], files, tracker)
+        else:
+            # Jeśli opcje są puste, tworzymy pusty plik combined_addons.obj
+            with open(files["combined_addons.obj"], 'w') as f:
+                f.write("# Pusty plik OBJ, ponieważ nie wybrano żadnych dodatków\n")
+        self._check_cancelled()
+
+        # Skrypty zgłaszają część błędów jedynie na konsolę - wymagany jest komplet plików
+        missing = [name for name, file_path in files.items() if not os.path.exists(file_path)]
+        if missing:
+            raise BlenderWorkerError(f"Generator nie utworzył plików: {', '.join(missing)}")
+        return files
+
+    def _run_mesh(self, config, workspace, files, tracker):
+        """
+        Generuje model bramy i szyn oraz plik gate_data.json bez Blendera, z szablonów siatek (mesh_generator).
+
+        Args:
+            config (dict): Konfiguracja bramy.
+            workspace (str): Katalog roboczy, do którego trafiają pliki wynikowe.
+            files (dict): Ścieżki plików wynikowych w katalogu roboczym.
+            tracker (_RenderProgress): Postęp renderowania.
+
+        Returns:
+            bool: True, jeśli pliki zostały wygenerowane; False, jeśli konfiguracja wymaga Blendera.
+        """
+        if not mesh_generator.supports(self.gate_type, config):
+            return False
+        templates = self._mesh_templates()
+        if templates is None:
+            return False
+
+        self._check_cancelled()
+        label = "Brama"
+        tracker.job("brama", label)
+        try:
+            mesh_generator.generate(self.gate_type, config, templates, workspace + os.sep,
+                                    files["gate_data.json"], texture_path(config, get_resource_path("")))
+        except Exception as e:
+            print(f"Błąd generowania bramy z szablonów siatek, użyty zostanie Blender: {e}")
+            return False
+        tracker.finish("brama", label)
+        return True
+
+    def _mesh_templates(self):
+        """
+        Zwraca bibliotekę szablonów siatek typu bramy, otwierając ją przy pierwszym użyciu.
+        Biblioteka uszkodzona lub wyodrębniona z innej wersji pliku .blend nie jest używana.
+
+        Returns:
+            TemplateLibrary | None: Biblioteka lub None, jeśli nie została przygotowana.
+        """
+        if not os.path.exists(self.templates_dir):
+            return None
+        with self._bounds_lock:
+            if self.templates_dir not in self._templates:
+                library = None
+                try:
+                    library = TemplateLibrary.load(self.templates_dir)
+                    if not library.is_current(self.blend_file):
+                        print(f"Szablony siatek {self.templates_dir} są nieaktualne - brama będzie generowana w Blenderze.")
+                        library = None
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Nie można wczytać szablonów siatek {self.templates_dir}: {e}")
+                self._templates[self.templates_dir] = library
+            return self._templates[self.templates_dir]
+
+    def _run_gate(self, worker, path, options_path, workspace, files, tracker):
+        """
+        Generuje model bramy i szyn oraz plik gate_data.json z obrysem bramy.
+
+        Args:
+            worker (BlenderWorker): Proces Blendera wykonujący zlecenie.
+            path (str): Ścieżka do katalogu głównego zasobów.
+            options_path (str): Plik konfiguracji bramy w katalogu roboczym.
+            workspace (str): Katalog roboczy, do którego trafiają pliki wynikowe.
+            files (dict): Ścieżki plików wynikowych w katalogu roboczym.
+            tracker (_RenderProgress): Postęp renderowania.
+        """
+        self._check_cancelled()
+        label = "Brama"
+        worker.run_job(self.blend_file, self.script_file, [path, options_path, workspace + os.sep],
+                       [files["model.obj"], files["szyny.obj"]], tracker.job("brama", label), owner=self)
+        tracker.finish("brama", label)
+
+    def _run_addons(self, worker, path, options_path, gate_data_path, files, tracker):
+        """
+        Generuje dodatki (klamka, okna, kratka, drzwi) dopasowane do podanego obrysu bramy.
+
+        Args:
+            worker (BlenderWorker): Proces Blendera wykonujący zlecenie.
+            path (str): Ścieżka do katalogu głównego zasobów.
+            options_path (str): Plik konfiguracji bramy w katalogu roboczym.
+            gate_data_path (str): Plik z obrysem bramy (format gate_data.json).
+            files (dict): Ścieżki plików wynikowych w katalogu roboczym.
+            tracker (_RenderProgress): Postęp renderowania.
+        """
+        self._check_cancelled()
+        label = "Dodatki"
+        worker.run_job(
+            self.blend_file_d, self.script_file_d,
+            [path, gate_data_path, options_path, files["combined_addons.obj"]],
+            [files["combined_addons.obj"]], tracker.job("dodatki", label), owner=self,
+        )
+        tracker.finish("dodatki", label)
+
+    @staticmethod
+    def _create_workspace():
+        """
+        Tworzy katalog roboczy renderowania obok plików modelu, aby przeniesienie wyników
+        (os.replace) odbywało się w obrębie jednego systemu plików.
+
+        Returns:
+            str: Ścieżka do katalogu roboczego.
+        """
+        return tempfile.mkdtemp(prefix=".job-", dir=get_resource_path("application/generator"))
+
+    @classmethod
+    def _promote(cls, files, model_files):
+        """
+        Przenosi pliki z katalogu roboczego w miejsce plików wyświetlanych w aplikacji (os.replace).
+        Cały komplet jest podmieniany pod blokadą, aby równoczesne renderowania nie przeplatały swoich wyników.
+
+        Args:
+            files (dict): {nazwa pliku: ścieżka w katalogu roboczym}.
+            model_files (dict): {nazwa pliku: ścieżka docelowa}.
+        """
+        with cls._promote_lock:
+            for name, source in files.items():
+                os.replace(source, model_files[name])
+
+    def _check_cancelled(self):
+        """Zgłasza BlenderJobCancelled, jeśli renderowanie zostało anulowane."""
+        if self._cancel.is_set():
+            raise BlenderJobCancelled("Renderowanie zostało anulowane.")
+
+    def _fingerprint(self):
+        """Zwraca wersję szablonów .blend i skryptów generatora (część klucza pamięci podręcznej)."""
+        return file_fingerprint([self.blend_file, self.script_file, self.blend_file_d, self.script_file_d,
+                                 os.path.join(self.templates_dir, "manifest.json")])
+
+    @classmethod
+    def _model_cache(cls):
+        """Zwraca wspólną pamięć podręczną modeli."""
+        with cls._bounds_lock:
+            if cls._cache is None:
+                cls._cache = ModelCache()
+            return cls._cache
+
+    @staticmethod
+    def _read_gate_data(gate_data_path):
+        """
+        Odczytuje obrys bramy zapisany przez generator.
+
+        Returns:
+            dict | None: Obrys bramy lub None, jeśli plik nie istnieje lub jest niepoprawny.
+        """
+        try:
+            with open(gate_data_path, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
 
     @staticmethod
     def read_json(json_path):
@@ -0,0 +1,538 @@
+"""
+Generowanie modeli bram bez Blendera - w czystym Pythonie z NumPy.
+
+Skrypty generatorów w Blenderze składają bramę z kopii segmentu-szablonu zapisanego w pliku .blend:
+rozciągają go, układają kolejne kopie jedna nad drugą (lub obok siebie), ostatnią przycinają
+płaszczyzną (bmesh.ops.bisect_plane), łączą kopie w jeden obiekt i dopasowują do niego szyny.
+Ten moduł odtwarza te same operacje na siatkach szablonów wyodrębnionych wcześniej z plików .blend
+(template_library),
+dzięki czemu model bramy (model.obj, model.mtl, szyny.obj i gate_data.json) powstaje w milisekundach.
+
+Obsługiwane są bramy segmentowe, uchylne (układ poziomy, pionowy i START) oraz roletowe.
+Pozostałe konfiguracje (brama rozwierana ze skrzydłami obracanymi wokół zawiasów, układy "Jodełka")
+są generowane w Blenderze (supports() zwraca dla nich False).
+"""
+import json
+import math
+
+import numpy as np
+
+# Obrót o -90 stopni wokół osi X stosowany przy eksporcie (układ Blendera Z-up -> układ widoku Y-up)
+EXPORT_ROTATION = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]])
+BISECT_EPSILON = 1e-9  # Odległość od płaszczyzny cięcia, poniżej której wierzchołek leży na płaszczyźnie
+
+SEGMENTOWA_PANELS = {
+    "Bez przetłoczenia": "Cube",
+    "Niskie": "Cube.001",
+    "Średnie": "Cube.002",
+    "Kasetony": "Cube.003",
+    "START": "Cube.004",
+}
+SEGMENTOWA_PANEL_SIZE = 0.4  # Szerokość i wysokość segmentu bramy segmentowej w metrach
+UCHYLNA_PANELS = {"Poziome": "Cube.002", "Pionowe": "Cube.003", "START": "Cube.004"}
+ROLETOWA_PROFILES = {"77 mm": "seg1", "100 mm": "seg2", "START": "seg0"}
+# Położenie płaszczyzny cięcia ostatniego profilu rolety: -1 + pozostała wysokość * 10 * współczynnik
+ROLETOWA_CUT_FACTORS = {"seg2": 2.0}
+ROLETOWA_DEFAULT_CUT_FACTOR = 2.597
+RAIL_TEMPLATE = "szyny-na-brame"
+RAIL_SCALE_MARGIN = 0.001  # Naddatek skali szyn względem bramy (jak w skryptach Blendera)
+
+
+class MeshObject:
+    """
+    Odpowiednik obiektu siatki Blendera: wierzchołki w układzie lokalnym, wielokąty, współrzędne UV
+    (po jednej parze na narożnik wielokąta) oraz transformacja obiektu (położenie, obrót, skala).
+
+    Wielokąty są zapisane w postaci skompresowanej: loops to indeksy wierzchołków wszystkich
+    wielokątów po kolei, a face_start[i]:face_start[i + 1] to zakres narożników wielokąta i.
+    """
+
+    def __init__(self, vertices, loops, face_start, uvs=None, location=(0.0, 0.0, 0.0), rotation=None,
+                 scale=(1.0, 1.0, 1.0)):
+        """
+        Inicjalizuje obiekt.
+
+        Args:
+            vertices (array): Wierzchołki (N, 3) w układzie lokalnym.
+            loops (array): Indeksy wierzchołków narożników wielokątów (L,).
+            face_start (array): Początki wielokątów w loops (F + 1,).
+            uvs (array, optional): Współrzędne UV narożników (L, 2) lub None.
+            location (Iterable[float]): Położenie obiektu.
+            rotation (array, optional): Macierz obrotu 3x3; domyślnie macierz jednostkowa.
+            scale (Iterable[float]): Skala obiektu.
+        """
+        self.vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        self.loops = np.asarray(loops, dtype=np.int64)
+        self.face_start = np.asarray(face_start, dtype=np.int64)
+        self.uvs = None if uvs is None else np.asarray(uvs, dtype=float).reshape(-1, 2)
+        self.location = np.array(location, dtype=float)
+        self.rotation = np.eye(3) if rotation is None else np.array(rotation, dtype=float)
+        self.scale = np.array(scale, dtype=float)
+
+    def copy(self):
+        """Zwraca kopię obiektu wraz z kopią siatki (obj.copy() i obj.data.copy() w Blenderze)."""
+        return MeshObject(self.vertices.copy(), self.loops.copy(), self.face_start.copy(),
+                          None if self.uvs is None else self.uvs.copy(),
+                          self.location, self.rotation, self.scale)
+
+    @property
+    def face_count(self):
+        """Liczba wielokątów."""
+        return len(self.face_start) - 1
+
+    @property
+    def bounds_size(self):
+        """Rozmiar prostopadłościanu otaczającego siatkę w układzie lokalnym."""
+        if not len(self.vertices):
+            return np.zeros(3)
+        return self.vertices.max(axis=0) - self.vertices.min(axis=0)
+
+    @property
+    def dimensions(self):
+        """Wymiary obiektu (Object.dimensions w Blenderze): rozmiar siatki przemnożony przez skalę."""
+        return self.bounds_size * np.abs(self.scale)
+
+    def set_dimension(self, axis, value):
+        """
+        Ustawia wymiar obiektu w danej osi, zmieniając skalę (Object.dimensions[axis] = value).
+
+        Args:
+            axis (int): Oś (0 - X, 1 - Y, 2 - Z).
+            value (float): Wymiar w metrach.
+        """
+        size = self.bounds_size[axis]
+        if size > 0:
+            self.scale[axis] = math.copysign(value / size, self.scale[axis])
+
+    def matrix_world(self):
+        """Zwraca macierz 4x4 transformacji obiektu (położenie @ obrót @ skala)."""
+        matrix = np.eye(4)
+        matrix[:3, :3] = self.rotation * self.scale
+        matrix[:3, 3] = self.location
+        return matrix
+
+    def world_vertices(self, matrix=None):
+        """
+        Zwraca wierzchołki w układzie świata (lub przekształcone podaną macierzą 4x4).
+        """
+        matrix = self.matrix_world() if matrix is None else matrix
+        return self.vertices @ matrix[:3, :3].T + matrix[:3, 3]
+
+    def _triangles(self):
+        """
+        Zwraca indeksy wierzchołków trójkątów wachlarzowego podziału wielokątów oraz numer wielokąta
+        każdego trójkąta.
+        """
+        sizes = np.diff(self.face_start)
+        counts = np.maximum(sizes - 2, 0)
+        face = np.repeat(np.arange(len(sizes)), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        start = self.face_start[face]
+        return self.loops[start], self.loops[start + 1 + offset], self.loops[start + 2 + offset], face
+
+    def volume_center(self):
+        """
+        Zwraca środek objętości siatki w układzie lokalnym (ORIGIN_CENTER_OF_VOLUME w Blenderze).
+        Dla siatek bez objętości zwracana jest średnia wierzchołków.
+        """
+        a, b, c, _ = self._triangles()
+        va, vb, vc = self.vertices[a], self.vertices[b], self.vertices[c]
+        volumes = np.einsum("ij,ij->i", va, np.cross(vb, vc))  # Sześciokrotne objętości czworościanów
+        total = volumes.sum()
+        if abs(total) < 1e-15:
+            return self.vertices.mean(axis=0) if len(self.vertices) else np.zeros(3)
+        return (volumes[:, None] * (va + vb + vc)).sum(axis=0) * 0.25 / total
+
+    def origin_to_volume_center(self):
+        """Przenosi punkt odniesienia obiektu do środka objętości siatki, nie zmieniając jej położenia w świecie."""
+        center = self.volume_center()
+        self.vertices = self.vertices - center
+        self.location = self.location + (self.rotation * self.scale) @ center
+
+    def apply_scale(self):
+        """Nanosi skalę obiektu na siatkę (transform_apply(scale=True))."""
+        self.vertices = self.vertices * self.scale
+        self.scale = np.ones(3)
+
+    def polygon_normals(self):
+        """Zwraca znormalizowane wektory normalne wielokątów w układzie lokalnym."""
+        a, b, c, face = self._triangles()
+        va = self.vertices[a]
+        normals = np.zeros((self.face_count, 3))
+        np.add.at(normals, face, np.cross(self.vertices[b] - va, self.vertices[c] - va))
+        lengths = np.linalg.norm(normals, axis=1)
+        lengths[lengths == 0] = 1.0
+        return normals / lengths[:, None]
+
+    def bisect(self, plane_co, plane_no):
+        """
+        Przycina siatkę płaszczyzną, usuwając część po stronie wektora normalnego, i zamyka
+        powstałe otwory wielokątami leżącymi w płaszczyźnie cięcia
+        (bmesh.ops.bisect_plane(clear_outer=True) i bmesh.ops.contextual_create).
+
+        Args:
+            plane_co (Iterable[float]): Punkt płaszczyzny w układzie lokalnym.
+            plane_no (Iterable[float]): Wektor normalny płaszczyzny.
+        """
+        normal = np.asarray(plane_no, dtype=float)
+        normal = normal / np.linalg.norm(normal)
+        distance = (self.vertices - np.asarray(plane_co, dtype=float)) @ normal
+        side = np.where(distance > BISECT_EPSILON, 1, np.where(distance < -BISECT_EPSILON, -1, 0))
+
+        vertices = list(self.vertices)
+        on_plane = list(side == 0)
+        split = {}  # (wierzchołek, wierzchołek) -> nowy wierzchołek na przeciętej krawędzi
+        loops, uvs, face_start = [], [], [0]
+
+        for f in range(self.face_count):
+            start, end = self.face_start[f], self.face_start[f + 1]
+            face = self.loops[start:end]
+            face_side = side[face]
+            if (face_side <= 0).all():
+                loops.extend(face)
+                if self.uvs is not None:
+                    uvs.extend(self.uvs[start:end])
+                face_start.append(len(loops))
+                continue
+            if (face_side >= 0).all():
+                continue
+
+            clipped, clipped_uvs = [], []
+            count = len(face)
+            for k in range(count):
+                a, b = face[k], face[(k + 1) % count]
+                if side[a] <= 0:
+                    clipped.append(a)
+                    if self.uvs is not None:
+                        clipped_uvs.append(self.uvs[start + k])
+                if side[a] * side[b] < 0:
+                    t = distance[a] / (distance[a] - distance[b])
+                    key = (min(a, b), max(a, b))
+                    if key not in split:
+                        split[key] = len(vertices)
+                        vertices.append(self.vertices[a] + t * (self.vertices[b] - self.vertices[a]))
+                        on_plane.append(True)
+                    clipped.append(split[key])
+                    if self.uvs is not None:
+                        uv_a, uv_b = self.uvs[start + k], self.uvs[start + (k + 1) % count]
+                        clipped_uvs.append(uv_a + t * (uv_b - uv_a))
+            if len(clipped) >= 3:
+                loops.extend(clipped)
+                uvs.extend(clipped_uvs)
+                face_start.append(len(loops))
+
+        loops, uvs = self._cap_cut(loops, uvs, face_start, np.array(on_plane))
+        self._set_mesh(np.array(vertices), loops, face_start, uvs)
+
+    def _cap_cut(self, loops, uvs, face_start, on_plane):
+        """
+        Dodaje wielokąty zamykające otwory po cięciu: krawędzie brzegowe leżące w płaszczyźnie cięcia
+        są łączone w pętle o kierunku przeciwnym do sąsiednich wielokątów.
+        """
+        loops = np.asarray(loops, dtype=np.int64)
+        starts = np.asarray(face_start, dtype=np.int64)
+        sizes = np.diff(starts)
+        following = np.arange(len(loops)) + 1
+        following[starts[1:] - 1] = starts[:-1]  # Ostatni narożnik wielokąta łączy się z pierwszym
+        edges = set(zip(loops.tolist(), loops[following].tolist()))
+
+        boundary = {}
+        for a, b in edges:
+            if (b, a) not in edges and on_plane[a] and on_plane[b]:
+                boundary[b] = a  # Wielokąt zamykający przechodzi krawędź w przeciwnym kierunku
+
+        loops, uvs = list(loops), list(uvs)
+        while boundary:
+            first, current = next(iter(boundary.items()))
+            cap = [first]
+            del boundary[first]
+            while current != first and current in boundary:
+                cap.append(current)
+                current = boundary.pop(current)
+            if current == first and len(cap) >= 3:
+                loops.extend(cap)
+                if self.uvs is not None:
+                    uvs.extend([np.zeros(2)] * len(cap))
+                face_start.append(len(loops))
+        return loops, uvs
+
+    def _set_mesh(self, vertices, loops, face_start, uvs):
+        """Zastępuje siatkę obiektu, usuwając wierzchołki nienależące do żadnego wielokąta."""
+        loops = np.asarray(loops, dtype=np.int64)
+        used = np.zeros(len(vertices), dtype=bool)
+        used[loops] = True
+        remap = np.cumsum(used) - 1
+        self.vertices = vertices[used]
+        self.loops = remap[loops]
+        self.face_start = np.asarray(face_start, dtype=np.int64)
+        self.uvs = None if self.uvs is None else np.asarray(uvs, dtype=float).reshape(-1, 2)
+
+    @classmethod
+    def join(cls, objects):
+        """
+        Łączy obiekty w jeden (bpy.ops.object.join) - siatki pozostałych obiektów są przenoszone
+        do układu lokalnego pierwszego (aktywnego) obiektu, który zachowuje swoją transformację.
+
+        Args:
+            objects (list): Obiekty MeshObject; pierwszy jest obiektem aktywnym.
+
+        Returns:
+            MeshObject: Połączony obiekt.
+        """
+        if not objects:
+            raise ValueError("Brak obiektów do połączenia.")
+        active = objects[0]
+        inverse = np.linalg.inv(active.matrix_world())
+        vertices, loops, face_start, uvs = [], [], [np.zeros(1, dtype=np.int64)], []
+        vertex_offset = loop_offset = 0
+        for obj in objects:
+            vertices.append(obj.world_vertices(inverse @ obj.matrix_world()))
+            loops.append(obj.loops + vertex_offset)
+            face_start.append(obj.face_start[1:] + loop_offset)
+            if obj.uvs is not None:
+                uvs.append(obj.uvs)
+            elif active.uvs is not None:
+                uvs.append(np.zeros((len(obj.loops), 2)))
+            vertex_offset += len(obj.vertices)
+            loop_offset += len(obj.loops)
+        return cls(np.concatenate(vertices), np.concatenate(loops), np.concatenate(face_start),
+                   np.concatenate(uvs) if active.uvs is not None else None,
+                   active.location, active.rotation, active.scale)
+
+    def write_obj(self, path, object_name, mtl_file=None):
+        """
+        Zapisuje obiekt do pliku .obj w tym samym formacie co eksport skryptów generatorów:
+        współrzędne świata obrócone o -90 stopni wokół osi X, normalne wielokątów i UV narożników.
+
+        Args:
+            path (str): Ścieżka do pliku .obj.
+            object_name (str): Nazwa obiektu zapisywana w komentarzu.
+            mtl_file (str, optional): Nazwa pliku .mtl - podana dla modelu bramy z materiałem BramaMaterial.
+        """
+        matrix = np.eye(4)
+        matrix[:3, :3] = EXPORT_ROTATION
+        coords = self.world_vertices(matrix @ self.matrix_world()).tolist()
+        normals = (self.polygon_normals() @ EXPORT_ROTATION.T).tolist() if self.face_count else []
+
+        lines = [f"mtllib {mtl_file}"] if mtl_file else []
+        lines.append("# Exported from Blender with rotation -90 degrees in X-axis")
+        lines.append(f"# Object: {object_name}\n")
+        lines.extend(f"v {x} {y} {z}" for x, y, z in coords)
+        lines.extend(f"vn {x} {y} {z}" for x, y, z in normals)
+        if self.uvs is not None:
+            lines.extend(f"vt {u} {v}" for u, v in self.uvs.tolist())
+        if mtl_file:
+            lines.append("usemtl BramaMaterial")
+
+        loops = (self.loops + 1).tolist()
+        starts = self.face_start.tolist()
+        with_uv = mtl_file is not None or self.uvs is not None
+        for f in range(self.face_count):
+            if with_uv:
+                corners = (f"{loops[i]}/{i + 1}/{loops[i]}" for i in range(starts[f], starts[f + 1]))
+            else:
+                corners = (str(loops[i]) for i in range(starts[f], starts[f + 1]))
+            lines.append(f"f {' '.join(corners)}")
+
+        with open(path, "w") as obj_file:
+            obj_file.write("\n".join(lines) + "\n")
+
+
+def supports(gate_type, config):
+    """
+    Sprawdza, czy konfigurację można wygenerować bez Blendera.
+
+    Args:
+        gate_type (str): Typ bramy, np. "Brama Segmentowa".
+        config (dict): Konfiguracja bramy (format selected_options.json).
+
+    Returns:
+        bool: True, jeśli generate() obsługuje konfigurację.
+    """
+    dimensions = config.get("Wymiary") or {}
+    if not dimensions.get("Szerokość") or not dimensions.get("Wysokość"):
+        return False
+    if gate_type == "Brama Segmentowa":
+        return (config.get("Rodzaj przetłoczenia") or "START") in SEGMENTOWA_PANELS
+    if gate_type == "Brama Uchylna":
+        return (config.get("Układ wypełnienia") or "START") in UCHYLNA_PANELS
+    if gate_type == "Brama Roletowa":
+        return (config.get("Wysokość profili") or "START") in ROLETOWA_PROFILES
+    return False
+
+
+def _stack_panels(panel, length, axis, step, stretch_axis, stretch):
+    """
+    Rozciąga segment w jednej osi i układa jego kopie co step w drugiej; ostatnią kopię przycina
+    płaszczyzną tak, aby łączna długość wynosiła length. Zwraca połączony obiekt.
+    """
+    first = panel.copy()
+    first.set_dimension(stretch_axis, stretch)
+
+    copies = []
+    current = 0
+    while round(current + step, 6) <= length:
+        segment = first.copy()
+        segment.location[axis] = current
+        copies.append(segment)
+        current += step
+
+    remaining = round(length - current, 6)
+    if remaining > 0.0001:
+        last = first.copy()
+        last.location[axis] = current
+        plane_co, plane_no = np.zeros(3), np.zeros(3)
+        plane_co[axis] = -(step / 2) + remaining
+        plane_no[axis] = 1.0
+        last.bisect(plane_co, plane_no)
+        copies.append(last)
+    return MeshObject.join(copies)
+
+
+def _segmentowa(templates, width, height, config):
+    """Buduje bramę segmentową (odpowiednik scale_stack_and_align_rails z generator_segmentowa.py)."""
+    przetloczenie = config.get("Rodzaj przetłoczenia") or "START"
+    panel = templates[SEGMENTOWA_PANELS[przetloczenie]]
+    size = SEGMENTOWA_PANEL_SIZE
+
+    if przetloczenie != "Kasetony":
+        gate = _stack_panels(panel, height, 2, size, 0, width)
+    else:
+        count_x = max(1, int(width // size))
+        count_z = max(1, int(height // size))
+        unit_width = round(width / count_x, 3)
+        unit_height = round(height / count_z, 3)
+        copies = []
+        for row in range(count_z):
+            for col in range(count_x):
+                segment = panel.copy()
+                segment.scale[0] = unit_width / panel.dimensions[0]
+                segment.scale[2] = unit_height / panel.dimensions[2]
+                segment.location[0] = col * unit_width
+                segment.location[2] = row * unit_height
+                copies.append(segment)
+        gate = MeshObject.join(copies)
+
+    gate.origin_to_volume_center()
+    gate.location = np.array([0.0, 0.0, gate.dimensions[2] / 2])
+    return gate
+
+
+def _uchylna(templates, width, height, config):
+    """Buduje bramę uchylną (odpowiednik tilt_gate z generator_uchylna.py)."""
+    wypelnienie = config.get("Układ wypełnienia") or "START"
+    panel = templates[UCHYLNA_PANELS[wypelnienie]]
+    if wypelnienie == "Pionowe":
+        gate = _stack_panels(panel, width, 0, panel.dimensions[0], 2, height)
+    else:
+        gate = _stack_panels(panel, height, 2, panel.dimensions[2], 0, width)
+
+    gate.origin_to_volume_center()
+    gate.location = np.array([0.0, 0.0, gate.dimensions[2] / 2])
+    return gate
+
+
+def _roletowa(templates, width, height, config):
+    """Buduje bramę roletową (odpowiednik tilt_gate z generator_roletowa.py)."""
+    name = ROLETOWA_PROFILES[config.get("Wysokość profili") or "START"]
+    profile = templates[name]
+    profile_height = round(profile.dimensions[2], 3)
+
+    base = profile.copy()
+    base.location = np.array([0.0, 0.0, profile_height / 2])
+    base.set_dimension(0, width)
+    base.origin_to_volume_center()
+
+    copies = [base]
+    current = profile_height
+    while round(current + profile_height, 6) <= height:
+        segment = base.copy()
+        segment.location[2] = current + profile_height / 2
+        copies.append(segment)
+        current += profile_height
+
+    remaining = round(height - current, 3)
+    if remaining > 0:
+        last = base.copy()
+        last.location[2] = current + last.dimensions[2] / 2
+        factor = ROLETOWA_CUT_FACTORS.get(name, ROLETOWA_DEFAULT_CUT_FACTOR)
+        last.bisect((0.0, 0.0, -1 + remaining * 10 * factor), (0.0, 0.0, 1.0))
+        copies.append(last)
+
+    gate = MeshObject.join(copies)
+    gate.origin_to_volume_center()
+    return gate
+
+
+GATE_BUILDERS = {
+    "Brama Segmentowa": _segmentowa,
+    "Brama Uchylna": _uchylna,
+    "Brama Roletowa": _roletowa,
+}
+
+
+def _align_rails(gate, rail_template):
+    """
+    Dopasowuje szyny do wymiarów bramy i ustawia dolne krawędzie bramy i szyn na Z = 0
+    (odpowiednik add_and_align_rails ze skryptów generatorów).
+    """
+    rail = rail_template.copy()
+    rail.scale[0] = gate.dimensions[0] / rail_template.dimensions[0] + RAIL_SCALE_MARGIN
+    rail.scale[2] = gate.dimensions[2] / rail_template.dimensions[2] + RAIL_SCALE_MARGIN
+    rail.location = gate.location.copy()
+    rail.origin_to_volume_center()
+    rail.location[2] = rail.dimensions[2] / 2
+    gate.location[2] = gate.dimensions[2] / 2
+    return rail
+
+
+def build(gate_type, config, templates):
+    """
+    Buduje obiekty bramy i szyn.
+
+    Args:
+        gate_type (str): Typ bramy obsługiwany przez supports().
+        config (dict): Konfiguracja bramy.
+        templates (TemplateLibrary): Szablony z pliku .blend typu bramy.
+
+    Returns:
+        tuple: (brama, szyny) jako obiekty MeshObject.
+    """
+    dimensions = config["Wymiary"]
+    width, height = dimensions["Szerokość"] / 1000, dimensions["Wysokość"] / 1000
+    gate = GATE_BUILDERS[gate_type](templates, width, height, config)
+    rail = _align_rails(gate, templates[RAIL_TEMPLATE])
+    gate.origin_to_volume_center()
+    gate.apply_scale()
+    return gate, rail
+
+
+def generate(gate_type, config, templates, output_dir, gate_data_path, texture):
+    """
+    Generuje pliki modelu bramy tak jak skrypt generatora w Blenderze.
+
+    Args:
+        gate_type (str): Typ bramy obsługiwany przez supports().
+        config (dict): Konfiguracja bramy.
+        templates (TemplateLibrary): Szablony z pliku .blend typu bramy.
+        output_dir (str): Katalog plików model.obj, model.mtl i szyny.obj (zakończony separatorem).
+        gate_data_path (str): Ścieżka pliku z obrysem bramy (gate_data.json).
+        texture (str): Ścieżka tekstury koloru wpisywana w pliku .mtl.
+
+    Returns:
+        dict: Obrys bramy zapisany w gate_data.json.
+    """
+    gate, rail = build(gate_type, config, templates)
+
+    with open(output_dir + "model.mtl", "w") as mtl_file:
+        mtl_file.write("# Material file for brama-koniec\n")
+        mtl_file.write("newmtl BramaMaterial\n")
+        mtl_file.write("Ka 0.2 0.2 0.2\nKd 1.0 1.0 1.0\nKs 0.5 0.5 0.5\nNs 50.0\nd 1.0\nillum 2\n")
+        mtl_file.write(f"map_Kd {texture}\n")
+    gate.write_obj(output_dir + "model.obj", "brama-koniec", "model.mtl")
+    rail.write_obj(output_dir + "szyny.obj", "szyny")
+
+    gate_data = {"location": gate.location.tolist(), "dimensions": gate.dimensions.tolist()}
+    with open(gate_data_path, "w") as json_file:
+        json.dump(gate_data, json_file)
+    return gate_data
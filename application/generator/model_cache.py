@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from application.tools.path import get_persistent_db_path
+
+# Opcje konfiguracji odczytywane przez skrypty generatorów, od których zależy geometria modelu
+GEOMETRY_OPTIONS = (
+    "Typ bramy", "Wymiary", "Rodzaj przetłoczenia", "Wysokość profili", "Ilość skrzydeł",
+    "Układ wypełnienia", "Przeszklenia", "Klamka do bramy", "Kratka wentylacyjna",
+)
+DOOR_OPTION = "Drzwi w bramie"  # Jedyna pozycja "Opcji dodatkowych" zmieniająca model
+
+
+def default_cache_dir():
+    """
+    Zwraca domyślny katalog pamięci podręcznej modeli - obok bazy danych w katalogu użytkownika.
+
+    Returns:
+        str: Ścieżka do katalogu model_cache.
+    """
+    return os.path.join(os.path.dirname(get_persistent_db_path()), "model_cache")
+
+
+def file_fingerprint(paths):
+    """
+    Zwraca skrót opisujący wersję plików (rozmiar i czas modyfikacji), np. szablonów .blend i skryptów.
+
+    Args:
+        paths (Iterable[str]): Ścieżki do plików.
+
+    Returns:
+        str: Skrót SHA-1.
+    """
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns};".encode("utf-8"))
+        except OSError:
+            digest.update(f"{os.path.basename(path)}:brak;".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def geometry_key(gate_type, config, fingerprint=""):
+    """
+    Zwraca klucz modelu: skrót opcji wpływających na geometrię bramy i dodatków.
+    Kolor nie wchodzi do klucza - jest podmieniany w pliku .mtl przy odczycie z pamięci podręcznej.
+
+    Args:
+        gate_type (str): Typ bramy, dla którego uruchamiany jest generator.
+        config (dict): Zawartość selected_options.json.
+        fingerprint (str): Wersja szablonów i skryptów generatora (file_fingerprint).
+
+    Returns:
+        str: Skrót SHA-1.
+    """
+    options = {option: config.get(option) for option in GEOMETRY_OPTIONS}
+    extras = config.get("Opcje dodatkowe")
+    options[DOOR_OPTION] = isinstance(extras, list) and DOOR_OPTION in extras
+    canonical = {"gate_type": gate_type, "options": options, "generator": fingerprint}
+    serialized = json.dumps(canonical, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def texture_path(config, resources_path):
+    """
+    Zwraca ścieżkę tekstury koloru tak samo, jak robią to skrypty generatorów.
+
+    Args:
+        config (dict): Zawartość selected_options.json.
+        resources_path (str): Ścieżka do katalogu głównego zasobów.
+
+    Returns:
+        str: Ścieżka do pliku tekstury.
+    """
+    if config.get("Kolor standardowy") is not None:
+        return f"{resources_path}jpg/Kolor_Standardowy/{config['Kolor standardowy'].strip()}.png"
+    if config.get("Kolor RAL") is not None:
+        return f"{resources_path}jpg/Kolor_RAL/{config['Kolor RAL'].strip()}.png"
+    return resources_path + "jpg/Kolor_RAL/7040.png"
+
+
+class ModelCache:
+    """
+    Pamięć podręczna wygenerowanych modeli na dysku, adresowana skrótem opcji geometrii.
+
+    Każdy wpis to katalog o nazwie klucza z kopiami plików wynikowych generatora. Wpis jest
+    najpierw budowany w katalogu tymczasowym i dopiero potem przenoszony pod docelową nazwę,
+    a pliki są odtwarzane przez zapis tymczasowy i os.replace, więc przerwany zapis nie
+    zostawia niekompletnych danych. Łączny rozmiar jest ograniczony - po przekroczeniu
+    limitu usuwane są wpisy najdawniej używane (czas modyfikacji katalogu wpisu).
+    """
+    MAX_BYTES = 512 * 1024 * 1024  # Maksymalny łączny rozmiar pamięci podręcznej
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """
+        Inicjalizuje pamięć podręczną.
+
+        Args:
+            cache_dir (str, optional): Katalog pamięci podręcznej; domyślnie default_cache_dir().
+            max_bytes (int, optional): Limit rozmiaru w bajtach; domyślnie MAX_BYTES.
+        """
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = self.MAX_BYTES if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def stats(self):
+        """
+        Zwraca liczniki pamięci podręcznej.
+
+        Returns:
+            dict: Liczba trafień, chybień, zapisów i usuniętych wpisów.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "stores": self.stores, "evictions": self.evictions}
+
+    def contains(self, key):
+        """
+        Sprawdza, czy pamięć podręczna zawiera model o podanym kluczu.
+
+        Args:
+            key (str): Klucz modelu (geometry_key).
+
+        Returns:
+            bool: True, jeśli wpis istnieje.
+        """
+        return os.path.isdir(os.path.join(self.cache_dir, key))
+
+    def restore(self, key, outputs, mtl_texture=None):
+        """
+        Odtwarza pliki modelu z pamięci podręcznej.
+
+        Args:
+            key (str): Klucz modelu (geometry_key).
+            outputs (dict): {nazwa pliku we wpisie: ścieżka docelowa}.
+            mtl_texture (str, optional): Ścieżka tekstury wpisywana w liniach map_Kd plików .mtl.
+
+        Returns:
+            bool: True, jeśli wpis istniał i wszystkie pliki zostały odtworzone.
+        """
+        entry = os.path.join(self.cache_dir, key)
+        if not all(os.path.isfile(os.path.join(entry, name)) for name in outputs):
+            with self._lock:
+                self.misses += 1
+            return False
+
+        try:
+            for name, target in outputs.items():
+                source = os.path.join(entry, name)
+                if mtl_texture is not None and name.endswith(".mtl"):
+                    with open(source, "r", encoding="utf-8") as file:
+                        lines = [f"map_Kd {mtl_texture}\n" if line.startswith("map_Kd ") else line for line in file]
+                    self._write_atomic(target, "".join(lines).encode("utf-8"))
+                else:
+                    with open(source, "rb") as file:
+                        self._write_atomic(target, file.read())
+            os.utime(entry)  # Oznacz wpis jako ostatnio używany
+        except OSError as e:
+            print(f"Błąd podczas odczytu modelu z pamięci podręcznej: {e}")
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key, outputs):
+        """
+        Zapisuje pliki modelu w pamięci podręcznej i usuwa najdawniej używane wpisy ponad limit.
+
+        Args:
+            key (str): Klucz modelu (geometry_key).
+            outputs (dict): {nazwa pliku we wpisie: ścieżka pliku wygenerowanego przez Blendera}.
+
+        Returns:
+            bool: True, jeśli wpis został zapisany.
+        """
+        entry = os.path.join(self.cache_dir, key)
+        staging = None
+        try:
+            staging = tempfile.mkdtemp(prefix=f".{key}-", dir=self.cache_dir)
+            for name, source in outputs.items():
+                shutil.copyfile(source, os.path.join(staging, name))
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                # Wpis o tym kluczu już istnieje (np. zapisany równolegle) - zastąp go nowszą wersją
+                shutil.rmtree(entry, ignore_errors=True)
+                os.rename(staging, entry)
+        except OSError as e:
+            print(f"Błąd podczas zapisu modelu w pamięci podręcznej: {e}")
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+        with self._lock:
+            self.stores += 1
+        self._evict()
+        return True
+
+    def _evict(self):
+        """Usuwa najdawniej używane wpisy, dopóki łączny rozmiar przekracza limit."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(os.path.getsize(os.path.join(path, file)) for file in os.listdir(path))
+                entries.append((os.path.getmtime(path), size, path))
+                total += size
+            except OSError:
+                continue
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    @staticmethod
+    def _write_atomic(target, data):
+        """Zapisuje plik przez plik tymczasowy w tym samym katalogu i os.replace."""
+        directory = os.path.dirname(os.path.abspath(target))
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, target)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,251 @@
+"""
+Biblioteka szablonów siatek wyodrębnionych z plików .blend (segmenty bram, szyny, elementy dodatków).
+
+Biblioteka jednego pliku .blend to katalog templates/<nazwa pliku .blend>/ zawierający:
+    vertices.npy    - wierzchołki wszystkich obiektów (float32, N x 3),
+    loops.npy       - indeksy wierzchołków narożników wielokątów, lokalne dla obiektu (int32),
+    face_start.npy  - początki wielokątów w loops.npy (int32, F + 1),
+    uvs.npy         - współrzędne UV narożników (float32, L x 2),
+    normals.npy     - normalne wielokątów (float32, F x 3),
+    manifest.json   - wersja formatu, plik źródłowy i jego skrót, sumy kontrolne tablic
+                      oraz zakresy tablic i transformacja każdego obiektu.
+
+Tablice są mapowane do pamięci, więc odczyt szablonu nie wymaga wczytania całej biblioteki.
+
+Bibliotekę tworzy się jednorazowo (po każdej zmianie plików .blend) poleceniem:
+
+    python -m application.generator.template_library --blender <ścieżka do Blendera>
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from application.generator.mesh_generator import MeshObject
+
+GENERATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATES_DIR = os.path.join(GENERATOR_DIR, "templates")
+EXTRACT_SCRIPT = os.path.join(GENERATOR_DIR, "extract_templates.py")
+# Pliki .blend z szablonami, względem application/generator
+BLEND_FILES = (
+    "Segmentowa/segmentowa_kopia3.blend",
+    "Uchylna/uchylna5.blend",
+    "Roletowa/roletowa7.blend",
+    "Rozwierana/rozwierana3.blend",
+    "dodatki/uchylna11.blend",
+)
+ARRAYS = ("vertices", "loops", "face_start", "uvs", "normals")
+
+
+def file_sha1(path):
+    """
+    Zwraca skrót SHA-1 zawartości pliku.
+
+    Args:
+        path (str): Ścieżka do pliku.
+
+    Returns:
+        str: Skrót SHA-1.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def library_path(blend_file):
+    """
+    Zwraca katalog biblioteki szablonów pliku .blend.
+
+    Args:
+        blend_file (str): Ścieżka do pliku .blend.
+
+    Returns:
+        str: Ścieżka katalogu templates/<nazwa pliku .blend>.
+    """
+    return os.path.join(TEMPLATES_DIR, os.path.splitext(os.path.basename(blend_file))[0])
+
+
+class TemplateLibrary:
+    """
+    Szablony siatek jednego pliku .blend, dostępne jak słownik {nazwa obiektu: MeshObject}.
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, path, manifest, arrays):
+        """
+        Args:
+            path (str): Katalog biblioteki.
+            manifest (dict): Zawartość manifest.json.
+            arrays (dict): {nazwa tablicy: np.ndarray} (zwykle mapowane do pamięci).
+        """
+        self.path = path
+        self.manifest = manifest
+        self.arrays = arrays
+        self.objects = manifest["objects"]
+
+    @classmethod
+    def load(cls, path, verify=True):
+        """
+        Otwiera bibliotekę szablonów, mapując tablice do pamięci.
+
+        Args:
+            path (str): Katalog biblioteki.
+            verify (bool): Czy sprawdzić sumy kontrolne tablic.
+
+        Returns:
+            TemplateLibrary: Otwarta biblioteka.
+
+        Raises:
+            ValueError: Jeśli format jest nieobsługiwany lub suma kontrolna tablicy się nie zgadza.
+            OSError: Jeśli brakuje plików biblioteki.
+        """
+        with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("format") != cls.FORMAT_VERSION:
+            raise ValueError(f"Nieobsługiwany format biblioteki szablonów: {manifest.get('format')}")
+
+        arrays = {}
+        for name in ARRAYS:
+            file_name = f"{name}.npy"
+            array_path = os.path.join(path, file_name)
+            if verify and file_sha1(array_path) != manifest["files"].get(file_name):
+                raise ValueError(f"Niezgodna suma kontrolna pliku {array_path}")
+            arrays[name] = np.load(array_path, mmap_mode="r")
+        return cls(path, manifest, arrays)
+
+    def is_current(self, blend_file):
+        """
+        Sprawdza, czy biblioteka została wyodrębniona z obecnej wersji pliku .blend.
+
+        Args:
+            blend_file (str): Ścieżka do pliku .blend.
+
+        Returns:
+            bool: True, jeśli skrót pliku zgadza się z zapisanym w manifeście.
+        """
+        try:
+            return file_sha1(blend_file) == self.manifest.get("source_sha1")
+        except OSError:
+            return False
+
+    def names(self):
+        """Zwraca nazwy obiektów biblioteki."""
+        return list(self.objects)
+
+    def __contains__(self, name):
+        return name in self.objects
+
+    def __getitem__(self, name):
+        """
+        Zwraca szablon obiektu jako nowy MeshObject.
+
+        Raises:
+            KeyError: Jeśli biblioteka nie zawiera obiektu.
+        """
+        entry = self.objects[name]
+        vertex_start, vertex_end = entry["vertices"]
+        face_begin, face_end = entry["faces"]
+        face_start = np.asarray(self.arrays["face_start"][face_begin:face_end + 1], dtype=np.int64)
+        loop_begin, loop_end = face_start[0], face_start[-1]
+        return MeshObject(
+            self.arrays["vertices"][vertex_start:vertex_end],
+            self.arrays["loops"][loop_begin:loop_end],
+            face_start - loop_begin,
+            self.arrays["uvs"][loop_begin:loop_end] if entry["uvs"] else None,
+            entry["location"], entry["rotation"], entry["scale"],
+        )
+
+    def normals(self, name):
+        """
+        Zwraca normalne wielokątów obiektu zapisane przez Blendera.
+
+        Args:
+            name (str): Nazwa obiektu.
+
+        Returns:
+            np.ndarray: Normalne (F x 3) w układzie lokalnym obiektu.
+        """
+        face_begin, face_end = self.objects[name]["faces"]
+        return self.arrays["normals"][face_begin:face_end]
+
+
+def extract(blender_path, blend_files=BLEND_FILES, output_dir=TEMPLATES_DIR):
+    """
+    Wyodrębnia szablony z plików .blend, uruchamiając dla każdego z nich Blendera
+    ze skryptem extract_templates.py. Biblioteka jest budowana w katalogu tymczasowym
+    i podmieniana dopiero po sprawdzeniu, że daje się otworzyć.
+
+    Args:
+        blender_path (str): Ścieżka do pliku wykonywalnego Blendera.
+        blend_files (Iterable[str]): Pliki .blend względem application/generator.
+        output_dir (str): Katalog bibliotek szablonów.
+
+    Returns:
+        list: Ścieżki utworzonych bibliotek.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    libraries = []
+    for source in blend_files:
+        blend_file = os.path.join(GENERATOR_DIR, source)
+        target = os.path.join(output_dir, os.path.splitext(os.path.basename(source))[0])
+        staging = tempfile.mkdtemp(prefix=".templates-", dir=output_dir)
+        try:
+            subprocess.run(
+                [blender_path, "--background", blend_file, "--python", EXTRACT_SCRIPT, "--", staging, source],
+                check=True,
+            )
+            library = TemplateLibrary.load(staging)
+            print(f"{source}: {len(library.names())} obiektów", file=sys.stderr)
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        libraries.append(target)
+    return libraries
+
+
+def check(blend_files=BLEND_FILES, output_dir=TEMPLATES_DIR):
+    """
+    Sprawdza sumy kontrolne bibliotek i ich zgodność z plikami .blend.
+
+    Returns:
+        bool: True, jeśli wszystkie biblioteki są kompletne i aktualne.
+    """
+    valid = True
+    for source in blend_files:
+        path = os.path.join(output_dir, os.path.splitext(os.path.basename(source))[0])
+        try:
+            library = TemplateLibrary.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"{source}: {e}", file=sys.stderr)
+            valid = False
+            continue
+        if not library.is_current(os.path.join(GENERATOR_DIR, source)):
+            print(f"{source}: biblioteka nieaktualna - plik .blend został zmieniony", file=sys.stderr)
+            valid = False
+        else:
+            print(f"{source}: {len(library.names())} obiektów, OK", file=sys.stderr)
+    return valid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wyodrębnianie szablonów siatek z plików .blend.")
+    parser.add_argument("--blender", help="Ścieżka do Blendera; bez niej biblioteki są tylko sprawdzane.")
+    parser.add_argument("--output", default=TEMPLATES_DIR, help="Katalog bibliotek szablonów.")
+    args = parser.parse_args(argv)
+
+    if args.blender:
+        extract(args.blender, output_dir=args.output)
+    return 0 if check(output_dir=args.output) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
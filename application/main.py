@@ -1,7 +1,10 @@
 import sys
-import sqlite3
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QLabel
+from application.DatabaseManager import DatabaseManager
+from application.DatabaseWorker import DatabaseWorker
+from application.ModelPrewarmer import ModelPrewarmer
+from application.generator.blender_worker import BlenderWorker
 from application.view.Formularz_kontaktowy import ContactForm
 from application.view.Kreator import Kreator
 from application.view.Okno_startowe import OknoStartowe
@@ -91,7 +94,8 @@ class MainApplication(QMainWindow):
         self.start_view.create_new_button.clicked.connect(
             lambda: self.navigate_to_gate_selection_view()
         )
-        self.start_view.open_saved_button.clicked.connect(
+        # Przejście następuje dopiero po wczytaniu projektu z bazy przez wątek bazy danych
+        self.start_view.project_loaded.connect(
             lambda: self.navigate_to_dimension_view(is_opened_project=True)
         )
 
@@ -189,35 +193,31 @@ class MainApplication(QMainWindow):
         """
         Przechodzi do widoku formularza kontaktowego.
         """
-        # Sprawdzenie, czy użytkownik podał nazwę projektu
-        project_name_provided = self.gate_creator_view.validate_and_proceed()
-        if project_name_provided:  # Jeśli nazwa została poprawnie podana
-            self.previous_index = self.stack.currentWidget()
-            self.stack.setCurrentIndex(self.VIEW_INDICES["contact_form"])
-        else:
-            print("Przejście anulowane. Brak nazwy projektu.")
+        # Przejście następuje dopiero po zapisaniu projektu w bazie danych
+        self.gate_creator_view.validate_and_proceed(on_finished=self._show_contact_form_view)
+
+    def _show_contact_form_view(self, saved):
+        """
+        Wyświetla formularz kontaktowy po zapisaniu projektu.
+
+        Args:
+            saved (bool): Czy projekt został zapisany w bazie danych.
+        """
+        if not saved:
+            print("Przejście anulowane. Projekt nie został zapisany.")
+            return
+        self.previous_index = self.stack.currentWidget()
+        self.stack.setCurrentIndex(self.VIEW_INDICES["contact_form"])
 
     def initialize_database(self):
         """
         Inicjalizuje połączenie z bazą danych.
 
         Upewnia się, że plik bazy danych istnieje, i ustanawia niezbędne
-        połączenie dla funkcjonalności aplikacji.
-        """
-        if not os.path.exists(self.DB_FILE):
-            print("Baza danych nie istnieje. Tworzenie bazy...")
-            try:
-                conn = sqlite3.connect(self.DB_FILE)
-                path = get_resource_path('models/db-model.sql')
-                with open(path, 'r', encoding='utf-8') as file:
-                    sql_commands = file.read()
-                    conn.executescript(sql_commands)
-                conn.close()
-                print("Baza danych została utworzona pomyślnie.")
-            except (sqlite3.Error, IOError) as e:
-                print(f"Błąd podczas tworzenia bazy danych: {e}")
-        else:
-            print("Baza danych już istnieje.")
+        połączenie dla funkcjonalności aplikacji. Następnie wykonuje brakujące
+        migracje schematu.
+        """
+        DatabaseManager().initialize_database()
 
 def load_stylesheet(app, file_path):
     """
@@ -245,7 +245,10 @@ def load_stylesheet(app, file_path):
     else:
         print(f"Plik stylów {full_path} nie istnieje!")
 
-if __name__ == "__main__":
+def main():
+    """
+    Uruchamia graficzny interfejs aplikacji.
+    """
     format = QSurfaceFormat()
     format.setSamples(128)  # Ustaw 8 próbek dla multisamplingu 256
     QSurfaceFormat.setDefaultFormat(format)
@@ -256,6 +259,14 @@ if __name__ == "__main__":
     load_stylesheet(app, "tools/styles.qss")
     app.setFont(QFont("Arial"))
     main_app = MainApplication()
+    app.aboutToQuit.connect(DatabaseWorker.instance().stop)  # Dokończ zlecone zapisy przed wyjściem
+    prewarmer = ModelPrewarmer(app)
+    prewarmer.start(app)  # Generuj popularne modele w czasie bezczynności
+    app.aboutToQuit.connect(prewarmer.stop)
+    app.aboutToQuit.connect(BlenderWorker.stop_all)  # Zamknij procesy Blendera
     main_app.show()
     sys.exit(app.exec())
 
+
+if __name__ == "__main__":
+    main()
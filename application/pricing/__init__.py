@@ -0,0 +1,4 @@
+from application.pricing.batch import BatchQuote, CompiledCatalog, quote_batch
+from application.pricing.quote import Quote, canonical_config, clear_cache, config_key, quote
+from application.pricing.matrix import PriceMatrix, default_matrix_path, missing_prices
+from application.pricing.ticker import PriceTicker
@@ -0,0 +1,211 @@
+import threading
+
+import numpy as np
+
+from application.DatabaseManager import DatabaseManager
+from application.pricing import rules
+
+
+class CompiledCatalog:
+    """
+    Cennik skompilowany do tablic NumPy na potrzeby wyceny wielu konfiguracji naraz.
+
+    Każdy parametr cennika (np. "Opcje dodatkowe") jest kolumną. Opcja parametru ma w obrębie
+    typu bramy własny bit, więc wybór opcji w konfiguracji to maska bitowa (kod opcji).
+    Dla każdej kolumny przygotowana jest tablica [typ bramy, kod] z sumą dopłat wybranych
+    opcji, dzięki czemu dopłaty całej partii wyznacza jedno indeksowanie tablicy.
+    """
+    SUBSET_TABLE_BITS = 12  # Powyżej tylu opcji parametru dopłaty są sumowane bit po bicie
+
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, catalog):
+        """
+        Kompiluje cennik.
+
+        Args:
+            catalog (PriceCatalog): Cennik w pamięci.
+        """
+        self.version = catalog.version
+        self.gate_types = list(DatabaseManager.TYP_BRAMY_MAP)
+        self._type_codes = {gate_type: code for code, gate_type in enumerate(self.gate_types, start=1)}
+
+        prices_by_type = {gate_type: catalog.prices_for(gate_type) for gate_type in self.gate_types}
+
+        # Kolumny: wszystkie parametry cennika poza ceną bazową, w kolejności pierwszego wystąpienia
+        self.parameters = []
+        for prices in prices_by_type.values():
+            for parameter, _ in sorted(prices):
+                if parameter not in (rules.BASE_PARAMETER, *rules.SKIPPED_KEYS) and parameter not in self.parameters:
+                    self.parameters.append(parameter)
+        columns = {parameter: column for column, parameter in enumerate(self.parameters)}
+
+        type_count = len(self.gate_types) + 1  # Kod 0 oznacza nieznany typ bramy
+        self.base = np.zeros(type_count)
+        self._option_bits = {}
+        option_prices = [[[] for _ in range(type_count)] for _ in self.parameters]
+
+        for gate_type, prices in prices_by_type.items():
+            code = self._type_codes[gate_type]
+            self.base[code] = prices.get((rules.BASE_PARAMETER, rules.BASE_OPTION), 0)
+            bits = self._option_bits[code] = {}
+            for (parameter, option), price in sorted(prices.items()):
+                if parameter == rules.BASE_PARAMETER or parameter in rules.SKIPPED_KEYS:
+                    continue
+                column = columns[parameter]
+                bits.setdefault(parameter, {})[option] = (column, 1 << len(option_prices[column][code]))
+                option_prices[column][code].append(price)
+
+        # Dla każdej kolumny: tablica sum dopłat dla wszystkich kodów lub ceny pojedynczych bitów
+        self._tables = []
+        for per_type in option_prices:
+            width = max(len(prices) for prices in per_type)
+            unit_prices = np.zeros((type_count, width))
+            for code, prices in enumerate(per_type):
+                unit_prices[code, :len(prices)] = prices
+            if width <= self.SUBSET_TABLE_BITS:
+                masks = np.arange(1 << width)
+                selected = (masks[:, None] >> np.arange(width)) & 1
+                self._tables.append(("subset", unit_prices @ selected.T))
+            else:
+                self._tables.append(("bits", unit_prices))
+
+    @classmethod
+    def for_catalog(cls, catalog):
+        """
+        Zwraca skompilowany cennik, kompilując go ponownie tylko po zmianie wersji cennika.
+
+        Args:
+            catalog (PriceCatalog): Cennik w pamięci.
+
+        Returns:
+            CompiledCatalog: Skompilowany cennik.
+        """
+        with cls._cache_lock:
+            compiled = cls._cache.get(catalog.db_path)
+            if compiled is None or compiled.version != catalog.version:
+                compiled = cls._cache[catalog.db_path] = cls(catalog)
+            return compiled
+
+    def encode(self, configs):
+        """
+        Zamienia konfiguracje na tablice kodów: typ bramy, maski opcji dla każdej kolumny i wymiary.
+        Opcje spoza cennika są pomijane (ich dopłata wynosi 0).
+
+        Args:
+            configs (Iterable[dict]): Konfiguracje bram (format selected_options.json).
+
+        Returns:
+            tuple: Tablice (kody typów, maski opcji, szerokości, wysokości).
+        """
+        column_count = len(self.parameters)
+        type_codes, masks, widths, heights = [], [], [], []
+
+        for config in configs:
+            code = self._type_codes.get(config.get("Typ bramy"), 0)
+            row = [0] * column_count
+            if code:
+                bits = self._option_bits[code]
+                # Pętla odpowiada rules.priced_options, ale pomija parametry spoza cennika bez
+                # konwersji wartości, bo to ona dominuje w czasie wyceny dużych partii
+                for parameter, value in config.items():
+                    options = bits.get(parameter)
+                    if options is None:
+                        continue
+                    if type(value) is str:
+                        hit = options.get(value)
+                        if hit is not None:
+                            row[hit[0]] |= hit[1]
+                        continue
+                    for option in (value if isinstance(value, list) else (value,)):
+                        if not isinstance(option, str):
+                            if not isinstance(option, (int, float)):
+                                continue
+                            option = str(option)
+                        hit = options.get(option)
+                        if hit is not None:
+                            row[hit[0]] |= hit[1]
+            sizes = config.get("Wymiary")
+            width = sizes.get("Szerokość") if type(sizes) is dict else None
+            height = sizes.get("Wysokość") if type(sizes) is dict else None
+            if type(width) is not int or type(height) is not int:
+                width, height = rules.dimensions(config)
+            type_codes.append(code)
+            masks.append(row)
+            widths.append(width)
+            heights.append(height)
+
+        return (
+            np.array(type_codes, dtype=np.intp),
+            np.array(masks, dtype=np.int64).reshape(len(type_codes), column_count),
+            np.array(widths, dtype=np.float64),
+            np.array(heights, dtype=np.float64),
+        )
+
+    def price(self, type_codes, masks, widths, heights):
+        """
+        Wycenia zakodowaną partię konfiguracji.
+
+        Returns:
+            BatchQuote: Ceny całkowite i składowe dla każdej konfiguracji.
+        """
+        base = self.base[type_codes]
+
+        surcharges = np.zeros(masks.shape)
+        for column, (kind, table) in enumerate(self._tables):
+            if kind == "subset":
+                surcharges[:, column] = table[type_codes, masks[:, column]]
+            else:
+                selected = (masks[:, column, None] >> np.arange(table.shape[1])) & 1
+                surcharges[:, column] = (selected * table[type_codes]).sum(axis=1)
+
+        oversize = np.empty((len(type_codes), 2))
+        oversize[:, 0] = np.maximum(widths - rules.STANDARD_WIDTH, 0) * rules.EXTRA_WIDTH_RATE
+        oversize[:, 1] = np.maximum(heights - rules.STANDARD_HEIGHT, 0) * rules.EXTRA_HEIGHT_RATE
+
+        totals = base + surcharges.sum(axis=1) + oversize.sum(axis=1)
+        return BatchQuote(totals, base, surcharges, oversize, self.parameters, self.version)
+
+
+class BatchQuote:
+    """
+    Wynik wyceny partii konfiguracji. Wiersz i każdej tablicy dotyczy konfiguracji i.
+
+    Attributes:
+        totals (np.ndarray): Ceny całkowite, kształt (n,).
+        base (np.ndarray): Ceny bazowe, kształt (n,).
+        surcharges (np.ndarray): Dopłaty za opcje, kształt (n, len(parameters)).
+        oversize (np.ndarray): Dopłaty za nadmiarową szerokość i wysokość, kształt (n, 2).
+        parameters (list): Nazwy parametrów odpowiadające kolumnom surcharges.
+        catalog_version (int): Wersja cennika użyta do wyceny.
+    """
+    def __init__(self, totals, base, surcharges, oversize, parameters, catalog_version):
+        self.totals = totals
+        self.base = base
+        self.surcharges = surcharges
+        self.oversize = oversize
+        self.parameters = parameters
+        self.catalog_version = catalog_version
+
+    def __len__(self):
+        return len(self.totals)
+
+
+def quote_batch(configs, catalog=None):
+    """
+    Wycenia wiele konfiguracji bram naraz, bez zapytań do bazy danych dla poszczególnych opcji.
+
+    Wynik jest zgodny z wyceną pojedynczej konfiguracji: cena bazowa typu bramy, suma dopłat
+    za opcje z cennika (kolory nie są wyceniane) oraz dopłata za każdy mm ponad wymiar standardowy.
+
+    Args:
+        configs (Iterable[dict]): Konfiguracje bram (format selected_options.json).
+        catalog (PriceCatalog, optional): Cennik; domyślnie cennik bazy danych aplikacji.
+
+    Returns:
+        BatchQuote: Ceny całkowite i składowe w postaci tablic NumPy.
+    """
+    catalog = catalog or DatabaseManager().price_catalog()
+    compiled = CompiledCatalog.for_catalog(catalog)
+    return compiled.price(*compiled.encode(configs))
@@ -0,0 +1,390 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from application.DatabaseManager import DatabaseManager
+from application.pricing import rules
+from application.tools.path import get_package_resource_path
+
+MULTI_SELECT_PARAMETERS = ("Opcje dodatkowe",)  # Parametry, w których można zaznaczyć kilka opcji
+
+
+def default_matrix_path():
+    """
+    Zwraca domyślną ścieżkę pliku macierzy cen - obok bazy danych, z której pochodzi cennik.
+
+    Returns:
+        str: Ścieżka do pliku price_matrix.npz.
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(DatabaseManager.DB_PATH)), "price_matrix.npz")
+
+
+def load_option_space(path=None):
+    """
+    Wczytuje dostępne opcje dla każdego typu bramy z pliku resources/options_data.txt.
+
+    Args:
+        path (str, optional): Ścieżka do pliku opcji.
+
+    Returns:
+        dict: {typ bramy: {parametr: [opcje]}}.
+    """
+    options_data = {}
+    current_gate = None
+    with open(path or get_package_resource_path(os.path.join("resources", "options_data.txt")), "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                current_gate = line[1:-1]
+                options_data[current_gate] = {}
+            elif current_gate and ": " in line:
+                field_name, options = line.split(": ", 1)
+                options_data[current_gate][field_name] = options.split(", ")
+    return options_data
+
+
+def load_required_fields(path=None):
+    """
+    Wczytuje pola wymagane dla każdego typu bramy z pliku resources/wymagane.txt.
+
+    Args:
+        path (str, optional): Ścieżka do pliku pól wymaganych.
+
+    Returns:
+        dict: {typ bramy: [nazwy pól]}.
+    """
+    required_fields = {}
+    current_gate = None
+    with open(path or get_package_resource_path(os.path.join("resources", "wymagane.txt")), "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                current_gate = line[1:-1]
+                required_fields[current_gate] = []
+            elif current_gate:
+                required_fields[current_gate].append(line)
+    return required_fields
+
+
+def missing_prices(catalog, option_space):
+    """
+    Zwraca opcje z przestrzeni opcji, dla których cennik nie ma pozycji (np. przez literówkę
+    w nazwie opcji). Takie opcje byłyby wyceniane w macierzy na 0 zł.
+
+    Args:
+        catalog (PriceCatalog): Cennik w pamięci.
+        option_space (dict): Wynik load_option_space.
+
+    Returns:
+        list: Krotki (typ bramy, parametr, opcja) bez pozycji w cenniku.
+    """
+    missing = []
+    for gate_type, parameters in option_space.items():
+        prices = catalog.prices_for(gate_type)
+        for parameter, options in parameters.items():
+            if parameter in rules.SKIPPED_KEYS:
+                continue
+            missing.extend((gate_type, parameter, option) for option in options if (parameter, option) not in prices)
+    return missing
+
+
+def catalog_digest(catalog, option_space):
+    """
+    Zwraca skrót cennika i przestrzeni opcji, z których zbudowano macierz cen.
+
+    Args:
+        catalog (PriceCatalog): Cennik w pamięci.
+        option_space (dict): Wynik load_option_space.
+
+    Returns:
+        str: Skrót szesnastkowy SHA-1.
+    """
+    prices = {
+        gate_type: sorted([parameter, option, price] for (parameter, option), price in catalog.prices_for(gate_type).items())
+        for gate_type in sorted(option_space)
+    }
+    serialized = json.dumps([prices, option_space], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+class PriceMatrix:
+    """
+    Pełna tablica cen wszystkich konfiguracji opcji, osobno dla każdego typu bramy.
+
+    Osiami tablicy są wyceniane parametry typu bramy (kolory nie wpływają na cenę i nie są osiami).
+    Dla parametru jednokrotnego wyboru indeks 0 oznacza brak wyboru, a indeks i > 0 - i-tą opcję
+    z options_data.txt; dla "Opcje dodatkowe" indeks jest maską bitową zaznaczonych opcji.
+    Komórka zawiera cenę bazową z dopłatami, więc cena konfiguracji to jeden odczyt tablicy
+    i dopłata za ponadwymiarowość.
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, meta, matrices):
+        """
+        Args:
+            meta (dict): Opis osi tablic (format zapisywany w pliku).
+            matrices (dict): {typ bramy: np.ndarray z cenami}.
+        """
+        self.meta = meta
+        self.matrices = matrices
+        self.axes = {gate["name"]: gate["axes"] for gate in meta["gate_types"]}
+
+    @classmethod
+    def build(cls, catalog=None, option_space=None, required_fields=None):
+        """
+        Buduje macierz cen z cennika i przestrzeni opcji, sumując wektory dopłat wszystkich osi.
+
+        Args:
+            catalog (PriceCatalog, optional): Cennik; domyślnie cennik bazy danych aplikacji.
+            option_space (dict, optional): Opcje typów bram; domyślnie z resources/options_data.txt.
+            required_fields (dict, optional): Pola wymagane; domyślnie z resources/wymagane.txt.
+
+        Returns:
+            PriceMatrix: Zbudowana macierz cen.
+
+        Raises:
+            ValueError: Jeśli cennik nie zawiera pozycji dla żadnego typu bramy (pusta lub brakująca baza).
+        """
+        catalog = catalog or DatabaseManager().price_catalog()
+        option_space = option_space if option_space is not None else load_option_space()
+        required_fields = required_fields if required_fields is not None else load_required_fields()
+        if not any(catalog.prices_for(gate_type) for gate_type in option_space):
+            raise ValueError("Cennik jest pusty - nie można zbudować macierzy cen.")
+
+        gate_types = []
+        matrices = {}
+        for gate_type, parameters in option_space.items():
+            prices = catalog.prices_for(gate_type)
+            priced_parameters = {parameter for parameter, _ in prices}
+            total = np.int64(prices.get((rules.BASE_PARAMETER, rules.BASE_OPTION), 0))
+            axes = []
+
+            for parameter, options in parameters.items():
+                if parameter in rules.SKIPPED_KEYS or parameter not in priced_parameters:
+                    continue
+                option_prices = np.array([prices.get((parameter, option), 0) for option in options], dtype=np.int64)
+                multi = parameter in MULTI_SELECT_PARAMETERS
+                if multi:
+                    codes = np.arange(1 << len(options))
+                    surcharges = ((codes[:, None] >> np.arange(len(options))) & 1) @ option_prices
+                else:
+                    surcharges = np.concatenate(([0], option_prices))
+                total = np.add.outer(total, surcharges)
+                axes.append({
+                    "parameter": parameter,
+                    "options": options,
+                    "multi": multi,
+                    "required": parameter in required_fields.get(gate_type, []),
+                })
+
+            matrices[gate_type] = np.asarray(total, dtype=np.int32)
+            gate_types.append({"name": gate_type, "axes": axes})
+
+        meta = {
+            "format": cls.FORMAT_VERSION,
+            "digest": catalog_digest(catalog, option_space),
+            "gate_types": gate_types,
+        }
+        return cls(meta, matrices)
+
+    @classmethod
+    def load(cls, path=None):
+        """
+        Wczytuje macierz cen z pliku .npz.
+
+        Args:
+            path (str, optional): Ścieżka do pliku; domyślnie default_matrix_path().
+
+        Returns:
+            PriceMatrix: Wczytana macierz cen.
+
+        Raises:
+            ValueError: Jeśli plik ma nieobsługiwany format.
+        """
+        with np.load(path or default_matrix_path()) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("format") != cls.FORMAT_VERSION:
+                raise ValueError(f"Nieobsługiwany format macierzy cen: {meta.get('format')}")
+            matrices = {
+                gate["name"]: data[f"matrix_{position}"] for position, gate in enumerate(meta["gate_types"])
+            }
+        return cls(meta, matrices)
+
+    def save(self, path=None):
+        """
+        Zapisuje macierz cen do skompresowanego pliku .npz.
+
+        Args:
+            path (str, optional): Ścieżka do pliku; domyślnie default_matrix_path().
+
+        Returns:
+            str: Ścieżka zapisanego pliku.
+        """
+        path = path or default_matrix_path()
+        arrays = {
+            f"matrix_{position}": self.matrices[gate["name"]] for position, gate in enumerate(self.meta["gate_types"])
+        }
+        with open(path, "wb") as file:
+            np.savez_compressed(file, meta=np.array(json.dumps(self.meta, ensure_ascii=False)), **arrays)
+        return path
+
+    def is_current(self, catalog=None, option_space=None):
+        """
+        Sprawdza, czy macierz odpowiada aktualnemu cennikowi i przestrzeni opcji.
+
+        Returns:
+            bool: True, jeśli macierz nie wymaga przebudowania.
+        """
+        catalog = catalog or DatabaseManager().price_catalog()
+        option_space = option_space if option_space is not None else load_option_space()
+        return self.meta["digest"] == catalog_digest(catalog, option_space)
+
+    def index(self, config):
+        """
+        Zwraca indeks komórki macierzy dla konfiguracji.
+
+        Args:
+            config (dict): Konfiguracja bramy (format selected_options.json).
+
+        Returns:
+            tuple: Indeks w tablicy typu bramy lub None, jeśli konfiguracja wykracza poza
+                przestrzeń opcji (nieznany typ bramy, opcja spoza options_data.txt lub parametr,
+                który nie jest osią macierzy).
+        """
+        gate_type = config.get("Typ bramy")
+        axes = self.axes.get(gate_type)
+        if axes is None:
+            return None
+
+        parameters = {axis["parameter"] for axis in axes}
+        for parameter, value in config.items():
+            if parameter in rules.SKIPPED_KEYS or parameter in parameters or value in (None, "", []):
+                continue
+            # Opcja, której macierz nie wycenia (np. parametr bez poprawnego wiersza w options_data.txt);
+            # pominięcie jej zaniżyłoby cenę względem quote()
+            print(f"Parametr '{parameter}' nie jest wyceniany w macierzy cen typu {gate_type}.")
+            return None
+
+        position = []
+        for axis in axes:
+            value = config.get(axis["parameter"])
+            options = axis["options"]
+            if axis["multi"]:
+                code = 0
+                for option in value or []:
+                    if option not in options:
+                        return None
+                    code |= 1 << options.index(option)
+                position.append(code)
+            elif value is None:
+                position.append(0)
+            elif str(value) in options:
+                position.append(options.index(str(value)) + 1)
+            else:
+                return None
+        return tuple(position)
+
+    def price(self, config):
+        """
+        Wycenia konfigurację jednym odczytem macierzy i dopłatą za ponadwymiarowość.
+
+        Args:
+            config (dict): Konfiguracja bramy.
+
+        Returns:
+            float: Cena całkowita lub None, jeśli konfiguracji nie ma w macierzy
+                (należy wtedy użyć application.pricing.quote).
+        """
+        position = self.index(config)
+        if position is None:
+            return None
+        width, height = rules.dimensions(config)
+        oversize = (max(0, width - rules.STANDARD_WIDTH) * rules.EXTRA_WIDTH_RATE
+                    + max(0, height - rules.STANDARD_HEIGHT) * rules.EXTRA_HEIGHT_RATE)
+        return int(self.matrices[config["Typ bramy"]][position]) + oversize
+
+    def price_list(self, gate_type=None):
+        """
+        Zwraca pozycje cennika do wydruku: cenę bazową i dopłatę za każdą opcję.
+
+        Dopłaty są odczytywane z macierzy jako różnica między konfiguracją z jedną opcją
+        a konfiguracją bez opcji.
+
+        Args:
+            gate_type (str, optional): Typ bramy; domyślnie wszystkie typy.
+
+        Returns:
+            list: Krotki (typ bramy, parametr, opcja, kwota); cena bazowa ma parametr "Cena bazowa".
+        """
+        rows = []
+        for name in ([gate_type] if gate_type else list(self.matrices)):
+            matrix = self.matrices[name]
+            base = int(matrix[(0,) * matrix.ndim])
+            rows.append((name, "Cena bazowa", "", base))
+            for axis_position, axis in enumerate(self.axes[name]):
+                for option_position, option in enumerate(axis["options"]):
+                    position = [0] * matrix.ndim
+                    position[axis_position] = 1 << option_position if axis["multi"] else option_position + 1
+                    rows.append((name, axis["parameter"], option, int(matrix[tuple(position)]) - base))
+        return rows
+
+    def cheapest(self, gate_type, required=None):
+        """
+        Znajduje najtańszą konfigurację typu bramy zawierającą wskazane opcje.
+
+        Pola wymagane (resources/wymagane.txt) zawsze mają wybraną opcję. Parametry, które
+        nie wpływają na cenę (np. kolory), nie są częścią wyniku.
+
+        Args:
+            gate_type (str): Typ bramy (np. "Brama Uchylna").
+            required (dict, optional): Wymagane opcje, np. {"Opcje dodatkowe": ["Drzwi w bramie"],
+                "Przeszklenia": "Okna poziome"}.
+
+        Returns:
+            tuple: Cena bez dopłaty za ponadwymiarowość i konfiguracja (dict).
+
+        Raises:
+            ValueError: Jeśli typ bramy lub wymagana opcja nie występują w macierzy.
+        """
+        if gate_type not in self.matrices:
+            raise ValueError(f"Nieznany typ bramy: {gate_type}")
+        required = required or {}
+        axes = self.axes[gate_type]
+
+        candidates = []
+        for axis in axes:
+            options = axis["options"]
+            wanted = required.get(axis["parameter"])
+            if axis["multi"]:
+                wanted = [wanted] if isinstance(wanted, str) else (wanted or [])
+                mask = 0
+                for option in wanted:
+                    if option not in options:
+                        raise ValueError(f"Nieznana opcja '{option}' parametru {axis['parameter']}")
+                    mask |= 1 << options.index(option)
+                codes = np.arange(1 << len(options))
+                candidates.append(codes[(codes & mask) == mask])
+            elif wanted is not None:
+                if wanted not in options:
+                    raise ValueError(f"Nieznana opcja '{wanted}' parametru {axis['parameter']}")
+                candidates.append(np.array([options.index(wanted) + 1]))
+            else:
+                candidates.append(np.arange(1 if axis["required"] else 0, len(options) + 1))
+
+        prices = self.matrices[gate_type][np.ix_(*candidates)]
+        best = np.unravel_index(np.argmin(prices), prices.shape)
+
+        config = {"Typ bramy": gate_type}
+        for axis, values, position in zip(axes, candidates, best):
+            code = int(values[position])
+            if axis["multi"]:
+                config[axis["parameter"]] = [
+                    option for bit, option in enumerate(axis["options"]) if code & (1 << bit)
+                ]
+            elif code:
+                config[axis["parameter"]] = axis["options"][code - 1]
+        return int(prices[best]), config
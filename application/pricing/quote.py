@@ -0,0 +1,147 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from application.DatabaseManager import DatabaseManager
+from application.pricing import rules
+
+CACHE_SIZE = 1024  # Liczba wycen przechowywanych w pamięci podręcznej LRU
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class Quote:
+    """
+    Wycena jednej konfiguracji bramy. Obiekt jest współdzielony przez pamięć podręczną,
+    więc nie należy go modyfikować.
+
+    Attributes:
+        gate_type (str): Typ bramy (np. "Brama Segmentowa").
+        total (int | float): Cena całkowita w zł.
+        lines (tuple): Pozycje wyceny (parametr, szczegóły, kwota) - cena bazowa, dopłaty za opcje
+            i dopłaty za ponadwymiarowość; pozycje z zerową dopłatą są pomijane.
+        key (str): Skrót kanonicznej postaci konfiguracji.
+        catalog_version (int): Wersja cennika użyta do wyceny.
+    """
+    def __init__(self, gate_type, lines, key, catalog_version):
+        self.gate_type = gate_type
+        self.lines = tuple(lines)
+        self.total = sum(amount for _, _, amount in self.lines)
+        self.key = key
+        self.catalog_version = catalog_version
+
+    @property
+    def details(self):
+        """Pozycje wyceny jako tekst, np. "Przeszklenia: Wzór 1 (+400 zł)"."""
+        return [f"{parameter}: {description} (+{amount} zł)" for parameter, description, amount in self.lines]
+
+
+def canonical_config(config):
+    """
+    Zwraca kanoniczną postać konfiguracji: tylko dane wpływające na cenę, w ustalonej kolejności.
+    Nazwa projektu, kolory i kolejność opcji nie zmieniają wyniku.
+
+    Args:
+        config (dict): Konfiguracja bramy (format selected_options.json).
+
+    Returns:
+        dict: Typ bramy, wymiary i posortowana lista wycenianych opcji.
+    """
+    return {
+        "Typ bramy": config.get("Typ bramy"),
+        "Wymiary": list(rules.dimensions(config)),
+        "Opcje": sorted(set(rules.priced_options(config))),
+    }
+
+
+def config_key(config):
+    """
+    Zwraca skrót (SHA-1) kanonicznej postaci konfiguracji.
+
+    Args:
+        config (dict): Konfiguracja bramy.
+
+    Returns:
+        str: Skrót szesnastkowy.
+    """
+    return _canonical_key(canonical_config(config))
+
+
+def quote(config, catalog=None):
+    """
+    Wycenia konfigurację bramy, korzystając z pamięci podręcznej LRU.
+
+    Wynik jest zapamiętywany pod kluczem (baza danych, wersja cennika, skrót konfiguracji),
+    więc kalkulator, formularz i faktura wyceniające ten sam projekt liczą cenę tylko raz,
+    a zmiana cennika automatycznie unieważnia wcześniejsze wyceny.
+
+    Args:
+        config (dict): Konfiguracja bramy (format selected_options.json).
+        catalog (PriceCatalog, optional): Cennik; domyślnie cennik bazy danych aplikacji.
+
+    Returns:
+        Quote: Wycena konfiguracji.
+    """
+    catalog = catalog or DatabaseManager().price_catalog()
+    canonical = canonical_config(config)
+    key = _canonical_key(canonical)
+    version = catalog.version
+    cache_key = (catalog.db_path, version, key)
+
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            _cache.move_to_end(cache_key)
+            return cached
+
+    result = _price(canonical, catalog, key, version)
+
+    with _cache_lock:
+        _cache[cache_key] = result
+        _cache.move_to_end(cache_key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def clear_cache():
+    """Usuwa wszystkie zapamiętane wyceny."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _canonical_key(canonical):
+    """Zwraca skrót SHA-1 kanonicznej postaci konfiguracji zapisanej jako JSON."""
+    serialized = json.dumps(canonical, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+def _price(canonical, catalog, key, version):
+    """
+    Oblicza wycenę kanonicznej konfiguracji.
+
+    Dopłaty za opcje są podawane w kolejności pozycji cennika, aby wynik nie zależał
+    od kolejności kluczy w konfiguracji.
+    """
+    gate_type = canonical["Typ bramy"]
+    width, height = canonical["Wymiary"]
+
+    base = catalog.get_price(gate_type, rules.BASE_PARAMETER, rules.BASE_OPTION)
+    lines = [("Cena bazowa", gate_type, base)]
+
+    order = {option: position for position, option in enumerate(catalog.prices_for(gate_type))}
+    for parameter, option in sorted(canonical["Opcje"], key=lambda item: order.get(tuple(item), len(order))):
+        surcharge = catalog.get_price(gate_type, parameter, option)
+        if surcharge > 0:
+            lines.append((parameter, option, surcharge))
+
+    extra_width = max(0, width - rules.STANDARD_WIDTH)
+    extra_height = max(0, height - rules.STANDARD_HEIGHT)
+    if extra_width > 0:
+        lines.append(("Nadmiarowa szerokość", f"+{extra_width} mm", extra_width * rules.EXTRA_WIDTH_RATE))
+    if extra_height > 0:
+        lines.append(("Nadmiarowa wysokość", f"+{extra_height} mm", extra_height * rules.EXTRA_HEIGHT_RATE))
+
+    return Quote(gate_type, lines, key, version)
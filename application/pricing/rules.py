@@ -0,0 +1,59 @@
+"""
+Wspólne zasady wyceny bramy: cena bazowa, pomijane klucze konfiguracji i dopłata za ponadwymiarowość.
+"""
+
+BASE_PARAMETER = "Bazowa"  # Parametr i opcja ceny bazowej w tabeli Cennik
+BASE_OPTION = "Cena"
+
+# Klucze konfiguracji, które nie są wyceniane jako opcje
+SKIPPED_KEYS = ("Typ bramy", "Wymiary", "Nazwa projektu", "Kolor standardowy", "Kolor RAL")
+
+STANDARD_WIDTH = 2200  # Szerokość (mm) zawarta w cenie bazowej
+STANDARD_HEIGHT = 2000  # Wysokość (mm) zawarta w cenie bazowej
+EXTRA_WIDTH_RATE = 0.5  # Cena za każdy dodatkowy mm szerokości
+EXTRA_HEIGHT_RATE = 0.5  # Cena za każdy dodatkowy mm wysokości
+
+
+def dimensions(config):
+    """
+    Odczytuje wymiary bramy z konfiguracji.
+
+    Brakujące lub niepoprawne wartości są zastępowane wymiarami standardowymi,
+    dla których dopłata za ponadwymiarowość wynosi zero.
+
+    Args:
+        config (dict): Konfiguracja bramy (format selected_options.json).
+
+    Returns:
+        tuple: Szerokość i wysokość w mm (int, int).
+    """
+    sizes = config.get("Wymiary") or {}
+    try:
+        width = int(sizes.get("Szerokość", STANDARD_WIDTH))
+    except (ValueError, TypeError):
+        width = STANDARD_WIDTH
+    try:
+        height = int(sizes.get("Wysokość", STANDARD_HEIGHT))
+    except (ValueError, TypeError):
+        height = STANDARD_HEIGHT
+    return width, height
+
+
+def priced_options(config):
+    """
+    Zwraca pary (parametr, opcja) konfiguracji, które podlegają wycenie według cennika.
+
+    Args:
+        config (dict): Konfiguracja bramy.
+
+    Returns:
+        list: Lista krotek (parametr, opcja jako tekst) w kolejności występowania w konfiguracji.
+    """
+    options = []
+    for parameter, value in config.items():
+        if parameter in SKIPPED_KEYS:
+            continue
+        for option in (value if isinstance(value, list) else [value]):
+            if isinstance(option, (str, int, float)):
+                options.append((parameter, str(option)))
+    return options
@@ -0,0 +1,78 @@
+from application.DatabaseManager import DatabaseManager
+from application.pricing import rules
+
+
+class PriceTicker:
+    """
+    Bieżąca cena konfiguracji aktualizowana przyrostowo przy każdej zmianie opcji.
+
+    Po reset() dopłaty typu bramy są przechowywane w słowniku, więc update() jedynie odejmuje
+    dopłatę poprzedniej opcji i dodaje dopłatę nowej - bez odczytu plików i bez zapytań SQL.
+    Wynik odpowiada wycenie quote() dla tej samej konfiguracji.
+
+    Attributes:
+        gate_type (str): Typ bramy (np. "Brama Segmentowa").
+        total (int | float): Bieżąca cena całkowita w zł.
+        catalog_version (int): Wersja cennika, z której pochodzą dopłaty.
+    """
+    def __init__(self, gate_type, catalog=None):
+        """
+        Inicjalizuje licznik ceny.
+
+        Args:
+            gate_type (str): Typ bramy.
+            catalog (PriceCatalog, optional): Cennik; domyślnie cennik bazy danych aplikacji.
+        """
+        self.gate_type = gate_type
+        self.total = 0
+        self.catalog_version = None
+        self._catalog = catalog or DatabaseManager().price_catalog()
+        self._prices = {}
+
+    def reset(self, config):
+        """
+        Wczytuje aktualne dopłaty z cennika w pamięci i oblicza cenę całej konfiguracji.
+
+        Args:
+            config (dict): Konfiguracja bramy (format selected_options.json).
+
+        Returns:
+            int | float: Cena całkowita w zł.
+        """
+        self.catalog_version = self._catalog.version
+        self._prices = self._catalog.prices_for(self.gate_type)
+
+        width, height = rules.dimensions(config)
+        total = self._prices.get((rules.BASE_PARAMETER, rules.BASE_OPTION), 0)
+        if width > rules.STANDARD_WIDTH:
+            total += (width - rules.STANDARD_WIDTH) * rules.EXTRA_WIDTH_RATE
+        if height > rules.STANDARD_HEIGHT:
+            total += (height - rules.STANDARD_HEIGHT) * rules.EXTRA_HEIGHT_RATE
+        for parameter, option in set(rules.priced_options(config)):
+            total += self._prices.get((parameter, option), 0)
+
+        self.total = total
+        return self.total
+
+    def update(self, parameter, old_value, new_value):
+        """
+        Uwzględnia zmianę wyboru w jednej kategorii.
+
+        Args:
+            parameter (str): Nazwa kategorii (np. "Przeszklenia").
+            old_value (str | list | None): Poprzednia wartość kategorii.
+            new_value (str | list | None): Nowa wartość kategorii.
+
+        Returns:
+            int | float: Cena całkowita w zł po zmianie.
+        """
+        if parameter not in rules.SKIPPED_KEYS:
+            self.total += self._surcharge(parameter, new_value) - self._surcharge(parameter, old_value)
+        return self.total
+
+    def _surcharge(self, parameter, value):
+        """Zwraca sumę dopłat za wartość kategorii (pojedynczą opcję lub listę opcji)."""
+        if value is None:
+            return 0
+        options = set(value) if isinstance(value, list) else (value,)
+        return sum(self._prices.get((parameter, str(option)), 0) for option in options)
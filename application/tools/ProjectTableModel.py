@@ -0,0 +1,216 @@
+from functools import partial
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QPixmap
+from application.tools.path import get_resource_path
+
+
+class ProjectTableModel(QAbstractTableModel):
+    """
+    Model tabeli projektów pobierający dane z bazy stronami, na żądanie widoku.
+
+    Widok wywołuje canFetchMore/fetchMore dopiero po przewinięciu do końca listy,
+    więc zapytania i renderowanie dotyczą tylko wierszy, które użytkownik ogląda.
+    Zapytania są wykonywane przez DatabaseWorker, a wiersze dopisywane po nadejściu wyniku.
+    """
+    HEADERS = ["Typ", "Nazwa Projektu", "Data Zapisu"]
+    PAGE_SIZE = 100  # Liczba wierszy pobieranych jednym zapytaniem
+    SEARCH_LIMIT = 200  # Maksymalna liczba wyników wyszukiwania pełnotekstowego
+    ICON_SIZE = 64
+
+    _icons = {}  # Przeskalowane ikony typów bram, wspólne dla wszystkich instancji
+
+    def __init__(self, db_worker, sort="id", parent=None):
+        """
+        Inicjalizuje model i zleca pobranie pierwszej strony projektów.
+
+        Args:
+            db_worker (DatabaseWorker): Wątek wykonujący zapytania do bazy danych.
+            sort (str): Kolumna sortowania przekazywana do list_projects_page.
+            parent (QObject, optional): Rodzic modelu. Domyślnie None.
+        """
+        super().__init__(parent)
+        self.db_worker = db_worker
+        self.sort = sort
+        self.filter_text = None
+        self.search_query = None
+        self._rows = []
+        self._exhausted = False
+        self._loading = False
+        self._generation = 0  # Zwiększane przy każdym resecie, aby odrzucać spóźnione wyniki
+        self.fetchMore(QModelIndex())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Zwraca dane komórki: ikonę typu bramy w pierwszej kolumnie, nazwę i datę w kolejnych.
+        """
+        if not index.isValid():
+            return None
+
+        _, project_name, project_date, project_type = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 1:
+                return project_name
+            if column == 2:
+                return project_date
+        elif role == Qt.DecorationRole and column == 0:
+            return self._icon(project_type)
+        elif role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        elif role == Qt.ToolTipRole and column == 0:
+            return project_type
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Zleca pobranie kolejnej strony projektów, zaczynając od klucza ostatniego załadowanego wiersza.
+        """
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+
+        after = self.db_worker.db_manager.page_key(self._rows[-1], self.sort) if self._rows else None
+        sort, filter_text = self.sort, self.filter_text
+        self._loading = True
+        self.db_worker.submit(
+            lambda db: db.list_projects_page(after, self.PAGE_SIZE, sort, filter_text),
+            partial(self._append_rows, self._generation),
+            partial(self._on_error, self._generation)
+        )
+
+    def _append_rows(self, generation, rows):
+        """
+        Dopisuje pobraną stronę do modelu.
+
+        Args:
+            generation (int): Numer resetu modelu, dla którego zlecono zapytanie.
+            rows (list): Wiersze (id, nazwa, data_zapisu, typ_bramy).
+        """
+        if generation != self._generation:
+            return
+        self._loading = False
+        if len(rows) < self.PAGE_SIZE:
+            self._exhausted = True
+        if not rows:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def reload(self, filter_text=None):
+        """
+        Czyści model i pobiera pierwszą stronę od nowa, opcjonalnie z nowym filtrem nazwy.
+
+        Args:
+            filter_text (str, optional): Fragment nazwy projektu. Domyślnie None.
+        """
+        self._reset()
+        self.filter_text = filter_text or None
+        self.search_query = None
+        self.fetchMore(QModelIndex())
+
+    def search(self, query):
+        """
+        Zastępuje zawartość modelu wynikami wyszukiwania uporządkowanymi według trafności.
+        Puste zapytanie przywraca zwykłą, stronicowaną listę projektów.
+
+        Args:
+            query (str): Tekst wyszukiwania (fragmenty nazwy, koloru lub opcji).
+        """
+        query = (query or "").strip()
+        if not query:
+            self.reload()
+            return
+
+        self._reset()
+        self.filter_text = None
+        self.search_query = query
+        self._loading = True
+        self.db_worker.submit(
+            lambda db: db.search_projects(query, self.SEARCH_LIMIT),
+            partial(self._set_search_results, self._generation),
+            partial(self._on_error, self._generation)
+        )
+
+    def _set_search_results(self, generation, rows):
+        """
+        Wstawia wyniki wyszukiwania do pustego modelu.
+
+        Args:
+            generation (int): Numer resetu modelu, dla którego zlecono wyszukiwanie.
+            rows (list): Wiersze (id, nazwa, data_zapisu, typ_bramy).
+        """
+        if generation != self._generation:
+            return
+        self._loading = False
+        self._exhausted = True
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self._rows = list(rows)
+            self.endInsertRows()
+
+    def _on_error(self, generation, error):
+        """
+        Obsługuje błąd zapytania: kończy ładowanie, aby model nie czekał w nieskończoność.
+        """
+        print(f"Błąd podczas pobierania listy projektów: {error}")
+        if generation == self._generation:
+            self._loading = False
+            self._exhausted = True
+
+    def _reset(self):
+        """Czyści model i unieważnia wyniki zapytań zleconych przed resetem."""
+        self.beginResetModel()
+        self._generation += 1
+        self._rows = []
+        self._exhausted = False
+        self._loading = False
+        self.endResetModel()
+
+    def project_name(self, row):
+        """
+        Zwraca nazwę projektu w danym wierszu.
+
+        Args:
+            row (int): Indeks wiersza.
+
+        Returns:
+            str: Nazwa projektu lub None, jeśli wiersz nie istnieje.
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row][1]
+        return None
+
+    @classmethod
+    def _icon(cls, project_type):
+        """
+        Zwraca przeskalowaną ikonę typu bramy, wczytując ją z dysku tylko raz.
+
+        Args:
+            project_type (str): Typ bramy zapisany w bazie (np. "segmentowa").
+
+        Returns:
+            QPixmap: Ikona typu bramy.
+        """
+        icon = cls._icons.get(project_type)
+        if icon is None:
+            pixmap = QPixmap(get_resource_path(f"jpg/{project_type}.png"))
+            icon = pixmap.scaled(cls.ICON_SIZE, cls.ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cls._icons[project_type] = icon
+        return icon
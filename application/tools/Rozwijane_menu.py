@@ -1,7 +1,7 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QGroupBox, QLabel, QHBoxLayout, QGridLayout, QPushButton, QCheckBox
 )
-from PySide6.QtCore import Qt, QEvent
+from PySide6.QtCore import Qt, QEvent, Signal
 from PySide6.QtGui import QPixmap
 import os
 from application.tools.path import get_resource_path
@@ -17,6 +17,9 @@ class ScrollableMenu(QWidget):
     FIELD_HEIGHT = 100  # Default height for collapsed fields
     OPTION_WIDGET_SIZE = (100, 140)  # Width and height of option widgets
 
+    # Zmiana wyboru w kategorii: (kategoria, poprzednia wartość, nowa wartość); None oznacza brak wyboru
+    selection_changed = Signal(str, object, object)
+
     def __init__(self, gate_type):
         """
         Inicjalizuje przewijane menu.
@@ -224,6 +227,8 @@ class ScrollableMenu(QWidget):
             category (str): Kategoria opcji.
             image_label (QLabel): Kliknięty obraz.
         """
+        previous = self.selected_options.get(category)
+
         # Sprawdź, czy kliknięty obrazek jest już zaznaczony
         if image_label.styleSheet() == "border: 5px solid green; padding: 0px; margin: 0px;":
             # Usuń zaznaczenie
@@ -254,6 +259,8 @@ class ScrollableMenu(QWidget):
             if selected_text:
                 self.selected_options[category] = selected_text
 
+        self._emit_selection_change(category, previous)
+
     def _clear_other_color_category(self, other_category):
         """
         Czyści zaznaczone opcje w drugiej kategorii kolorów (np. "Kolor RAL").
@@ -266,7 +273,20 @@ class ScrollableMenu(QWidget):
                 img_label = option_widget.findChild(QLabel, "image_label")
                 if img_label:
                     img_label.setStyleSheet("border: none; padding: 0px; margin: 0px;")
-            self.selected_options.pop(other_category, None)
+            previous = self.selected_options.pop(other_category, None)
+            self._emit_selection_change(other_category, previous)
+
+    def _emit_selection_change(self, category, previous):
+        """
+        Emituje sygnał selection_changed, jeśli wybór w kategorii uległ zmianie.
+
+        Args:
+            category (str): Nazwa kategorii.
+            previous (str | list | None): Wartość kategorii przed zmianą.
+        """
+        current = self.selected_options.get(category)
+        if current != previous:
+            self.selection_changed.emit(category, previous, current)
 
     def set_default_options(self, default_options):
         """
@@ -319,6 +339,8 @@ class ScrollableMenu(QWidget):
             category (str): Kategoria opcji.
             clicked_checkbox (QCheckBox): Kliknięty checkbox.
         """
+        previous = self.selected_options.get(category)
+
         if category == "Opcje dodatkowe":
             # Dla "Opcje dodatkowe" zapisuj stan każdego checkboxa
             selected_options = [
@@ -348,6 +370,8 @@ class ScrollableMenu(QWidget):
                 # Usuń opcję z zaznaczeń, jeśli checkbox został odznaczony
                 self.selected_options.pop(category, None)
 
+        self._emit_selection_change(category, previous)
+
     def _create_toggle_button(self):
         """
         Tworzy przycisk przełączający widoczność opcji.
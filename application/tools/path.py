@@ -14,6 +14,18 @@ def get_resource_path(relative_path):
     # Jeśli działa w trybie deweloperskim
     return  "../" + relative_path
 
+def get_package_resource_path(relative_path):
+    """
+    Zwraca ścieżkę do zasobu względem katalogu projektu, niezależną od katalogu roboczego
+    (np. dla polecenia kreator-bram uruchomionego z dowolnego miejsca).
+    :param relative_path: Relatywna ścieżka do zasobu względem katalogu projektu.
+    :return: Absolutna ścieżka do zasobu.
+    """
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_dir, relative_path)
+
 def get_persistent_db_path():
     """
     Zwraca ścieżkę do trwałej lokalizacji bazy danych w katalogu użytkownika.
@@ -8,6 +8,7 @@ from application.tools.button import StyledButton
 from application.generator.szkic.szkic_prosty import (draw_orthogonal_edges, draw_filtered_edges_isometric)
 from application.generator.szkic.szkic_opencv import detect_and_draw_arrows
 from application.generator.PDF.InvoiceGenerator import InvoiceGenerator
+from application.pricing import quote
 import os
 import json
 from application.tools.path import get_resource_path
@@ -245,8 +246,10 @@ class ContactForm(QMainWindow):
                     print(f"Error: Unable to delete the existing PDF file. {e}")
                     return
 
+            # Wycena z pamięci podręcznej, jeśli projekt był już wyceniony w kalkulatorze
+            price_quote = quote(self.load_selected_options(get_resource_path("resources/selected_options.json")))
             invoice_generator = InvoiceGenerator(output_path=output_path)
-            invoice_generator.generate_invoice()
+            invoice_generator.generate_invoice(price_quote)
             print("Faktura PDF została wygenerowana pomyślnie.")
         except Exception as e:
             print(f"Wystąpił błąd podczas generowania faktury PDF: {e}")
@@ -1,15 +1,18 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy, QLabel, QCheckBox, QInputDialog,
-    QMessageBox, QSpacerItem
+    QMessageBox, QSpacerItem, QProgressBar
 )
 from application.tools.Rozwijane_menu import ScrollableMenu
 from application.tools.button import StyledButton
 import os
 import json
-from application.DatabaseManager import DatabaseManager
+from functools import partial
+from application.DatabaseWorker import DatabaseWorker
+from application.RenderScheduler import RenderScheduler
 from application.generator.generator_gateV2 import BlenderScriptRunner
 from application.tools.Widget3D import OpenGLWidget
 from application.tools.Kosztorys import PriceCalculator  # Import klasy z pliku Kosztorys.py
+from application.pricing import PriceTicker
 from application.tools.path import get_resource_path
 
 
@@ -22,6 +25,7 @@ class Kreator(QMainWindow):
     """
     LEFT_PANEL_WIDTH = 400
     IMAGE_WIDGET_MIN_SIZE = 400  # Minimum size for image widget
+    RENDER_STATUS_LENGTH = 48  # Maksymalna długość opisu etapu renderowania na pasku postępu
 
     def __init__(self):
         """
@@ -39,6 +43,10 @@ class Kreator(QMainWindow):
         self.default_options = {key: value for key, value in data.items() if key != "Typ bramy"}
         self.required_fields = self.load_required_fields(get_resource_path("resources/wymagane.txt")).get(self.gate_type, [])
         self.selected_options = {}
+        self.render_scheduler = RenderScheduler(self.gate_type, self._save_render_options, self)
+        self.render_scheduler.progress.connect(self._on_render_progress)
+        self.render_scheduler.finished.connect(self._on_render_finished)
+        self.render_scheduler.busy_changed.connect(self._set_rendering)
 
         # Initialize UI
         self._setup_ui()
@@ -46,6 +54,11 @@ class Kreator(QMainWindow):
         # Ustaw domyślne opcje
         self.set_default_options()
 
+        # Bieżąca cena aktualizowana przy każdej zmianie wyboru w menu
+        self.price_ticker = PriceTicker(self.gate_type)
+        self.reset_price_ticker()
+        self.navigation_menu.selection_changed.connect(self._on_selection_changed)
+
     def _setup_ui(self):
         """
         Konfiguruje główny układ okna, dzieląc go na panel lewy i prawy.
@@ -97,6 +110,14 @@ class Kreator(QMainWindow):
         image_widget = self._create_image_widget()
         right_layout.addWidget(image_widget)
 
+        # Render progress with cancel button (visible only while rendering)
+        right_layout.addWidget(self._create_render_status())
+
+        # Live price label
+        self.price_label = QLabel()
+        self.price_label.setObjectName("priceTicker")
+        right_layout.addWidget(self.price_label)
+
         # Navigation buttons at the bottom
         buttons_widget = self._create_navigation_buttons()
         right_layout.addWidget(buttons_widget)
@@ -120,20 +141,91 @@ class Kreator(QMainWindow):
         self.opengl_widget = OpenGLWidget(gate_file, rail_file)
         return self.opengl_widget
 
+    def _create_render_status(self):
+        """
+        Tworzy pasek postępu renderowania z przyciskiem anulowania.
+
+        Returns:
+            QWidget: Widżet stanu renderowania (początkowo ukryty).
+        """
+        self.render_status = QWidget()
+        layout = QHBoxLayout(self.render_status)
+        layout.setContentsMargins(10, 0, 10, 0)
+
+        self.render_progress = QProgressBar()
+        self.render_progress.setObjectName("renderProgress")
+        self.render_progress.setRange(0, 100)
+        layout.addWidget(self.render_progress)
+
+        self.cancel_render_button = StyledButton("Anuluj")
+        self.cancel_render_button.clicked.connect(self.cancel_render)
+        layout.addWidget(self.cancel_render_button)
+
+        self.render_status.setVisible(False)
+        return self.render_status
+
     def gate_render(self):
         """
-        Renderuje bramę na podstawie zaznaczonych opcji i aktualizuje widok.
+        Zleca w tle renderowanie bramy na podstawie zaznaczonych opcji (RenderScheduler).
+        Kolejne kliknięcia w trakcie renderowania zastępują zlecenie oczekujące, a widok modelu
+        jest odświeżany tylko po pomyślnym zakończeniu najnowszego zlecenia (_on_render_finished).
         """
         self.selected_options = self.navigation_menu.get_selected_options()
-        self.save_selected_options(get_resource_path("resources/selected_options.json"), self.selected_options)
+        self.render_scheduler.request(self.selected_options)
+        self.cancel_render_button.setEnabled(True)
 
-        # Uruchomienie Blendera za pomocą BlenderScriptRunner
-        try:
-            gate_type = self.gate_type
-            test = BlenderScriptRunner(gate_type)
-            test.run()
-        except Exception as e:
-            print(f"Wystąpił błąd podczas renderowania: {e}")
+    def _save_render_options(self, options):
+        """
+        Zapisuje opcje renderowanej konfiguracji tuż przed uruchomieniem renderowania.
+
+        Args:
+            options (dict): Wybrane opcje bramy.
+        """
+        self.save_selected_options(get_resource_path("resources/selected_options.json"), options)
+
+    def cancel_render(self):
+        """
+        Anuluje trwające i oczekujące renderowanie; dotychczasowy model pozostaje w widoku.
+        """
+        if self.render_scheduler.is_busy():
+            self.cancel_render_button.setEnabled(False)
+            self.render_scheduler.cancel()
+
+    def _on_render_progress(self, percent, text):
+        """
+        Aktualizuje pasek postępu renderowania.
+
+        Args:
+            percent (int): Postęp w procentach.
+            text (str): Opis bieżącego etapu.
+        """
+        if len(text) > self.RENDER_STATUS_LENGTH:
+            text = text[:self.RENDER_STATUS_LENGTH - 1] + "…"
+        self.render_progress.setValue(percent)
+        self.render_progress.setFormat(f"%p%  {text}")
+
+    def _on_render_finished(self, success):
+        """
+        Kończy renderowanie: ukrywa pasek postępu i wczytuje nowy model, jeśli renderowanie się powiodło.
+
+        Args:
+            success (bool): Czy pliki modelu są gotowe.
+        """
+        self._set_rendering(False)
+        if success:
+            self.change_model()
+
+    def _set_rendering(self, active):
+        """
+        Przełącza interfejs między stanem renderowania a stanem spoczynku.
+
+        Args:
+            active (bool): Czy renderowanie trwa.
+        """
+        self.render_progress.setValue(0)
+        self.render_progress.setFormat("%p%")
+        self.cancel_render_button.setEnabled(active)
+        self.render_status.setVisible(active)
 
     def gate_render_start(self):
         """
@@ -168,10 +260,9 @@ class Kreator(QMainWindow):
 
     def render_and_change(self):
         """
-        Renderuje bramę i odświeża widok modelu 3D.
+        Renderuje bramę w tle i odświeża widok modelu 3D po zakończeniu renderowania.
         """
         self.gate_render()
-        self.change_model()
 
     def _create_navigation_buttons(self):
         """
@@ -223,16 +314,19 @@ class Kreator(QMainWindow):
 
         return buttons_widget
 
-    def validate_and_proceed(self):
+    def validate_and_proceed(self, on_finished=None):
         """
-        Sprawdza wymagane pola i przechodzi do kolejnego widoku, jeśli wszystkie pola są poprawne.
+        Sprawdza wymagane pola i, jeśli wszystkie są poprawne, rozpoczyna zapis projektu.
+
+        Args:
+            on_finished (callable, optional): Wywoływana z wynikiem zapisu (patrz prompt_project_name).
 
         Returns:
             bool: True, jeśli walidacja zakończyła się sukcesem, False w przeciwnym przypadku.
         """
         if self.validate_fields():
-
-            return self.prompt_project_name()
+            self.prompt_project_name(on_finished=on_finished)
+            return True
         else:
             return False
 
@@ -245,15 +339,17 @@ class Kreator(QMainWindow):
         """
         return self.navigation_menu.validate_required_fields(self.required_fields)
 
-    def prompt_project_name(self, render=False):
+    def prompt_project_name(self, render=False, on_finished=None):
         """
         Pyta użytkownika o nazwę projektu i zapisuje projekt.
 
+        Sprawdzenie istnienia projektu i zapis są wykonywane w wątku bazy danych, więc zapis
+        kończy się już po powrocie z tej metody, a jego wynik jest przekazywany do on_finished.
+
         Args:
             render (bool): Flaga wskazująca, czy renderowanie powinno zostać wykonane przed zapisem.
-
-        Returns:
-            bool: True, jeśli projekt został zapisany, False w przeciwnym przypadku.
+            on_finished (callable, optional): Wywoływana z argumentem True po zapisaniu projektu
+                w bazie danych lub False, jeśli zapis anulowano albo się nie powiódł.
         """
         if render:
             self.render_and_change()
@@ -263,60 +359,83 @@ class Kreator(QMainWindow):
         if ok and project_name.strip():
             project_name = project_name.strip()
 
-            # Sprawdzenie, czy projekt istnieje
-            should_save = self.check_project_existence_and_prompt(project_name)
+            # Sprawdzenie, czy projekt istnieje; zapis nastąpi po odpowiedzi z bazy danych
+            DatabaseWorker.instance().submit(
+                lambda db: db.check_project_existence(project_name),
+                partial(self._confirm_and_save, project_name, on_finished),
+                partial(self._on_existence_check_failed, on_finished)
+            )
+        else:
+            print("Anulowano zapis projektu.")
+            if on_finished is not None:
+                on_finished(False)  # Użytkownik anulował zapis
 
-            if should_save:
-                # Zapisz projekt tylko, jeśli nazwa została podana
-                self.selected_options["Nazwa projektu"] = project_name
-                self.selected_options.update(self.navigation_menu.get_selected_options())
+    def _on_existence_check_failed(self, on_finished, error):
+        """
+        Obsługuje błąd sprawdzania istnienia projektu: zapis nie jest wykonywany.
 
-                # Zapisz zaznaczone opcje do pliku
-                self.save_selected_options(get_resource_path("resources/selected_options.json"), self.selected_options)
-                self.save_json_to_db(get_resource_path("resources/selected_options.json"), self.selected_options)
+        Args:
+            on_finished (callable): Wywoływana z wynikiem zapisu lub None.
+            error (Exception): Błąd zgłoszony w wątku bazy danych.
+        """
+        print(f"Wystąpił błąd podczas sprawdzania istnienia projektu: {error}")
+        self._on_project_saved(on_finished, False)
 
-                return True  # Projekt został pomyślnie zapisany
-            else:
-                print("Użytkownik anulował nadpisanie projektu.")
-                return False  # Użytkownik anulował nadpisanie
-        else:
-            print("Anulowano zapis projektu.")
-            return False  # Użytkownik anulował zapis
+    def _confirm_and_save(self, project_name, on_finished, project_exists):
+        """
+        Pyta o nadpisanie istniejącego projektu i zapisuje projekt.
+
+        Args:
+            project_name (str): Nazwa projektu.
+            on_finished (callable): Wywoływana z wynikiem zapisu lub None.
+            project_exists (bool): Czy projekt o tej nazwie jest już w bazie danych.
+        """
+        if project_exists and not self.confirm_overwrite(project_name):
+            print("Użytkownik anulował nadpisanie projektu.")
+            if on_finished is not None:
+                on_finished(False)
+            return
 
-    def check_project_existence_and_prompt(self, project_name):
+        # Zapisz projekt tylko, jeśli nazwa została podana
+        self.selected_options["Nazwa projektu"] = project_name
+        self.selected_options.update(self.navigation_menu.get_selected_options())
+
+        # Zapisz zaznaczone opcje do pliku
+        self.save_selected_options(get_resource_path("resources/selected_options.json"), self.selected_options)
+        self.save_json_to_db(get_resource_path("resources/selected_options.json"), self.selected_options,
+                             partial(self._on_project_saved, on_finished))
+
+    def _on_project_saved(self, on_finished, saved):
         """
-        Sprawdza, czy projekt o danej nazwie istnieje, i pyta użytkownika o nadpisanie.
+        Informuje użytkownika o nieudanym zapisie projektu i przekazuje wynik do on_finished.
 
         Args:
-            project_name (str): Nazwa projektu do sprawdzenia.
+            on_finished (callable): Wywoływana z wynikiem zapisu lub None.
+            saved (bool): Czy projekt został zapisany w bazie danych.
+        """
+        if not saved:
+            QMessageBox.warning(self, "Błąd zapisu", "Nie udało się zapisać projektu w bazie danych.")
+        if on_finished is not None:
+            on_finished(saved)
+
+    def confirm_overwrite(self, project_name):
+        """
+        Pyta użytkownika, czy nadpisać istniejący projekt.
+
+        Args:
+            project_name (str): Nazwa istniejącego projektu.
 
         Returns:
-            bool: True, jeśli projekt można zapisać, False w przeciwnym przypadku.
+            bool: True, jeśli użytkownik zgodził się na nadpisanie, False w przeciwnym przypadku.
         """
-        try:
-            db_manager = DatabaseManager()
-            project_exists = db_manager.check_project_existence(
-                project_name)  # Funkcja musi zostać zaimplementowana w DatabaseManager
-
-            if project_exists:
-                # Tworzenie okna dialogowego z pytaniem o nadpisanie
-                msg_box = QMessageBox(self)
-                msg_box.setIcon(QMessageBox.Question)
-                msg_box.setWindowTitle("Nadpisz projekt")
-                msg_box.setText(f"Projekt o nazwie '{project_name}' już istnieje. Czy chcesz go nadpisać?")
-                msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-                msg_box.setDefaultButton(QMessageBox.No)
-                result = msg_box.exec()
-
-                if result == QMessageBox.Yes:
-                    return True  # Użytkownik zatwierdził nadpisanie
-                else:
-                    return False  # Użytkownik anulował operację
-            else:
-                return True  # Projekt nie istnieje, można kontynuować zapis
-        except Exception as e:
-            print(f"Wystąpił błąd podczas sprawdzania istnienia projektu: {e}")
-            return False
+        # Tworzenie okna dialogowego z pytaniem o nadpisanie
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Question)
+        msg_box.setWindowTitle("Nadpisz projekt")
+        msg_box.setText(f"Projekt o nazwie '{project_name}' już istnieje. Czy chcesz go nadpisać?")
+        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg_box.setDefaultButton(QMessageBox.No)
+        return msg_box.exec() == QMessageBox.Yes
 
     def set_default_options(self):
         """
@@ -345,6 +464,35 @@ class Kreator(QMainWindow):
                     if text_label and img_label and text_label.text() == value:
                         self.navigation_menu._on_option_click(category, img_label)  # Kliknięcie na opcję
 
+    def reset_price_ticker(self):
+        """
+        Oblicza od nowa bieżącą cenę na podstawie wszystkich zaznaczonych opcji.
+        """
+        config = dict(self.navigation_menu.get_selected_options())
+        config["Typ bramy"] = self.gate_type
+        if "Wymiary" in self.default_options:
+            config["Wymiary"] = self.default_options["Wymiary"]
+        self.price_ticker.reset(config)
+        self._update_price_label()
+
+    def _on_selection_changed(self, category, previous, current):
+        """
+        Aktualizuje bieżącą cenę po zmianie wyboru w jednej kategorii.
+
+        Args:
+            category (str): Nazwa kategorii.
+            previous (str | list | None): Poprzednia wartość kategorii.
+            current (str | list | None): Nowa wartość kategorii.
+        """
+        self.price_ticker.update(category, previous, current)
+        self._update_price_label()
+
+    def _update_price_label(self):
+        """
+        Wyświetla bieżącą cenę w etykiecie nad przyciskami.
+        """
+        self.price_label.setText(f"Cena: {self.price_ticker.total} zł")
+
     def open_cost_calculator(self):
         """
         Otwiera okno kalkulatora cen.
@@ -444,13 +592,15 @@ class Kreator(QMainWindow):
             print(f"Wystąpił błąd podczas zapisywania danych: {e}")
 
     @staticmethod
-    def save_json_to_db(file_path, selected_options):
+    def save_json_to_db(file_path, selected_options, on_finished=None):
         """
-        Zapisuje dane z pliku JSON do bazy danych.
+        Zapisuje dane z pliku JSON do bazy danych (w wątku bazy danych).
 
         Args:
             file_path (str): Ścieżka do pliku JSON.
             selected_options (dict): Dane opcji do zapisania w bazie danych.
+            on_finished (callable, optional): Wywoływana w wątku interfejsu z argumentem True,
+                jeśli projekt został zapisany, lub False, jeśli zapis się nie powiódł.
         """
         # Przygotuj bazową strukturę danych
         base_data = {}
@@ -471,12 +621,13 @@ class Kreator(QMainWindow):
         # Połącz dane bazowe z nowymi wybranymi opcjami
         base_data.update(selected_options)
 
+        def on_error(error):
+            print(f"Wystąpił błąd podczas dodawania projektu do bazy danych: {error}")
+            if on_finished is not None:
+                on_finished(False)
+
         # Dodaj projekt do bazy danych
-        try:
-            db_manager = DatabaseManager()
-            db_manager.add_project_from_json(base_data)
-        except Exception as e:
-            print(f"Wystąpił błąd podczas dodawania projektu do bazy danych: {e}")
+        DatabaseWorker.instance().submit(lambda db: db.add_project_from_json(base_data), on_finished, on_error)
 
 
 
@@ -1,11 +1,11 @@
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize, QTimer, Signal
 from PySide6.QtWidgets import (
     QMainWindow, QSpacerItem, QSizePolicy, QWidget,
-    QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QLabel, QHeaderView
+    QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QLineEdit
 )
-from PySide6.QtGui import QPixmap
 from application.tools.button import StyledButton
-from application.DatabaseManager import DatabaseManager
+from application.tools.ProjectTableModel import ProjectTableModel
+from application.DatabaseWorker import DatabaseWorker
 import json
 from application.tools.path import get_resource_path
 
@@ -14,6 +14,9 @@ class OknoStartowe(QMainWindow):
     """
     Klasa reprezentująca ekran początkowy aplikacji.
     """
+    SEARCH_DELAY_MS = 250  # Opóźnienie wyszukiwania po ostatnim naciśnięciu klawisza
+
+    project_loaded = Signal()  # Wybrany projekt został zapisany do resources/selected_options.json
     def __init__(self):
         """
         Inicjalizuje okno startowe aplikacji.
@@ -27,7 +30,7 @@ class OknoStartowe(QMainWindow):
         self.setMinimumSize(834, 559)
 
         self.selected_row = None
-        self.db_manager = DatabaseManager()
+        self.db_worker = DatabaseWorker.instance()
         self._setup_ui()
         self.refresh()  # Odśwież zawartość przy pierwszym uruchomieniu
 
@@ -87,20 +90,39 @@ class OknoStartowe(QMainWindow):
         """
         Tworzy prawy panel w oknie startowym.
 
-        Panel zawiera tabelę listę utworzonych projektów.
+        Panel zawiera pole wyszukiwania oraz tabelę listę utworzonych projektów. Wiersze są
+        pobierane z bazy stronami, dopiero gdy użytkownik przewinie listę.
         """
         right_widget = QWidget()
         right_widget.setObjectName("projectTablePanel")
         right_layout = QVBoxLayout(right_widget)
 
-        self.project_table = QTableWidget()
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("projectSearch")
+        self.search_input.setPlaceholderText("Szukaj projektu (nazwa, kolor, opcje)...")
+        self.search_input.setClearButtonEnabled(True)
+
+        # Wyszukiwanie uruchamiane dopiero po przerwie w pisaniu
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self._load_project_files)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_input.returnPressed.connect(self._load_project_files)
+
+        self.project_model = ProjectTableModel(self.db_worker, parent=self)
+
+        self.project_table = QTableView()
         self.project_table.setObjectName("projectTable")
-        self.project_table.setColumnCount(3)
-        self.project_table.setHorizontalHeaderLabels(["Typ", "Nazwa Projektu", "Data Zapisu"])
-        self.project_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.project_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.project_table.setModel(self.project_model)
+        self.project_table.setSelectionBehavior(QTableView.SelectRows)
+        self.project_table.setSelectionMode(QTableView.SingleSelection)
+        self.project_table.setEditTriggers(QTableView.NoEditTriggers)
         self.project_table.setShowGrid(False)
+        self.project_table.setIconSize(QSize(ProjectTableModel.ICON_SIZE, ProjectTableModel.ICON_SIZE))
         self.project_table.verticalHeader().setVisible(False)
+        self.project_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.project_table.verticalHeader().setDefaultSectionSize(80)
 
         header = self.project_table.horizontalHeader()
         header.setDefaultAlignment(Qt.AlignCenter)
@@ -108,8 +130,9 @@ class OknoStartowe(QMainWindow):
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
 
-        self.project_table.itemSelectionChanged.connect(self._handle_row_selection)
+        self.project_table.selectionModel().selectionChanged.connect(self._handle_row_selection)
 
+        right_layout.addWidget(self.search_input)
         right_layout.addWidget(self.project_table)
         return right_widget
 
@@ -119,9 +142,9 @@ class OknoStartowe(QMainWindow):
 
         Włącza przyciski "Otwórz zapisany" i "Usuń projekt", gdy wiersz w tabeli jest zaznaczony.
         """
-        selected_items = self.project_table.selectedItems()
-        if selected_items:
-            self.selected_row = self.project_table.row(selected_items[0]) + 1
+        selected_rows = self.project_table.selectionModel().selectedRows()
+        if selected_rows:
+            self.selected_row = selected_rows[0].row() + 1
             self.open_saved_button.setEnabled(True)  # Aktywuj przycisk otwierania
             self.delete_button.setEnabled(True)  # Aktywuj przycisk usuwania
         else:
@@ -134,41 +157,55 @@ class OknoStartowe(QMainWindow):
         Otwiera wybrany projekt z bazy danych.
 
         Wczytuje dane projektu i zapisuje je do pliku JSON, który będzie używany w kolejnych widokach.
+        Operacja jest wykonywana w wątku bazy danych; po jej zakończeniu emitowany jest sygnał project_loaded.
         """
         self.clear_selected_options()
 
-        selected_items = self.project_table.selectedItems()
+        project_name = self._selected_project_name()
+        if project_name:
+            output_file = get_resource_path("resources/selected_options.json")
+            self.db_worker.submit(
+                lambda db: db.load_project_to_json(project_name, output_file),
+                self._on_project_loaded
+            )
 
-        selected_row = self.project_table.row(selected_items[0])
-        project_name_item = self.project_table.item(selected_row, 1)
-        if project_name_item:
-            project_name = project_name_item.text()
-            try:
-                output_file = get_resource_path("resources/selected_options.json")
-                self.db_manager.load_project_to_json(project_name, output_file)
-            except Exception as e:
-                print(f"Błąd podczas zapisywania projektu do JSON: {e}")
+    def _on_project_loaded(self, loaded):
+        """
+        Przekazuje dalej informację o wczytaniu projektu, jeśli zapis do JSON się powiódł.
+
+        Args:
+            loaded (bool): Wynik load_project_to_json.
+        """
+        if loaded:
+            self.project_loaded.emit()
 
     def delete_selected_project(self):
         """
         Usuwa wybrany projekt z bazy danych.
 
-        Wywołuje funkcję `test` z klasy `DatabaseManager`.
+        Usuwanie jest wykonywane w wątku bazy danych, a tabela jest odświeżana po jego zakończeniu.
         """
-        selected_items = self.project_table.selectedItems()
+        project_name = self._selected_project_name()
+
+        if project_name:
+            self.delete_button.setEnabled(False)
+            self.db_worker.submit(
+                lambda db: db.delete_project_by_name(project_name),
+                lambda _: self.refresh(),  # Odświeżenie tabeli po usunięciu
+                lambda e: print(f"Błąd podczas usuwania projektu: {e}")
+            )
 
-        if selected_items:
-            selected_row = self.project_table.row(selected_items[0])
-            project_name_item = self.project_table.item(selected_row, 1)
+    def _selected_project_name(self):
+        """
+        Zwraca nazwę projektu w zaznaczonym wierszu tabeli.
 
-            if project_name_item:
-                project_name = project_name_item.text()
-                try:
-                    self.db_manager.delete_project_by_name(project_name)  # Wywołanie funkcji `test`
-                    self.refresh()  # Odświeżenie tabeli po usunięciu
-                    print(f"Projekt '{project_name}' został usunięty.")
-                except Exception as e:
-                    print(f"Błąd podczas usuwania projektu: {e}")
+        Returns:
+            str: Nazwa projektu lub None, jeśli nic nie jest zaznaczone.
+        """
+        selected_rows = self.project_table.selectionModel().selectedRows()
+        if not selected_rows:
+            return None
+        return self.project_model.project_name(selected_rows[0].row())
 
     def refresh(self):
         """
@@ -180,42 +217,14 @@ class OknoStartowe(QMainWindow):
 
     def _load_project_files(self):
         """
-        Ładuje listę projektów z bazy danych i uzupełnia tabelę.
+        Ładuje listę projektów z bazy danych do tabeli.
 
-        Pobiera dane projektów, takie jak nazwa i data, i wyświetla je w odpowiednich komórkach.
+        Model pobiera tylko pierwszą stronę projektów; kolejne strony są dociągane
+        podczas przewijania tabeli. Jeśli pole wyszukiwania nie jest puste, tabela
+        pokazuje wyniki wyszukiwania.
         """
-        self.project_table.clearContents()
-
-        projects = self.db_manager.list_projects()
-        image_path = get_resource_path("jpg/icon.png")
-
-        if projects:
-            self.project_table.setRowCount(len(projects))
-
-            for row, project in enumerate(projects):
-                project_name = project[1]
-                project_date = project[2]
-                project_type = project[3]
-
-                image_path = get_resource_path(f"jpg/{project_type}.png")
-
-                image_label = QLabel()
-                pixmap = QPixmap(image_path)
-                scaled_pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                image_label.setPixmap(scaled_pixmap)
-                image_label.setAlignment(Qt.AlignCenter)
-                self.project_table.setCellWidget(row, 0, image_label)
-                self.project_table.setRowHeight(row, 80)
-
-                name_item = QTableWidgetItem(project_name)
-                name_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-                name_item.setTextAlignment(Qt.AlignCenter)
-                self.project_table.setItem(row, 1, name_item)
-
-                date_item = QTableWidgetItem(project_date)
-                date_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-                date_item.setTextAlignment(Qt.AlignCenter)
-                self.project_table.setItem(row, 2, date_item)
+        self.search_timer.stop()
+        self.project_model.search(self.search_input.text())
 
     @staticmethod
     def clear_selected_options():
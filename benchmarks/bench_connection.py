@@ -0,0 +1,263 @@
+"""
+Porównanie liczby wywołań na sekundę metod DatabaseManager przed i po wprowadzeniu
+długo żyjących połączeń (jedno połączenie na wątek, WAL, cache przygotowanych zapytań).
+
+Uruchomienie z katalogu głównego repozytorium:
+
+    python -m benchmarks.bench_connection --projects 100000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from application.DatabaseManager import DatabaseManager
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "db-model.sql")
+
+
+class PerCallConnectionManager:
+    """
+    Kopia wcześniejszej implementacji mierzonych metod DatabaseManager: każde wywołanie otwiera
+    nowe połączenie z domyślnymi ustawieniami, wykonuje zapytanie i zamyka połączenie.
+    Klasa nie dziedziczy po DatabaseManager, więc zmiany w aktualnej implementacji
+    (np. cennik w pamięci w get_price) nie wpływają na wynik "przed".
+    """
+    DB_PATH = None
+
+    def connect(self):
+        """Nawiązuje połączenie z bazą danych."""
+        return sqlite3.connect(self.DB_PATH)
+
+    def get_project_by_name(self, project_name):
+        """
+        Pobiera szczegóły projektu oraz powiązaną bramę na podstawie nazwy projektu.
+
+        :param project_name: Nazwa projektu.
+        :return: Słownik zawierający dane projektu oraz powiązanej bramy.
+        """
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        # Pobierz szczegóły projektu na podstawie nazwy
+        cursor.execute("SELECT * FROM Projekt WHERE nazwa = ?", (project_name,))
+        project = cursor.fetchone()
+
+        if not project:
+            conn.close()
+            raise ValueError(f"Projekt o nazwie '{project_name}' nie istnieje.")
+
+        # Słownik na dane wyjściowe
+        project_data = {
+            "projekt": {
+                "id": project[0],
+                "nazwa": project[1],
+                "data_zapisu": project[2],
+                "typ_bramy": project[3]
+            },
+            "brama": None
+        }
+
+        # Pobierz dane o bramie na podstawie typu bramy
+        typ_bramy = project[3]
+
+        if typ_bramy == "segmentowa":
+            cursor.execute("SELECT * FROM BramaSegmentowa WHERE projekt_id = ?", (project[0],))
+            brama = cursor.fetchone()
+            if brama:
+                project_data["brama"] = {
+                    "rodzaj_przetloczenia": brama[2],
+                    "struktura_powierzchni": brama[3],
+                    "kolor_standardowy": brama[4],
+                    "kolor_ral": brama[5],
+                    "sposob_otwierania_drzwi": brama[6],
+                    "opcje_dodatkowe": brama[7],
+                    "kratka_wentylacyjna": brama[8],
+                    "przeszklenia": brama[9],
+                    "klamka_do_bramy": brama[10],
+                    "szerokosc": brama[11],
+                    "wysokosc": brama[12]
+                }
+
+        elif typ_bramy == "roletowa":
+            cursor.execute("SELECT * FROM BramaRoletowa WHERE projekt_id = ?", (project[0],))
+            brama = cursor.fetchone()
+            if brama:
+                project_data["brama"] = {
+                    "wysokosc_profili": brama[2],
+                    "kolor_standardowy": brama[3],
+                    "kolor_ral": brama[4],
+                    "sposob_otwierania_bramy": brama[5],
+                    "przeszklenia": brama[6],
+                    "szerokosc": brama[7],
+                    "wysokosc": brama[8]
+                }
+
+        elif typ_bramy == "rozwierana":
+            cursor.execute("SELECT * FROM BramaRozwierana WHERE projekt_id = ?", (project[0],))
+            brama = cursor.fetchone()
+            if brama:
+                project_data["brama"] = {
+                    "ilosc_skrzydel": brama[2],
+                    "ocieplenie": brama[3],
+                    "uklad_wypelnienia": brama[4],
+                    "kolor_standardowy": brama[5],
+                    "kolor_ral": brama[6],
+                    "przeszklenia": brama[7],
+                    "opcje_dodatkowe": brama[8],
+                    "kratka_wentylacyjna": brama[9],
+                    "klamka_do_bramy": brama[10],
+                    "szerokosc": brama[11],
+                    "wysokosc": brama[12]
+                }
+
+        elif typ_bramy == "uchylna":
+            cursor.execute("SELECT * FROM BramaUchylna WHERE projekt_id = ?", (project[0],))
+            brama = cursor.fetchone()
+            if brama:
+                project_data["brama"] = {
+                    "uklad_wypelnienia": brama[2],
+                    "kolor_standardowy": brama[3],
+                    "kolor_ral": brama[4],
+                    "sposob_otwierania_drzwi": brama[5],
+                    "przeszklenia": brama[6],
+                    "opcje_dodatkowe": brama[7],
+                    "kratka_wentylacyjna": brama[8],
+                    "klamka_do_bramy": brama[9],
+                    "szerokosc": brama[10],
+                    "wysokosc": brama[11]
+                }
+
+        conn.close()
+        return project_data
+
+    def check_project_existence(self, project_name):
+        """
+        Sprawdza, czy projekt o podanej nazwie istnieje w bazie danych.
+        Zwraca True, jeśli projekt istnieje, w przeciwnym razie False.
+        """
+        try:
+            conn = self.connect()  # Nawiązanie połączenia z bazą
+            cursor = conn.cursor()
+            query = "SELECT COUNT(*) FROM Projekt WHERE nazwa = ?"
+            cursor.execute(query, (project_name,))
+            result = cursor.fetchone()
+            conn.close()
+            return result[0] > 0  # Zwraca True, jeśli istnieje przynajmniej 1 rekord z tą nazwą projektu
+        except sqlite3.Error as e:
+            print(f"Błąd podczas sprawdzania istnienia projektu: {e}")
+            return False
+
+    def get_price(self, gate_type, parameter, option):
+        """
+        Pobiera cenę z tabeli CENNIK na podstawie typu bramy, parametru i opcji.
+
+        :param gate_type: Typ bramy (np. "Brama Segmentowa")
+        :param parameter: Nazwa parametru (np. "Rodzaj przetłoczenia")
+        :param option: Opcja dla danego parametru (np. "Bez przetłoczenia")
+        :return: Cena jako liczba całkowita lub 0, jeśli cena nie została znaleziona.
+        """
+        try:
+            conn = self.connect()
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT doplata FROM CENNIK 
+                WHERE typ_bramy = ? AND parametr = ? AND opcja = ?
+            """, (gate_type, parameter, option))
+            result = cursor.fetchone()
+            conn.close()
+            return result[0] if result else 0
+        except sqlite3.Error as e:
+            print(f"Błąd podczas pobierania ceny: {e}")
+            return 0
+
+
+def seed_database(db_path, project_count):
+    """
+    Tworzy bazę danych o podanej liczbie projektów (bramy segmentowe).
+
+    Args:
+        db_path (str): Ścieżka do tworzonej bazy danych.
+        project_count (int): Liczba projektów do wygenerowania.
+    """
+    conn = sqlite3.connect(db_path)
+    with open(SCHEMA_PATH, "r", encoding="utf-8") as file:
+        conn.executescript(file.read())
+
+    conn.executemany(
+        "INSERT INTO Projekt (id, nazwa, data_zapisu, typ_bramy) VALUES (?, ?, CURRENT_TIMESTAMP, 'segmentowa')",
+        ((i, f"projekt-{i}") for i in range(1, project_count + 1))
+    )
+    conn.executemany(
+        """
+        INSERT INTO BramaSegmentowa (projekt_id, rodzaj_przetloczenia, struktura_powierzchni, kolor_standardowy,
+                                     opcje_dodatkowe, przeszklenia, klamka_do_bramy, szerokosc, wysokosc)
+        VALUES (?, 'Średnie', 'Woodgrain', 'Biały', 'Rygiel', 'Wzór 1', 'Klamka 1', 2500, 2125)
+        """,
+        ((i,) for i in range(1, project_count + 1))
+    )
+    conn.commit()
+    conn.close()
+
+
+def measure(func, iterations):
+    """
+    Mierzy liczbę wywołań funkcji na sekundę.
+
+    Args:
+        func (callable): Funkcja bez argumentów.
+        iterations (int): Liczba wywołań.
+
+    Returns:
+        float: Liczba wywołań na sekundę.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed > 0 else float("inf")
+
+
+def run(project_count, iterations):
+    """
+    Uruchamia pomiary dla obu wariantów połączeń i wypisuje tabelę wyników.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        print(f"Tworzenie bazy z {project_count} projektami...")
+        seed_database(db_path, project_count)
+
+        managers = {"przed": PerCallConnectionManager(), "po": DatabaseManager()}
+        for manager in managers.values():
+            manager.DB_PATH = db_path
+
+        rng = random.Random(0)
+        names = [f"projekt-{rng.randint(1, project_count)}" for _ in range(iterations)]
+
+        cases = {
+            "get_price": lambda m: (lambda: m.get_price("Brama Segmentowa", "Przeszklenia", "Wzór 2")),
+            "check_project_existence": lambda m: (lambda: m.check_project_existence(rng.choice(names))),
+            "get_project_by_name": lambda m: (lambda: m.get_project_by_name(rng.choice(names))),
+        }
+
+        print(f"{'operacja':<28}{'przed [wyw/s]':>16}{'po [wyw/s]':>16}{'przyspieszenie':>16}")
+        for label, factory in cases.items():
+            results = {key: measure(factory(manager), iterations) for key, manager in managers.items()}
+            speedup = results["po"] / results["przed"] if results["przed"] else float("inf")
+            print(f"{label:<28}{results['przed']:>16.0f}{results['po']:>16.0f}{speedup:>15.1f}x")
+
+        managers["po"].close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark warstwy połączeń DatabaseManager.")
+    parser.add_argument("--projects", type=int, default=100_000, help="Liczba projektów w bazie testowej.")
+    parser.add_argument("--iterations", type=int, default=5_000, help="Liczba wywołań każdej operacji.")
+    args = parser.parse_args()
+    run(args.projects, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
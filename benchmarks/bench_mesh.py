@@ -0,0 +1,181 @@
+"""
+Porównanie generatora bram bez Blendera (application.generator.mesh_generator) ze skryptami Blendera:
+czas generowania i zgodność geometrii plików model.obj i szyny.obj dla losowych konfiguracji.
+
+Uruchomienie z katalogu głównego repozytorium:
+
+    python -m benchmarks.bench_mesh --configs 50
+    python -m benchmarks.bench_mesh --configs 50 --blender /usr/bin/blender
+
+Bez --blender mierzony jest tylko czas generatora NumPy. Z --blender każda konfiguracja jest
+generowana również w Blenderze, a pliki .obj są porównywane: wymiary obrysu oraz odległość
+Hausdorffa między zbiorami wierzchołków nie mogą przekraczać --tolerance. Kod wyjścia 1 oznacza
+niezgodność geometrii.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from application.generator import mesh_generator
+from application.generator.blender_worker import BlenderWorker, BlenderWorkerError
+from application.generator.generator_gateV2 import BlenderScriptRunner
+from application.generator.model_cache import texture_path
+from application.generator.template_library import TemplateLibrary
+from benchmarks.bench_suite import load_options, percentile, random_config
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES_PATH = ROOT_DIR + os.sep
+CHUNK = 2048  # Liczba wierzchołków porównywanych naraz przy liczeniu odległości Hausdorffa
+
+
+def read_obj_vertices(path):
+    """
+    Odczytuje wierzchołki i liczbę wielokątów z pliku .obj.
+
+    Returns:
+        tuple: (wierzchołki (N, 3), liczba wielokątów).
+    """
+    vertices, faces = [], 0
+    with open(path, "r") as file:
+        for line in file:
+            if line.startswith("v "):
+                vertices.append([float(value) for value in line.split()[1:4]])
+            elif line.startswith("f "):
+                faces += 1
+    return np.array(vertices).reshape(-1, 3), faces
+
+
+def hausdorff(a, b):
+    """Zwraca odległość Hausdorffa między zbiorami punktów a i b."""
+    def directed(source, target):
+        worst = 0.0
+        for start in range(0, len(source), CHUNK):
+            chunk = source[start:start + CHUNK]
+            distances = np.sqrt(((chunk[:, None, :] - target[None, :, :]) ** 2).sum(axis=2))
+            worst = max(worst, distances.min(axis=1).max())
+        return worst
+
+    if not len(a) or not len(b):
+        return 0.0 if len(a) == len(b) else float("inf")
+    return max(directed(a, b), directed(b, a))
+
+
+def compare_obj(path_a, path_b):
+    """
+    Porównuje geometrię dwóch plików .obj.
+
+    Returns:
+        dict: Różnica wymiarów obrysu, odległość Hausdorffa i liczby wielokątów.
+    """
+    vertices_a, faces_a = read_obj_vertices(path_a)
+    vertices_b, faces_b = read_obj_vertices(path_b)
+    size_a = np.ptp(vertices_a, axis=0) if len(vertices_a) else np.zeros(3)
+    size_b = np.ptp(vertices_b, axis=0) if len(vertices_b) else np.zeros(3)
+    return {
+        "bounds": float(np.abs(size_a - size_b).max()),
+        "hausdorff": float(hausdorff(vertices_a, vertices_b)),
+        "faces": (faces_a, faces_b),
+    }
+
+
+def run(config_count, blender_path, tolerance, seed):
+    """
+    Generuje losowe konfiguracje obsługiwane przez mesh_generator i zwraca wyniki porównania.
+
+    Returns:
+        dict: Czasy generowania (ms) i lista niezgodności.
+    """
+    rng = random.Random(seed)
+    options = {gate_type: values for gate_type, values in load_options().items()
+               if gate_type in mesh_generator.GATE_BUILDERS}
+    worker = BlenderWorker.instance(blender_path, "bench") if blender_path else None
+    timings = {"numpy": [], "blender": []}
+    failures = []
+    templates = {}
+
+    workspace = tempfile.mkdtemp(prefix="bench-mesh-")
+    try:
+        generated = 0
+        while generated < config_count:
+            config = random_config(rng, options, f"bench-{generated}")
+            gate_type = config["Typ bramy"]
+            if not mesh_generator.supports(gate_type, config):
+                continue
+            runner = BlenderScriptRunner(gate_type)
+            if runner.templates_dir not in templates:
+                if not os.path.exists(runner.templates_dir):
+                    print(f"Brak szablonów siatek: {runner.templates_dir}")
+                    return None
+                templates[runner.templates_dir] = TemplateLibrary.load(runner.templates_dir)
+
+            numpy_dir = os.path.join(workspace, f"{generated}-numpy") + os.sep
+            os.makedirs(numpy_dir)
+            start = time.perf_counter()
+            mesh_generator.generate(gate_type, config, templates[runner.templates_dir], numpy_dir,
+                                    numpy_dir + "gate_data.json", texture_path(config, RESOURCES_PATH))
+            timings["numpy"].append((time.perf_counter() - start) * 1000)
+
+            if worker is not None:
+                blender_dir = os.path.join(workspace, f"{generated}-blender") + os.sep
+                os.makedirs(blender_dir)
+                options_path = blender_dir + "selected_options.json"
+                with open(options_path, "w", encoding="utf-8") as file:
+                    json.dump(config, file, ensure_ascii=False)
+                start = time.perf_counter()
+                try:
+                    worker.run_job(runner.blend_file, runner.script_file, [RESOURCES_PATH, options_path, blender_dir],
+                                   [blender_dir + "model.obj", blender_dir + "szyny.obj"])
+                except BlenderWorkerError as e:
+                    failures.append({"config": config, "error": str(e)})
+                    generated += 1
+                    continue
+                timings["blender"].append((time.perf_counter() - start) * 1000)
+
+                for name in ("model.obj", "szyny.obj"):
+                    result = compare_obj(numpy_dir + name, blender_dir + name)
+                    if result["bounds"] > tolerance or result["hausdorff"] > tolerance:
+                        failures.append({"config": config, "file": name, **result})
+            generated += 1
+    finally:
+        if worker is not None:
+            worker.stop()
+        shutil.rmtree(workspace, ignore_errors=True)
+    return {"timings": timings, "failures": failures}
+
+
+def print_results(report):
+    """Wypisuje percentyle czasów generowania oraz niezgodności geometrii."""
+    print(f"{'generator':<10} {'n':>5} {'p50 [ms]':>10} {'p99 [ms]':>10}")
+    for name, values in report["timings"].items():
+        if values:
+            values = sorted(values)
+            print(f"{name:<10} {len(values):>5} {percentile(values, 0.5):>10.2f} {percentile(values, 0.99):>10.2f}")
+    for failure in report["failures"]:
+        print(f"Niezgodność: {json.dumps(failure, ensure_ascii=False)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Porównanie generatora NumPy ze skryptami Blendera.")
+    parser.add_argument("--configs", type=int, default=50, help="Liczba losowych konfiguracji.")
+    parser.add_argument("--blender", help="Ścieżka do Blendera; bez niej mierzony jest tylko generator NumPy.")
+    parser.add_argument("--tolerance", type=float, default=1e-4, help="Dopuszczalna różnica geometrii w metrach.")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno generatora konfiguracji.")
+    args = parser.parse_args()
+
+    report = run(args.configs, args.blender, args.tolerance, args.seed)
+    if report is None:
+        sys.exit(1)
+    print_results(report)
+    if report["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Mikrobenchmarki wyceny i warstwy bazy danych: opóźnienia p50/p99 i przepustowość
+dla zimnej i ciepłej pamięci podręcznej. Wyniki są zapisywane do pliku JSON,
+aby można było porównywać przebiegi między commitami.
+
+Uruchomienie z katalogu głównego repozytorium:
+
+    python -m benchmarks.bench_suite --projects 10000
+    python -m benchmarks.bench_suite --compare benchmarks/results/<poprzedni>.json
+
+Warianty:
+    cold - przed każdym pomiarem pamięć podręczna jest czyszczona (wyceny, cennik w pamięci,
+           połączenie SQLite wraz z cache stron i przygotowanych zapytań); czas czyszczenia
+           nie wlicza się do wyniku.
+    warm - kolejne wywołania korzystają z pamięci podręcznej z poprzednich wywołań.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+
+from application.DatabaseManager import DatabaseManager
+from application.PriceCatalog import PriceCatalog
+from application.pricing import clear_cache, quote
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA_PATH = os.path.join(ROOT_DIR, "models", "db-model.sql")
+OPTIONS_PATH = os.path.join(ROOT_DIR, "resources", "options_data.txt")
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+
+def load_options(path=OPTIONS_PATH):
+    """
+    Wczytuje dostępne opcje bram z pliku options_data.txt.
+
+    Returns:
+        dict: {typ bramy: {kategoria: [opcje]}}.
+    """
+    options = {}
+    gate_type = None
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith("[") and line.endswith("]"):
+                gate_type = line[1:-1]
+                options[gate_type] = {}
+            elif gate_type and ":" in line:
+                category, values = line.split(":", 1)
+                options[gate_type][category.strip()] = [value.strip() for value in values.split(",")]
+    return options
+
+
+def random_config(rng, options, name):
+    """
+    Tworzy losową konfigurację bramy w formacie selected_options.json.
+
+    Args:
+        rng (random.Random): Generator liczb losowych.
+        options (dict): Dostępne opcje z load_options().
+        name (str): Nazwa projektu.
+
+    Returns:
+        dict: Konfiguracja bramy.
+    """
+    gate_type = rng.choice(list(options))
+    config = {
+        "Nazwa projektu": name,
+        "Typ bramy": gate_type,
+        "Wymiary": {"Szerokość": rng.randint(2000, 5000), "Wysokość": rng.randint(1800, 3000)},
+    }
+    for category, values in options[gate_type].items():
+        if category == "Opcje dodatkowe":
+            config[category] = rng.sample(values, rng.randint(0, len(values)))
+        else:
+            config[category] = rng.choice(values)
+    if "Kolor standardowy" in config and "Kolor RAL" in config:
+        config.pop(rng.choice(("Kolor standardowy", "Kolor RAL")))
+    return config
+
+
+def seed_database(db_path, project_count, rng, options):
+    """
+    Tworzy bazę danych ze schematu (z pełnym cennikiem) i zapisuje losowe projekty.
+
+    Args:
+        db_path (str): Ścieżka do tworzonej bazy danych.
+        project_count (int): Liczba projektów do wygenerowania.
+        rng (random.Random): Generator liczb losowych.
+        options (dict): Dostępne opcje z load_options().
+
+    Returns:
+        DatabaseManager: Menedżer bazy danych wskazujący na utworzoną bazę.
+    """
+    db_manager = DatabaseManager()
+    db_manager.DB_PATH = db_path
+    with contextlib.redirect_stdout(io.StringIO()):
+        db_manager.initialize_database(SCHEMA_PATH)
+        db_manager.add_projects_from_json(
+            random_config(rng, options, f"projekt-{i}") for i in range(1, project_count + 1)
+        )
+    return db_manager
+
+
+def percentile(sorted_values, fraction):
+    """Zwraca percentyl (metoda najbliższej rangi) z posortowanej listy."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(func, iterations, before=None):
+    """
+    Mierzy czas pojedynczych wywołań funkcji.
+
+    Args:
+        func (callable): Funkcja bez argumentów.
+        iterations (int): Liczba wywołań.
+        before (callable, optional): Wywoływana przed każdym pomiarem, poza mierzonym czasem.
+
+    Returns:
+        dict: Opóźnienia p50/p99/średnie (ms) i przepustowość (wywołania/s).
+    """
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(iterations):
+            if before is not None:
+                before()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(timings, 0.50) * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "mean_ms": total / iterations * 1000,
+        "ops_per_s": iterations / total if total > 0 else float("inf"),
+    }
+
+
+def git_commit():
+    """Zwraca skrót bieżącego commita lub None, jeśli nie jest dostępny."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_cases(db_manager, rng, options, project_count, iterations):
+    """
+    Przygotowuje przypadki testowe: (nazwa, funkcja, czyszczenie przed zimnym pomiarem, liczba wywołań).
+
+    Wycena jest mierzona funkcją quote(), która zastąpiła calculate_price kalkulatora i faktury.
+    Zapis (add_project_from_json) jest mierzony tylko w wariancie ciepłym i na osobnej puli nazw,
+    aby nie nadpisywać projektów odczytywanych w pozostałych przypadkach.
+    """
+    catalog = PriceCatalog.for_database(db_manager.DB_PATH)
+    configs = [random_config(rng, options, f"wycena-{i}") for i in range(256)]
+    names = [f"projekt-{rng.randint(1, project_count)}" for _ in range(256)]
+    writes = iter([random_config(rng, options, f"zapis-{i}") for i in range(iterations + 1)])
+
+    def reset_connection():
+        db_manager.close()
+
+    def reset_pricing():
+        clear_cache()
+        catalog.invalidate()
+
+    return [
+        ("quote", lambda: quote(rng.choice(configs), catalog), reset_pricing, 1),
+        ("get_price", lambda: db_manager.get_price("Brama Segmentowa", "Przeszklenia", "Wzór 2"), catalog.invalidate, 1),
+        ("list_projects", db_manager.list_projects, reset_connection, 0.01),
+        ("get_project_by_name", lambda: db_manager.get_project_by_name(rng.choice(names)), reset_connection, 1),
+        ("add_project_from_json", lambda: db_manager.add_project_from_json(next(writes)), None, 0.2),
+    ]
+
+
+def run(project_count, iterations, seed):
+    """
+    Tworzy bazę testową, wykonuje wszystkie pomiary i zwraca wyniki.
+
+    Returns:
+        dict: Metadane przebiegu oraz wyniki {przypadek: {wariant: pomiar}}.
+    """
+    rng = random.Random(seed)
+    options = load_options()
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        print(f"Tworzenie bazy z {project_count} projektami...")
+        start = time.perf_counter()
+        db_manager = seed_database(db_path, project_count, rng, options)
+        seed_seconds = time.perf_counter() - start
+
+        for name, func, reset, scale in build_cases(db_manager, rng, options, project_count, iterations):
+            count = max(1, int(iterations * scale))
+            with contextlib.redirect_stdout(io.StringIO()):
+                func()  # Rozgrzanie: wczytanie cennika i przygotowanie połączenia
+            results[name] = {"warm": measure(func, count)}
+            if reset is not None:
+                results[name]["cold"] = measure(func, count, before=reset)
+
+        db_manager.close()
+        PriceCatalog.for_database(db_path).close()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "projects": project_count,
+        "iterations": iterations,
+        "seed": seed,
+        "seed_seconds": seed_seconds,
+        "results": results,
+    }
+
+
+def print_results(report, baseline=None):
+    """
+    Wypisuje tabelę wyników, a przy podanym przebiegu bazowym także zmianę p50 względem niego.
+    """
+    header = f"{'operacja':<24}{'wariant':<8}{'p50 [ms]':>12}{'p99 [ms]':>12}{'wyw/s':>12}"
+    if baseline:
+        header += f"{'p50 vs ' + str(baseline.get('commit')):>18}"
+    print(header)
+
+    for name, variants in report["results"].items():
+        for variant, result in variants.items():
+            line = f"{name:<24}{variant:<8}{result['p50_ms']:>12.4f}{result['p99_ms']:>12.4f}{result['ops_per_s']:>12.0f}"
+            previous = (baseline or {}).get("results", {}).get(name, {}).get(variant)
+            if previous and result["p50_ms"] > 0:
+                line += f"{previous['p50_ms'] / result['p50_ms']:>17.2f}x"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mikrobenchmarki wyceny i bazy danych.")
+    parser.add_argument("--projects", type=int, default=10_000, help="Liczba projektów w bazie testowej.")
+    parser.add_argument("--iterations", type=int, default=2_000, help="Liczba wywołań każdej operacji.")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno generatora danych testowych.")
+    parser.add_argument("--output", help="Plik wyników JSON (domyślnie benchmarks/results/<commit>-<czas>.json).")
+    parser.add_argument("--compare", help="Plik wyników poprzedniego przebiegu do porównania.")
+    args = parser.parse_args()
+
+    report = run(args.projects, args.iterations, args.seed)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+    print_results(report, baseline)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{report['commit'] or 'brak'}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Wyniki zapisano w {output}")
+
+
+if __name__ == "__main__":
+    main()
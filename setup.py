@@ -18,7 +18,7 @@ setup(
     ],
     entry_points={
         'console_scripts': [
-            'kreator-bram=application.main:main',  # Funkcja `main` w `application/main.py`
+            'kreator-bram=application.cli:main',  # Funkcja `main` w `application/cli.py` (bez podkomendy uruchamia GUI)
         ]
     },
 )
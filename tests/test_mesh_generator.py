@@ -0,0 +1,256 @@
+"""
+Testy generatora bram bez Blendera (application.generator.mesh_generator) na małej, syntetycznej
+bibliotece szablonów: prostopadłościenne segmenty o znanych wymiarach zapisane w formacie
+TemplateLibrary.
+
+Porównanie ze skryptami Blendera na prawdziwych szablonach uruchamia się, podając ścieżkę do Blendera:
+
+    KREATOR_BLENDER=/usr/bin/blender python -m pytest tests/test_mesh_generator.py
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pytest
+
+from application.generator import mesh_generator
+from application.generator.gate_bounds import ROZWIERANA_PANELS, predict_bounds
+from application.generator.mesh_generator import MeshObject
+from application.generator.template_library import ARRAYS, TemplateLibrary
+
+# Ściany prostopadłościanu o wierzchołkach numerowanych x * 4 + y * 2 + z, zorientowane na zewnątrz
+BOX_FACES = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+BOX_UVS = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]]
+PANEL = (2.0, 0.04, 0.4)
+RAIL = (2.2, 0.1, 2.1)
+ROLETOWA_PROFILE = (1.0, 0.02, 0.077)
+UCHYLNA_PANEL = (1.0, 0.04, 0.25)
+
+
+def box_vertices(size):
+    """Zwraca 8 wierzchołków prostopadłościanu o wymiarach size, o środku w początku układu."""
+    sx, sy, sz = size
+    return np.array([[x, y, z] for x in (-sx / 2, sx / 2) for y in (-sy / 2, sy / 2) for z in (-sz / 2, sz / 2)])
+
+
+def box(size, location=(0.0, 0.0, 0.0)):
+    """Zwraca prostopadłościan o wymiarach size jako MeshObject."""
+    loops = np.array(sum(BOX_FACES, []))
+    face_start = np.arange(0, len(loops) + 1, 4)
+    uvs = np.tile(BOX_UVS, (len(BOX_FACES), 1))
+    return MeshObject(box_vertices(size), loops, face_start, uvs, location)
+
+
+def write_library(path, objects):
+    """
+    Zapisuje bibliotekę szablonów w formacie TemplateLibrary.
+
+    Args:
+        path (str): Katalog biblioteki.
+        objects (dict): {nazwa obiektu: (wymiary prostopadłościanu, położenie obiektu)}.
+    """
+    os.makedirs(path)
+    arrays = {name: [] for name in ARRAYS}
+    entries = {}
+    vertex_count = face_count = loop_count = 0
+    for name, (size, location) in objects.items():
+        arrays["vertices"].append(box_vertices(size))
+        arrays["loops"].append(np.array(sum(BOX_FACES, [])))
+        arrays["face_start"].append(loop_count + np.arange(0, 4 * len(BOX_FACES), 4))
+        arrays["uvs"].append(np.tile(BOX_UVS, (len(BOX_FACES), 1)))
+        arrays["normals"].append(box((1.0, 1.0, 1.0)).polygon_normals())
+        entries[name] = {
+            "vertices": [vertex_count, vertex_count + 8],
+            "faces": [face_count, face_count + len(BOX_FACES)],
+            "uvs": True,
+            "location": list(location),
+            "rotation": np.eye(3).tolist(),
+            "scale": [1.0, 1.0, 1.0],
+            "parent": None,
+        }
+        vertex_count += 8
+        face_count += len(BOX_FACES)
+        loop_count += 4 * len(BOX_FACES)
+    arrays["face_start"].append([loop_count])
+
+    dtypes = {"vertices": np.float32, "loops": np.int32, "face_start": np.int32, "uvs": np.float32,
+              "normals": np.float32}
+    files = {}
+    for name in ARRAYS:
+        file_name = f"{name}.npy"
+        np.save(os.path.join(path, file_name), np.concatenate(arrays[name]).astype(dtypes[name]))
+        with open(os.path.join(path, file_name), "rb") as file:
+            files[file_name] = hashlib.sha1(file.read()).hexdigest()
+
+    manifest = {"format": TemplateLibrary.FORMAT_VERSION, "source": "test.blend", "source_sha1": None,
+                "blender": None, "files": files, "objects": entries}
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(manifest, file)
+
+
+@pytest.fixture
+def templates(tmp_path):
+    """Biblioteka z segmentami wszystkich typów bram obsługiwanych przez mesh_generator i szynami."""
+    objects = {name: (PANEL, (5.0, 0.0, 0.0)) for name in mesh_generator.SEGMENTOWA_PANELS.values()}
+    objects.update({name: (ROLETOWA_PROFILE, (0.0, 0.0, 0.0)) for name in mesh_generator.ROLETOWA_PROFILES.values()})
+    objects[mesh_generator.RAIL_TEMPLATE] = (RAIL, (0.0, 0.0, 0.0))
+    path = str(tmp_path / "library")
+    write_library(path, objects)
+    return TemplateLibrary.load(path)
+
+
+@pytest.fixture
+def uchylna_templates(tmp_path):
+    """Biblioteka z segmentami bramy uchylnej i szynami."""
+    objects = {name: (UCHYLNA_PANEL, (0.0, 0.0, 0.0)) for name in mesh_generator.UCHYLNA_PANELS.values()}
+    objects[mesh_generator.RAIL_TEMPLATE] = (RAIL, (0.0, 0.0, 0.0))
+    path = str(tmp_path / "uchylna")
+    write_library(path, objects)
+    return TemplateLibrary.load(path)
+
+
+def config(width, height, **options):
+    """Zwraca konfigurację bramy o podanych wymiarach w milimetrach."""
+    return {"Wymiary": {"Szerokość": width, "Wysokość": height}, **options}
+
+
+def world_triangles(mesh):
+    """Zwraca wierzchołki trójkątów siatki w układzie świata (T x 3 x 3)."""
+    a, b, c, _ = mesh._triangles()
+    vertices = mesh.world_vertices()
+    return np.stack([vertices[a], vertices[b], vertices[c]], axis=1)
+
+
+def volume(mesh):
+    """Zwraca objętość zamkniętej siatki w układzie świata."""
+    triangles = world_triangles(mesh)
+    return np.einsum("ij,ij->i", triangles[:, 0], np.cross(triangles[:, 1], triangles[:, 2])).sum() / 6
+
+
+def is_closed(mesh):
+    """Sprawdza, czy każda skierowana krawędź wielokąta ma krawędź przeciwną (siatka bez dziur)."""
+    edges = []
+    for i in range(mesh.face_count):
+        face = mesh.loops[mesh.face_start[i]:mesh.face_start[i + 1]]
+        edges.extend(zip(face, np.roll(face, -1)))
+    # Wierzchołki połączonych obiektów mogą się powtarzać, więc krawędzie porównujemy po współrzędnych
+    points = np.round(np.asarray(mesh.vertices, dtype=float), 6)
+    directed = {(tuple(points[a]), tuple(points[b])) for a, b in edges}
+    return all((end, start) in directed for start, end in directed)
+
+
+def test_bisect_caps_cut():
+    mesh = box((1.0, 1.0, 1.0))
+    mesh.bisect((0.0, 0.0, 0.1), (0.0, 0.0, 1.0))
+
+    assert mesh.face_count == 6
+    assert is_closed(mesh)
+    np.testing.assert_allclose(mesh.bounds_size, [1.0, 1.0, 0.6])
+    assert volume(mesh) == pytest.approx(0.6)
+
+
+def test_segmentowa_dimensions(templates):
+    gate, rail = mesh_generator.build("Brama Segmentowa", config(3000, 2130), templates)
+
+    np.testing.assert_allclose(gate.dimensions, [3.0, 0.04, 2.13], atol=1e-6)
+    np.testing.assert_allclose(gate.location, [0.0, 0.0, 1.065], atol=1e-6)
+    np.testing.assert_allclose(gate.scale, [1.0, 1.0, 1.0])
+    np.testing.assert_allclose(rail.dimensions, [
+        3.0 + RAIL[0] * mesh_generator.RAIL_SCALE_MARGIN,
+        RAIL[1],
+        2.13 + RAIL[2] * mesh_generator.RAIL_SCALE_MARGIN,
+    ], atol=1e-6)
+    assert rail.location[2] == pytest.approx(rail.dimensions[2] / 2)
+
+
+def test_segmentowa_topology(templates):
+    gate, _ = mesh_generator.build("Brama Segmentowa", config(3000, 2130), templates)
+
+    # 5 pełnych segmentów po 0,4 m i ostatni przycięty do 0,13 m z zamkniętym przekrojem
+    assert gate.face_count == 6 * 6
+    assert is_closed(gate)
+    assert volume(gate) == pytest.approx(3.0 * 0.04 * 2.13, rel=1e-5)
+
+
+def test_segmentowa_without_cut(templates):
+    gate, _ = mesh_generator.build("Brama Segmentowa", config(2500, 2000), templates)
+
+    assert gate.face_count == 5 * 6
+    np.testing.assert_allclose(gate.dimensions, [2.5, 0.04, 2.0], atol=1e-6)
+
+
+def test_segmentowa_kasetony(templates):
+    gate, _ = mesh_generator.build("Brama Segmentowa", config(3000, 2130, **{"Rodzaj przetłoczenia": "Kasetony"}),
+                                   templates)
+
+    # 7 x 5 kasetonów o wymiarach zaokrąglonych do milimetra
+    assert gate.face_count == 7 * 5 * 6
+    np.testing.assert_allclose(gate.dimensions, [7 * 0.429, 0.04, 5 * 0.426], atol=1e-6)
+    assert is_closed(gate)
+
+
+def test_uchylna_pionowe(uchylna_templates):
+    gate, _ = mesh_generator.build("Brama Uchylna", config(2500, 2125, **{"Układ wypełnienia": "Pionowe"}),
+                                   uchylna_templates)
+
+    # 2 segmenty o szerokości 1 m i ostatni przycięty do 0,5 m
+    assert gate.face_count == 3 * 6
+    np.testing.assert_allclose(gate.dimensions, [2.5, 0.04, 2.125], atol=1e-6)
+    np.testing.assert_allclose(gate.location, [0.0, 0.0, 1.0625], atol=1e-6)
+    assert is_closed(gate)
+    assert volume(gate) == pytest.approx(2.5 * 0.04 * 2.125, rel=1e-5)
+
+
+def test_roletowa_stacks_whole_profiles(templates):
+    gate, rail = mesh_generator.build("Brama Roletowa", config(3000, 2464, **{"Wysokość profili": "77 mm"}),
+                                      templates)
+
+    assert gate.face_count == 32 * 6
+    np.testing.assert_allclose(gate.dimensions, [3.0, 0.02, 2.464], atol=1e-6)
+    np.testing.assert_allclose(gate.location, [0.0, 0.0, 1.232], atol=1e-6)
+    assert rail.location[2] == pytest.approx(rail.dimensions[2] / 2)
+
+
+def test_generate_writes_files(templates, tmp_path):
+    output_dir = str(tmp_path) + os.sep
+    gate_data = mesh_generator.generate("Brama Segmentowa", config(3000, 2130), templates, output_dir,
+                                        output_dir + "gate_data.json", "tekstura.png")
+
+    for name in ("model.obj", "model.mtl", "szyny.obj", "gate_data.json"):
+        assert os.path.exists(output_dir + name)
+    with open(output_dir + "gate_data.json", "r") as file:
+        assert json.load(file) == gate_data
+    np.testing.assert_allclose(gate_data["dimensions"], [3.0, 0.04, 2.13], atol=1e-6)
+
+
+def test_predict_bounds_matches_generated_gate(templates, tmp_path):
+    gate_config = config(3000, 2130, **{"Typ bramy": "Brama Segmentowa", "Rodzaj przetłoczenia": "Kasetony"})
+    output_dir = str(tmp_path) + os.sep
+    gate_data = mesh_generator.generate("Brama Segmentowa", gate_config, templates, output_dir,
+                                        output_dir + "gate_data.json", "tekstura.png")
+
+    predicted = predict_bounds(gate_config, templates)
+    np.testing.assert_allclose(predicted["location"], gate_data["location"], atol=1e-9)
+    np.testing.assert_allclose(predicted["dimensions"], gate_data["dimensions"], atol=1e-9)
+
+
+def test_predict_bounds_rozwierana(tmp_path):
+    path = str(tmp_path / "rozwierana")
+    write_library(path, {name: (PANEL, (0.0, 0.0, 0.0)) for name in ROZWIERANA_PANELS.values()})
+    templates = TemplateLibrary.load(path)
+
+    predicted = predict_bounds(config(3000, 2130, **{"Typ bramy": "Brama Rozwierana"}), templates)
+    np.testing.assert_allclose(predicted["location"], [0.0, 0.0, 1.065])
+    np.testing.assert_allclose(predicted["dimensions"], [3.0, 0.04, 2.13], atol=1e-6)
+    assert predict_bounds(config(3000, 2130, **{"Typ bramy": "Brama Rozwierana"}), None) is None
+
+
+@pytest.mark.skipif(not os.environ.get("KREATOR_BLENDER"), reason="Brak ścieżki do Blendera (KREATOR_BLENDER)")
+def test_matches_blender():
+    from benchmarks import bench_mesh
+
+    report = bench_mesh.run(10, os.environ["KREATOR_BLENDER"], 1e-4, 0)
+    if report is None:
+        pytest.skip("Brak bibliotek szablonów - uruchom python -m application.generator.template_library")
+    assert report["failures"] == []